@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -23,9 +23,12 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+from django.shortcuts import get_object_or_404
+from django.utils.functional import cached_property
 from rest_framework.permissions import BasePermission
 
 from osis_role.contrib.views import APIPermissionRequiredMixin
+from parcours_doctoral.auth.permission_object import ParcoursDoctoralPermissionObject
 from parcours_doctoral.models import ParcoursDoctoral
 from parcours_doctoral.utils.cache import get_cached_parcours_doctoral_perm_obj
 
@@ -52,4 +55,15 @@ class DoctorateAPIPermissionRequiredMixin(APIPermissionRequiredMixin):
         return self.kwargs.get('uuid')
 
     def get_permission_object(self):
+        return self.permission_object
+
+    @cached_property
+    def permission_object(self) -> ParcoursDoctoralPermissionObject:
         return get_cached_parcours_doctoral_perm_obj(self.doctorate_uuid)
+
+    @cached_property
+    def doctorate(self) -> ParcoursDoctoral:
+        return get_object_or_404(
+            ParcoursDoctoral.objects.select_related('student', 'training'),
+            uuid=self.doctorate_uuid,
+        )
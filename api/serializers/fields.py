@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -23,11 +23,20 @@
 #  see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
-from rest_framework import serializers
+import uuid
+from functools import lru_cache
+from typing import Dict, Iterable, Tuple
 
+from django.urls import resolve, reverse
+from osis_role.errors import get_permission_error
+from rest_framework import exceptions, serializers
+
+from backoffice.settings.rest_framework.fields import ActionLinksField
 from base.models.entity_version import EntityVersion
 from base.models.enums.entity_type import EntityType
 
+ACTION_PERMISSIONS_REQUEST_ATTRIBUTE = '_parcours_doctoral_action_permission_errors'
+
 PARCOURS_DOCTORAL_ACTION_LINKS = {
     # Lists
     'list': {
@@ -288,3 +297,96 @@ class RelatedInstituteField(serializers.CharField, serializers.SlugRelatedField)
     def to_representation(self, value):
         if value:
             return str(serializers.SlugRelatedField.to_representation(self, value))
+
+
+@lru_cache(maxsize=None)
+def get_action_link_template(path_name: str, method: str, params: Tuple[str, ...]) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Return the url template of an action, whose parameters are replaced by format fields, and the permissions required
+    by its view. It is computed once per process.
+    """
+    placeholders = {param: str(uuid.uuid4()) for param in params}
+    url_template = reverse(path_name, kwargs=placeholders)
+
+    permissions = resolve(url_template).func.cls.permission_mapping[method]
+    if isinstance(permissions, str):
+        permissions = (permissions,)
+
+    for param, placeholder in placeholders.items():
+        url_template = url_template.replace(placeholder, '{%s}' % param)
+
+    return url_template, tuple(permissions)
+
+
+def check_action_permissions(request, permission_objects: Iterable, permissions: Iterable[str]) -> Dict[tuple, str]:
+    """
+    Check the permissions on the objects, each couple being only checked once during the request, and return the
+    error messages by couple (permission, object pk), empty if the permission is granted.
+    """
+    errors = getattr(request, ACTION_PERMISSIONS_REQUEST_ATTRIBUTE, None)
+    if errors is None:
+        errors = {}
+        setattr(request, ACTION_PERMISSIONS_REQUEST_ATTRIBUTE, errors)
+
+    for permission_object in permission_objects:
+        for permission in permissions:
+            key = (permission, permission_object.pk)
+            if key in errors:
+                continue
+            if request.user.has_perm(permission, permission_object):
+                errors[key] = ''
+            else:
+                # The error is read right after the check as only the last one is kept for each permission
+                error = get_permission_error(request.user, permission) or exceptions.PermissionDenied.default_detail
+                errors[key] = str(error)
+
+    return errors
+
+
+class ParcoursDoctoralActionLinksField(ActionLinksField):
+    """
+    Action links field whose urls are built from templates and whose permissions are checked at once for all the
+    serialized objects, so that the cost of a list depends on the number of distinct checks.
+    """
+
+    def to_representation(self, instance):
+        perm_obj = getattr(instance, '_perm_obj', None)
+        if perm_obj is None:
+            return super().to_representation(instance)
+
+        request = self.context['request']
+        templates = {
+            action_name: get_action_link_template(
+                action['path_name'],
+                action['method'],
+                tuple(action.get('params', [])),
+            )
+            for action_name, action in self.actions.items()
+        }
+        errors = check_action_permissions(
+            request=request,
+            permission_objects=self.get_permission_objects(instance),
+            permissions={permission for _, permissions in templates.values() for permission in permissions},
+        )
+
+        links = {}
+        for action_name, (url_template, permissions) in templates.items():
+            action = self.actions[action_name]
+            error = next(
+                (errors[permission, perm_obj.pk] for permission in permissions if errors[permission, perm_obj.pk]),
+                '',
+            )
+            if error:
+                links[action_name] = {'error': error}
+            else:
+                url = url_template.format(**{param: getattr(instance, param) for param in action.get('params', [])})
+                links[action_name] = {'method': action['method'], 'url': request.build_absolute_uri(url)}
+
+        return links
+
+    def get_permission_objects(self, instance):
+        # In a list, the field belongs to the child of the list serializer, which holds all the objects
+        list_serializer = getattr(self.parent, 'parent', None)
+        if isinstance(list_serializer, serializers.ListSerializer) and list_serializer.instance:
+            return [obj._perm_obj for obj in list_serializer.instance if getattr(obj, '_perm_obj', None) is not None]
+        return [instance._perm_obj]
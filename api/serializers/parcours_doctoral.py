@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -25,9 +25,11 @@
 # ##############################################################################
 from rest_framework import serializers
 
-from backoffice.settings.rest_framework.fields import ActionLinksField
 from base.utils.serializers import DTOSerializer
-from parcours_doctoral.api.serializers.fields import PARCOURS_DOCTORAL_ACTION_LINKS
+from parcours_doctoral.api.serializers.fields import (
+    PARCOURS_DOCTORAL_ACTION_LINKS,
+    ParcoursDoctoralActionLinksField,
+)
 from parcours_doctoral.ddd.dtos import ParcoursDoctoralDTO
 from parcours_doctoral.ddd.dtos.parcours_doctoral import (
     ParcoursDoctoralRechercheEtudiantDTO,
@@ -39,7 +41,7 @@ class ParcoursDoctoralIdentityDTOSerializer(serializers.Serializer):
 
 
 class ParcoursDoctoralDTOSerializer(DTOSerializer):
-    links = ActionLinksField(
+    links = ParcoursDoctoralActionLinksField(
         actions={
             key: PARCOURS_DOCTORAL_ACTION_LINKS[key]
             for key in [
@@ -108,7 +110,7 @@ class ParcoursDoctoralDTOSerializer(DTOSerializer):
 
 
 class ParcoursDoctoralRechercheDTOSerializer(DTOSerializer):
-    links = ActionLinksField(
+    links = ParcoursDoctoralActionLinksField(
         actions={
             **{
                 action: PARCOURS_DOCTORAL_ACTION_LINKS[action]
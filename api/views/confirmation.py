@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -119,7 +119,7 @@ class LastConfirmationAPIView(DoctorateAPIPermissionRequiredMixin, mixins.Retrie
         serializer.is_valid(raise_exception=True)
 
         last_confirmation_paper = self.get_last_confirmation_paper()
-        doctorate = self.get_permission_object()
+        doctorate = self.doctorate
 
         result = message_bus_instance.invoke(
             SoumettreEpreuveConfirmationCommand(
@@ -177,7 +177,7 @@ class LastConfirmationCanvasAPIView(DoctorateAPIPermissionRequiredMixin, mixins.
                 GetGroupeDeSupervisionQuery(uuid_parcours_doctoral=self.doctorate_uuid),
             ]
         )
-        doctorate = self.get_permission_object()
+        doctorate = self.doctorate
 
         doctoral_training_ects_nb = Activity.objects.get_doctoral_training_credits_number(
             parcours_doctoral_uuid=self.doctorate_uuid,
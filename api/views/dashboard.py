@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -23,11 +23,14 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from drf_spectacular.utils import extend_schema
 from rest_framework.generics import RetrieveAPIView
 from rest_framework.response import Response
 
 from parcours_doctoral.api import serializers
+from parcours_doctoral.utils.cache import get_dashboard_etag
 
 __all__ = [
     'DashboardApiView',
@@ -45,6 +48,7 @@ class DashboardApiView(RetrieveAPIView):
         responses=serializers.DashboardSerializer,
         operation_id='retrieve_dashboard',
     )
+    @method_decorator(condition(etag_func=get_dashboard_etag))
     def get(self, request, **kwargs):
         """Get the actions links for the application"""
         serializer = serializers.DashboardSerializer(
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -326,13 +326,13 @@ class JuryRequestSignaturesAPIView(DoctorateAPIPermissionRequiredMixin, APIView)
         """Ask for all promoters and members to sign the jury."""
         message_bus_instance.invoke(
             GenererPdfArchiveCommand(
-                auteur=self.get_permission_object().student.global_id,
+                auteur=self.doctorate.student.global_id,
                 uuid_parcours_doctoral=str(kwargs["uuid"]),
             )
         )
         result = message_bus_instance.invoke(
             DemanderSignaturesCommand(
-                matricule_auteur=self.get_permission_object().student.global_id,
+                matricule_auteur=self.doctorate.student.global_id,
                 uuid_parcours_doctoral=str(kwargs["uuid"]),
             )
         )
@@ -477,7 +477,7 @@ class JuryApproveByPdfPropositionAPIView(DoctorateAPIPermissionRequiredMixin, AP
         jury_id = message_bus_instance.invoke(
             ApprouverJuryParPdfCommand(
                 uuid_jury=str(kwargs["uuid"]),
-                matricule_auteur=self.get_permission_object().student.global_id,
+                matricule_auteur=self.doctorate.student.global_id,
                 **serializer.data,
             ),
         )
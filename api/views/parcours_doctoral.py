@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -25,9 +25,8 @@
 # ##############################################################################
 from typing import List
 
-from django.db.models import Prefetch, Q
+from django.db.models import Q
 from drf_spectacular.utils import extend_schema
-from osis_signature.models import Actor
 from rest_framework import mixins
 from rest_framework.generics import GenericAPIView, ListAPIView
 from rest_framework.response import Response
@@ -36,13 +35,13 @@ from infrastructure.messages_bus import message_bus_instance
 from osis_role.contrib.views import APIPermissionRequiredMixin
 from parcours_doctoral.api import serializers
 from parcours_doctoral.api.permissions import DoctorateAPIPermissionRequiredMixin
+from parcours_doctoral.auth.permission_object import ParcoursDoctoralPermissionObject
 from parcours_doctoral.ddd.commands import (
     ListerParcoursDoctorauxDoctorantQuery,
     ListerParcoursDoctorauxSupervisesQuery,
     RecupererParcoursDoctoralQuery,
 )
 from parcours_doctoral.ddd.dtos import ParcoursDoctoralRechercheEtudiantDTO
-from parcours_doctoral.models import ParcoursDoctoral
 
 __all__ = [
     "DoctorateAPIView",
@@ -77,14 +76,7 @@ class DoctorateAPIView(
         )
 
         # Add a _perm_obj to the instance to optimize permission check performance
-        doctorate_permission_obj = ParcoursDoctoral.objects.select_related(
-            'student',
-            'admission',
-            'training__management_entity__doctorate_config',
-            'thesis_distribution_authorization',
-        ).get(uuid=doctorate_dto.uuid)
-
-        doctorate_dto._perm_obj = doctorate_permission_obj
+        doctorate_dto._perm_obj = self.get_permission_object()
 
         serializer = serializers.ParcoursDoctoralDTOSerializer(
             instance=doctorate_dto,
@@ -103,25 +95,17 @@ class BaseListView(APIPermissionRequiredMixin, ListAPIView):
         """List the PhDs of the logged-in user."""
         raise NotImplementedError
 
-    def permission_object_qs(self, doctorate_list: List[ParcoursDoctoralRechercheEtudiantDTO]):
-        return ParcoursDoctoral.objects.select_related(
-            'student',
-            'admission',
-            'training__management_entity__doctorate_config',
-            'thesis_distribution_authorization',
-        ).filter(uuid__in=[doctorate.uuid for doctorate in doctorate_list])
+    def permission_objects(self, doctorate_list: List[ParcoursDoctoralRechercheEtudiantDTO]):
+        return ParcoursDoctoralPermissionObject.load(Q(uuid__in=[doctorate.uuid for doctorate in doctorate_list]))
 
     def list(self, request, **kwargs):
         doctorate_list = self.doctorate_list(request)
 
         # Add a _perm_obj to each instance to optimize permission check performance
-        permission_object_qs = {}
-        for doctorate in self.permission_object_qs(doctorate_list=doctorate_list):
-            doctorate_uuid = str(doctorate.uuid)
-            permission_object_qs[doctorate_uuid] = doctorate
+        permission_objects = self.permission_objects(doctorate_list=doctorate_list)
 
         for doctorate in doctorate_list:
-            doctorate._perm_obj = permission_object_qs[doctorate.uuid]
+            doctorate._perm_obj = permission_objects[doctorate.uuid]
 
         serializer = serializers.ParcoursDoctoralRechercheDTOSerializer(
             instance=doctorate_list,
@@ -157,15 +141,6 @@ class SupervisedDoctorateListView(BaseListView):
         'GET': 'parcours_doctoral.api_view_supervised_list',
     }
 
-    def permission_object_qs(self, doctorate_list):
-        qs = super().permission_object_qs(doctorate_list)
-        return qs.select_related('supervision_group').prefetch_related(
-            Prefetch(
-                'supervision_group__actors',
-                Actor.objects.select_related('parcoursdoctoralsupervisionactor').all(),
-            )
-        )
-
     def doctorate_list(self, request):
         """List the supervised PhDs of the logged-in user."""
         return message_bus_instance.invoke(
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -108,7 +108,7 @@ class PublicDefenseMinutesAPIView(DoctorateAPIPermissionRequiredMixin, RetrieveA
     serializer_class = PublicDefenseMinutesCanvasSerializer
 
     def get_object(self):
-        doctorate = self.get_permission_object()
+        doctorate = self.doctorate
 
         url = public_defense_minutes_canvas_url(
             doctorate_uuid=self.doctorate_uuid,
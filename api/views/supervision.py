@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -82,7 +82,7 @@ class SupervisionCanvasApiView(SupervisionAPIView):
     )
     def get(self, request, *args, **kwargs):
         """Get the supervision group of the PhD"""
-        doctorate_object = self.get_permission_object()
+        doctorate_object = self.doctorate
 
         doctorate_dto = message_bus_instance.invoke(
             RecupererParcoursDoctoralQuery(parcours_doctoral_uuid=self.doctorate_uuid),
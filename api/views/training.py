@@ -155,7 +155,7 @@ class DoctoralTrainingListView(DoctorateAPIPermissionRequiredMixin, GenericAPIVi
         operation_id='create_doctoral_training',
     )
     def post(self, request, *args, **kwargs):
-        doctorate = self.get_permission_object()
+        doctorate = self.doctorate
         data = {
             **request.data,
             'parcours_doctoral': doctorate.pk,
@@ -177,12 +177,12 @@ class TrainingConfigView(DoctorateAPIPermissionRequiredMixin, RetrieveModelMixin
     }
 
     def get_object(self):
-        management_entity_id = self.get_permission_object().training.management_entity_id
+        management_entity_id = self.get_permission_object().training_management_entity_id
         return CddConfiguration.objects.get_or_create(cdd_id=management_entity_id)[0]
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
-        context['doctorate'] = self.get_permission_object() if self.doctorate_uuid else None
+        context['doctorate'] = self.doctorate if self.doctorate_uuid else None
         return context
 
     @extend_schema(operation_id='retrieve_doctoral_training_config')
@@ -217,7 +217,7 @@ class TrainingView(DoctorateAPIPermissionRequiredMixin, GenericAPIView):
     )
     def get(self, request, *args, **kwargs):
         instance = self.get_object()
-        serializer = DoctoralTrainingActivitySerializer(instance, parcours_doctoral=self.get_permission_object())
+        serializer = DoctoralTrainingActivitySerializer(instance, parcours_doctoral=self.doctorate)
         return Response(serializer.data)
 
     @extend_schema(
@@ -231,9 +231,7 @@ class TrainingView(DoctorateAPIPermissionRequiredMixin, GenericAPIView):
             **request.data,
             'parcours_doctoral': self.get_permission_object().pk,
         }
-        serializer = DoctoralTrainingActivitySerializer(
-            instance, parcours_doctoral=self.get_permission_object(), data=data
-        )
+        serializer = DoctoralTrainingActivitySerializer(instance, parcours_doctoral=self.doctorate, data=data)
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data)
@@ -435,7 +433,7 @@ class TrainingRecapPdfApiView(DoctorateAPIPermissionRequiredMixin, RetrieveModel
     )
     def get(self, request, *args, **kwargs):
         """Get the recap PDF of the doctoral training"""
-        doctorate_object = self.get_permission_object()
+        doctorate_object = self.doctorate
 
         doctorate_dto = message_bus_instance.invoke(
             RecupererParcoursDoctoralQuery(parcours_doctoral_uuid=self.doctorate_uuid),
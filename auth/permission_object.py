@@ -0,0 +1,213 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from django.db.models import Q
+
+from base.models.academic_year import AcademicYear
+from parcours_doctoral.models.actor import ParcoursDoctoralSupervisionActor
+from parcours_doctoral.models.jury import JuryActor
+from parcours_doctoral.models.parcours_doctoral import ParcoursDoctoral
+
+__all__ = [
+    'JuryActorPermissionData',
+    'ParcoursDoctoralPermissionObject',
+    'SupervisionActorPermissionData',
+]
+
+
+class SupervisionActorPermissionData(NamedTuple):
+    person_id: int
+    type: str
+    is_reference_promoter: bool
+
+
+class JuryActorPermissionData(NamedTuple):
+    person_id: int
+    role: str
+
+
+class ParcoursDoctoralPermissionObject:
+    """
+    Lightweight snapshot of a doctorate, holding the data read by the permission predicates, so that it can be cached
+    and checked without any query. The other attributes are read from the doctorate itself, loaded on first access.
+    """
+
+    FIELDS = (
+        'pk',
+        'uuid',
+        'status',
+        'admission_type',
+        'defense_method',
+        'student_id',
+        'has_valid_enrollment',
+        'training_management_entity_id',
+        'training_education_group_id',
+        'is_complementary_training_enabled',
+        'thesis_distribution_authorization_status',
+        'supervision_group_id',
+        'supervision_actors',
+        'jury_group_id',
+        'jury_actors',
+    )
+
+    __slots__ = FIELDS + ('_parcours_doctoral', '_version')
+
+    pk: int
+    uuid: str
+    status: str
+    admission_type: str
+    defense_method: str
+    student_id: int
+    has_valid_enrollment: bool
+    training_management_entity_id: Optional[int]
+    training_education_group_id: int
+    is_complementary_training_enabled: bool
+    thesis_distribution_authorization_status: Optional[str]
+    supervision_group_id: Optional[int]
+    supervision_actors: Tuple[SupervisionActorPermissionData, ...]
+    jury_group_id: Optional[int]
+    jury_actors: Tuple[JuryActorPermissionData, ...]
+
+    def __init__(self, **kwargs):
+        for field in self.FIELDS:
+            setattr(self, field, kwargs[field])
+        self._parcours_doctoral = None
+        self._version = None
+
+    def __getstate__(self):
+        # The loaded doctorate is not kept with the snapshot
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __getattr__(self, name):
+        # Only called for the attributes that are not part of the snapshot
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if self._parcours_doctoral is None:
+            self._parcours_doctoral = ParcoursDoctoral.objects.select_related('student', 'training').get(pk=self.pk)
+        return getattr(self._parcours_doctoral, name)
+
+    def __eq__(self, other):
+        return isinstance(other, (ParcoursDoctoral, ParcoursDoctoralPermissionObject)) and self.pk == other.pk
+
+    def __hash__(self):
+        return hash(self.pk)
+
+    def __str__(self):
+        return str(self.uuid)
+
+    @property
+    def id(self):
+        return self.pk
+
+    @property
+    def has_valid_enrollment_for_current_year_or_following_year(self) -> bool:
+        # Same rule as ParcoursDoctoral.has_valid_enrollment_for_current_year_or_following_year, without loading it
+        return ParcoursDoctoral.retrieve_valid_enrolments_of_student(
+            student_id=self.student_id,
+            education_group_id=self.training_education_group_id,
+            academic_year=AcademicYear.objects.current().year,
+        ).exists()
+
+    @property
+    def version(self) -> int:
+        """Identify the state of the snapshot, whose values never change."""
+        if self._version is None:
+            self._version = hash(tuple(getattr(self, field) for field in self.FIELDS))
+        return self._version
+
+    @classmethod
+    def load(cls, doctorate_filter: Q) -> Dict[str, 'ParcoursDoctoralPermissionObject']:
+        """Return the permission objects of the doctorates matching the filter, by doctorate uuid."""
+        doctorates = list(
+            ParcoursDoctoral.objects.filter(doctorate_filter)
+            .order_by()
+            .values(
+                'pk',
+                'uuid',
+                'status',
+                'admission_type',
+                'defense_method',
+                'student_id',
+                'supervision_group_id',
+                'jury_group_id',
+                'training__management_entity_id',
+                'training__education_group_id',
+                'training__management_entity__doctorate_config__is_complementary_training_enabled',
+                'thesis_distribution_authorization__status',
+            )
+        )
+
+        process_ids = {
+            process_id
+            for doctorate in doctorates
+            for process_id in [doctorate['supervision_group_id'], doctorate['jury_group_id']]
+            if process_id
+        }
+        supervision_actors_by_process = {}
+        jury_actors_by_process = {}
+        if process_ids:
+            for process_id, person_id, actor_type, is_reference_promoter in (
+                ParcoursDoctoralSupervisionActor.objects.filter(process_id__in=process_ids)
+                .order_by('pk')
+                .values_list('process_id', 'person_id', 'type', 'is_reference_promoter')
+            ):
+                supervision_actors_by_process.setdefault(process_id, []).append(
+                    SupervisionActorPermissionData(person_id, actor_type, is_reference_promoter)
+                )
+            for process_id, person_id, role in (
+                JuryActor.objects.filter(process_id__in=process_ids)
+                .order_by('pk')
+                .values_list('process_id', 'person_id', 'role')
+            ):
+                jury_actors_by_process.setdefault(process_id, []).append(JuryActorPermissionData(person_id, role))
+
+        return {
+            str(doctorate['uuid']): cls(
+                pk=doctorate['pk'],
+                uuid=str(doctorate['uuid']),
+                status=doctorate['status'],
+                admission_type=doctorate['admission_type'],
+                defense_method=doctorate['defense_method'],
+                student_id=doctorate['student_id'],
+                # Same rule as ParcoursDoctoral.has_valid_enrollment
+                has_valid_enrollment=True,
+                training_management_entity_id=doctorate['training__management_entity_id'],
+                training_education_group_id=doctorate['training__education_group_id'],
+                is_complementary_training_enabled=bool(
+                    doctorate['training__management_entity__doctorate_config__is_complementary_training_enabled']
+                ),
+                thesis_distribution_authorization_status=doctorate['thesis_distribution_authorization__status'],
+                supervision_group_id=doctorate['supervision_group_id'],
+                supervision_actors=tuple(supervision_actors_by_process.get(doctorate['supervision_group_id'], [])),
+                jury_group_id=doctorate['jury_group_id'],
+                jury_actors=tuple(jury_actors_by_process.get(doctorate['jury_group_id'], [])),
+            )
+            for doctorate in doctorates
+        }
@@ -0,0 +1,108 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import functools
+from contextvars import ContextVar
+from typing import Any, Callable, Hashable, Optional
+
+from django.core.signals import request_finished, request_started
+from django.dispatch import receiver
+
+from parcours_doctoral.auth.permission_object import ParcoursDoctoralPermissionObject
+
+__all__ = [
+    'PredicateMemo',
+    'get_predicate_memo',
+    'memoized_predicate',
+    'start_predicate_memo',
+    'stop_predicate_memo',
+]
+
+_predicate_memo: ContextVar[Optional['PredicateMemo']] = ContextVar('parcours_doctoral_predicate_memo', default=None)
+
+
+class PredicateMemo:
+    """Results of the predicates computed during a request, with the number of hits and misses."""
+
+    __slots__ = ('results', 'hits', 'misses')
+
+    def __init__(self):
+        self.results = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]):
+        try:
+            result = self.results[key]
+        except KeyError:
+            self.misses += 1
+            result = self.results[key] = compute()
+        else:
+            self.hits += 1
+        return result
+
+
+@receiver(request_started, dispatch_uid='parcours_doctoral_start_predicate_memo')
+def start_predicate_memo(**kwargs):
+    """Start a new predicate memo, shared by the permission checks of the current request."""
+    _predicate_memo.set(PredicateMemo())
+
+
+@receiver(request_finished, dispatch_uid='parcours_doctoral_stop_predicate_memo')
+def stop_predicate_memo(**kwargs):
+    _predicate_memo.set(None)
+
+
+def get_predicate_memo() -> Optional[PredicateMemo]:
+    """Return the predicate memo of the current request, None outside of a request."""
+    return _predicate_memo.get()
+
+
+def memoized_predicate(func):
+    """
+    Memoize, during the current request, the result of a predicate function querying the roles of the user, by
+    predicate, role, user, doctorate and version of the doctorate. Only the permission objects are memoized, the models
+    being mutable. The predicates only comparing attributes of the doctorate are cheaper than the memo lookup, so they
+    must not be memoized.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, user, obj):
+        memo = get_predicate_memo()
+        if memo is None or not isinstance(obj, ParcoursDoctoralPermissionObject):
+            return func(self, user, obj)
+        role_qs = self.context.get('role_qs')
+        return memo.get_or_compute(
+            (
+                func.__qualname__,
+                role_qs.model._meta.label if role_qs is not None else None,
+                user.pk,
+                obj.pk,
+                obj.version,
+            ),
+            lambda: func(self, user, obj),
+        )
+
+    return wrapper
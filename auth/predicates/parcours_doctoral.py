@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -23,6 +23,8 @@
 #  see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+from typing import Optional
+
 from django.contrib.auth.models import User
 from django.utils.translation import gettext_lazy as _
 from rules import predicate
@@ -31,6 +33,8 @@ from admission.ddd.admission.doctorat.preparation.domain.model.enums import (
     ChoixTypeAdmission,
 )
 from osis_role.errors import predicate_failed_msg
+from parcours_doctoral.auth.permission_object import ParcoursDoctoralPermissionObject
+from parcours_doctoral.auth.predicates.memo import memoized_predicate
 from parcours_doctoral.ddd.autorisation_diffusion_these.domain.model.enums import (
     CHOIX_STATUTS_AUTORISATION_DIFFUSION_THESE_MODIFIABLE_PAR_ADRE,
     CHOIX_STATUTS_AUTORISATION_DIFFUSION_THESE_MODIFIABLE_PAR_DOCTORANT,
@@ -48,34 +52,31 @@ from parcours_doctoral.ddd.domain.model.enums import (
     ChoixStatutParcoursDoctoral,
 )
 from parcours_doctoral.ddd.jury.domain.model.enums import FormuleDefense, RoleJury
+from parcours_doctoral.infrastructure.utils import RoleAssignment, get_person_role_assignments
 from parcours_doctoral.models import ActorType
 from parcours_doctoral.models.parcours_doctoral import ParcoursDoctoral
 
 
-def _build_queryset_cache_key_from_role_qs(role_qs, suffix):
+def _get_role_assignment(user: User, role_qs) -> Optional[RoleAssignment]:
     """
-    Return a cache key based on the model class of the queryset. This is useful when we want to cache a queryset for a
-    user who has several roles.
-    :param role_qs: The role queryset
-    :param suffix: The suffix of the cache key
-    :return: The cache key
+    Return the assignment of the role of the queryset to the user, from the cached roles of the user.
+    :param user: The user
+    :param role_qs: The role queryset, filtered on the person of the user
+    :return: The role assignment, None if it is unknown
     """
-    return f'{role_qs.model.__module__}_{role_qs.model.__name__}_{suffix}'.replace('.', '_')
+    return get_person_role_assignments(user.person.uuid).get(role_qs.model._meta.label)
 
 
 @predicate(bind=True)
 @predicate_failed_msg(message=_("The doctorate hasn't got a valid enrolment"))
 def has_valid_enrollment(self, user: User, obj: ParcoursDoctoral):
-    cache_key = f'admission_{obj.pk}_has_valid_enrollment'
-    if not hasattr(user, cache_key):
-        setattr(user, cache_key, obj.has_valid_enrollment)
-    return getattr(user, cache_key)
+    return obj.has_valid_enrollment
 
 
 @predicate(bind=True)
 @predicate_failed_msg(message=_("You must be the request author to access this doctoral training"))
 def is_parcours_doctoral_student(self, user: User, obj: ParcoursDoctoral):
-    return obj.student == user.person and has_valid_enrollment(user, obj)
+    return obj.student_id == user.person.pk and has_valid_enrollment(user, obj)
 
 
 @predicate(bind=True)
@@ -178,8 +179,8 @@ def authorization_distribution_is_in_progress(self, user: User, obj: ParcoursDoc
 @predicate_failed_msg(message=_("The distribution authorization cannot currently be changed by the student."))
 def authorization_distribution_can_be_changed_by_student(self, user: User, obj: ParcoursDoctoral):
     return (
-        not hasattr(obj, 'thesis_distribution_authorization')
-        or obj.thesis_distribution_authorization.status
+        obj.thesis_distribution_authorization_status is None
+        or obj.thesis_distribution_authorization_status
         in CHOIX_STATUTS_AUTORISATION_DIFFUSION_THESE_MODIFIABLE_PAR_DOCTORANT
     )
 
@@ -190,8 +191,7 @@ def authorization_distribution_can_be_changed_by_student(self, user: User, obj:
 )
 def authorization_distribution_can_be_changed_by_lead_promoter(self, user: User, obj: ParcoursDoctoral):
     return (
-        hasattr(obj, 'thesis_distribution_authorization')
-        and obj.thesis_distribution_authorization.status
+        obj.thesis_distribution_authorization_status
         in CHOIX_STATUTS_AUTORISATION_DIFFUSION_THESE_MODIFIABLE_PAR_PROMOTEUR_REFERENCE
     )
 
@@ -200,9 +200,7 @@ def authorization_distribution_can_be_changed_by_lead_promoter(self, user: User,
 @predicate_failed_msg(message=_("The distribution authorization cannot currently be changed by the ADRE manager."))
 def authorization_distribution_can_be_changed_by_adre(self, user: User, obj: ParcoursDoctoral):
     return (
-        hasattr(obj, 'thesis_distribution_authorization')
-        and obj.thesis_distribution_authorization.status
-        in CHOIX_STATUTS_AUTORISATION_DIFFUSION_THESE_MODIFIABLE_PAR_ADRE
+        obj.thesis_distribution_authorization_status in CHOIX_STATUTS_AUTORISATION_DIFFUSION_THESE_MODIFIABLE_PAR_ADRE
     )
 
 
@@ -210,9 +208,7 @@ def authorization_distribution_can_be_changed_by_adre(self, user: User, obj: Par
 @predicate_failed_msg(message=_("The distribution authorization cannot currently be changed by the SCEB manager."))
 def authorization_distribution_can_be_changed_by_sceb(self, user: User, obj: ParcoursDoctoral):
     return (
-        hasattr(obj, 'thesis_distribution_authorization')
-        and obj.thesis_distribution_authorization.status
-        in CHOIX_STATUTS_AUTORISATION_DIFFUSION_THESE_MODIFIABLE_PAR_SCEB
+        obj.thesis_distribution_authorization_status in CHOIX_STATUTS_AUTORISATION_DIFFUSION_THESE_MODIFIABLE_PAR_SCEB
     )
 
 
@@ -279,89 +275,71 @@ def doctorate_is_proclaimed(self, user: User, obj: ParcoursDoctoral):
 @predicate(bind=True)
 @predicate_failed_msg(message=_("Complementary training not enabled"))
 def complementary_training_enabled(self, user: User, obj: ParcoursDoctoral):
-    return (
-        hasattr(obj.training.management_entity, 'doctorate_config')
-        and obj.training.management_entity.doctorate_config.is_complementary_training_enabled
-    )
+    return obj.is_complementary_training_enabled
 
 
 @predicate(bind=True)
 @predicate_failed_msg(message=_("You must be a member of the doctoral commission to access this doctoral training"))
+@memoized_predicate
 def is_part_of_doctoral_commission(self, user: User, obj: ParcoursDoctoral):
-    return (
-        isinstance(obj, ParcoursDoctoral)
-        and obj.training.management_entity_id in self.context['role_qs'].get_entities_ids()
-    )
+    if not isinstance(obj, (ParcoursDoctoral, ParcoursDoctoralPermissionObject)):
+        return False
+    role_assignment = _get_role_assignment(user, self.context['role_qs'])
+    if role_assignment is not None and role_assignment.entities_ids is not None:
+        entities_ids = role_assignment.entities_ids
+    else:
+        entities_ids = self.context['role_qs'].get_entities_ids()
+    return obj.training_management_entity_id in entities_ids
 
 
 @predicate(bind=True)
 @predicate_failed_msg(message=_("You must be the request supervisor to access this doctoral training"))
 def is_parcours_doctoral_promoter(self, user: User, obj: ParcoursDoctoral):
-    return (
-        has_valid_enrollment(user, obj)
-        and obj.supervision_group
-        and user.person.pk
-        in [
-            actor.person_id
-            for actor in obj.supervision_group.actors.all()
-            if actor.parcoursdoctoralsupervisionactor.type == ActorType.PROMOTER.name
-        ]
-    )
+    return has_valid_enrollment(user, obj) and user.person.pk in [
+        actor.person_id for actor in obj.supervision_actors if actor.type == ActorType.PROMOTER.name
+    ]
 
 
 @predicate(bind=True)
 @predicate_failed_msg(message=_("You must be the contact supervisor to access this doctoral training"))
 def is_parcours_doctoral_reference_promoter(self, user: User, obj: ParcoursDoctoral):
-    return (
-        has_valid_enrollment(user, obj)
-        and obj.supervision_group
-        and user.person.pk
-        in [
-            actor.person_id
-            for actor in obj.supervision_group.actors.all()
-            if actor.parcoursdoctoralsupervisionactor.type == ActorType.PROMOTER.name
-            and actor.parcoursdoctoralsupervisionactor.is_reference_promoter
-        ]
-    )
+    return has_valid_enrollment(user, obj) and user.person.pk in [
+        actor.person_id
+        for actor in obj.supervision_actors
+        if actor.type == ActorType.PROMOTER.name and actor.is_reference_promoter
+    ]
 
 
 @predicate(bind=True)
 @predicate_failed_msg(message=_("You must be a member of the committee to access this doctoral training"))
 def is_part_of_committee(self, user: User, obj: ParcoursDoctoral):
-    return (
-        obj.has_valid_enrollment
-        and obj.supervision_group
-        and user.person.pk in [actor.person_id for actor in obj.supervision_group.actors.all()]
-    )
+    return obj.has_valid_enrollment and user.person.pk in [actor.person_id for actor in obj.supervision_actors]
 
 
 @predicate(bind=True)
 @predicate_failed_msg(message=_("You must be a member of the jury to access this doctoral training"))
 def is_part_of_jury(self, user: User, obj: ParcoursDoctoral):
-    return obj.jury_group is not None and user.person.pk in [actor.person_id for actor in obj.jury_group.actors.all()]
+    return user.person.pk in [actor.person_id for actor in obj.jury_actors]
 
 
 @predicate(bind=True)
 @predicate_failed_msg(message=_("You must be the secretary or the president of the jury to perform this action."))
 def is_president_or_secretary_of_jury(self, user: User, obj: ParcoursDoctoral):
-    return (
-        obj.has_valid_enrollment
-        and obj.jury_group_id
-        and obj.jury_group.actors.filter(
-            juryactor__role__in=[RoleJury.SECRETAIRE.name, RoleJury.PRESIDENT.name],
-            person_id=user.person.pk,
-        ).exists()
+    return obj.has_valid_enrollment and any(
+        actor.person_id == user.person.pk and actor.role in {RoleJury.SECRETAIRE.name, RoleJury.PRESIDENT.name}
+        for actor in obj.jury_actors
     )
 
 
 @predicate(bind=True)
+@memoized_predicate
 def is_part_of_education_group(self, user: User, obj: ParcoursDoctoral):
-    cache_key = _build_queryset_cache_key_from_role_qs(self.context['role_qs'], 'education_groups_affected')
-
-    if not hasattr(user, cache_key):
-        setattr(user, cache_key, self.context['role_qs'].get_education_groups_affected())
-
-    return obj is not None and obj.training.education_group_id in getattr(user, cache_key)
+    role_assignment = _get_role_assignment(user, self.context['role_qs'])
+    if role_assignment is not None and role_assignment.education_groups_ids is not None:
+        education_groups_affected = role_assignment.education_groups_ids
+    else:
+        education_groups_affected = self.context['role_qs'].get_education_groups_affected()
+    return obj is not None and obj.training_education_group_id in education_groups_affected
 
 
 @predicate(bind=True)
@@ -0,0 +1,68 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from typing import FrozenSet, NamedTuple
+
+from parcours_doctoral.auth.constants import READ_ACTIONS_BY_TAB, UPDATE_ACTIONS_BY_TAB
+
+__all__ = [
+    'TabPermissions',
+    'get_tab_permissions',
+]
+
+TAB_PERMISSIONS_REQUEST_ATTRIBUTE = '_parcours_doctoral_tab_permissions'
+
+
+class TabPermissions(NamedTuple):
+    readable_tabs: FrozenSet[str]
+    updatable_tabs: FrozenSet[str]
+
+    def can_read(self, tab_name) -> bool:
+        return tab_name in self.readable_tabs
+
+    def can_update(self, tab_name) -> bool:
+        return tab_name in self.updatable_tabs
+
+
+def get_tab_permissions(request, permission_obj) -> TabPermissions:
+    """
+    Return the tabs that the user of the request can read and update for the specified doctorate. The permissions of
+    all the tabs are checked at once, each permission being checked only once, and kept during the request.
+    """
+    tab_permissions_by_object = getattr(request, TAB_PERMISSIONS_REQUEST_ATTRIBUTE, None)
+    if tab_permissions_by_object is None:
+        tab_permissions_by_object = {}
+        setattr(request, TAB_PERMISSIONS_REQUEST_ATTRIBUTE, tab_permissions_by_object)
+
+    if permission_obj.pk not in tab_permissions_by_object:
+        permissions = set(READ_ACTIONS_BY_TAB.values()) | set(UPDATE_ACTIONS_BY_TAB.values())
+        granted_permissions = {perm for perm in permissions if request.user.has_perm(perm, permission_obj)}
+
+        tab_permissions_by_object[permission_obj.pk] = TabPermissions(
+            readable_tabs=frozenset(tab for tab, perm in READ_ACTIONS_BY_TAB.items() if perm in granted_permissions),
+            updatable_tabs=frozenset(tab for tab, perm in UPDATE_ACTIONS_BY_TAB.items() if perm in granted_permissions),
+        )
+
+    return tab_permissions_by_object[permission_obj.pk]
@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -36,6 +36,11 @@ class RecupererParcoursDoctoralQuery(interface.QueryRequest):
     parcours_doctoral_uuid: str
 
 
+@attr.dataclass(frozen=True, slots=True)
+class RecupererParcoursDoctorauxQuery(interface.QueryRequest):
+    parcours_doctoraux_uuids: List[str]
+
+
 @attr.dataclass(frozen=True, slots=True)
 class RecupererParcoursDoctoralPropositionQuery(interface.QueryRequest):
     proposition_uuid: str
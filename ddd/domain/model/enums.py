@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -241,3 +241,10 @@ STATUTS_INACTIFS = {
 }
 
 STATUTS_ACTIFS = {choix.name for choix in ChoixStatutParcoursDoctoral if choix.name not in STATUTS_INACTIFS}
+
+
+class ChoixFileAttenteGestionnaire(ChoiceEnum):
+    JURYS_A_APPROUVER_ADRE = _('Juries awaiting the ADRE approval')
+    AUTORISATIONS_DIFFUSION_A_VALIDER_ADRE = _('Thesis distribution authorizations awaiting the ADRE validation')
+    AUTORISATIONS_DIFFUSION_A_VALIDER_SCEB = _('Thesis distribution authorizations awaiting the SCEB validation')
+    PROCES_VERBAUX_CONFIRMATION_A_TRAITER = _('Confirmation minutes to process')
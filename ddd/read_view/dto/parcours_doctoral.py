@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,7 +24,7 @@
 #
 # ##############################################################################
 import datetime
-from typing import Optional
+from typing import Iterator, Optional, Union
 
 import attr
 
@@ -59,4 +59,4 @@ class ParcoursDoctoralRechercheDTO(interface.DTO):
 
 @attr.dataclass(slots=True)
 class ListeParcoursDoctoralRechercheDTO(interface.DTO):
-    parcours_doctoraux: PaginatedList[ParcoursDoctoralRechercheDTO]
+    parcours_doctoraux: Union[PaginatedList[ParcoursDoctoralRechercheDTO], Iterator[ParcoursDoctoralRechercheDTO]]
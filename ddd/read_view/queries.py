@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -37,8 +37,13 @@ class ListerTousParcoursDoctorauxQuery(interface.QueryRequest):
     champ_tri: Optional[str] = None
     page: Optional[int] = None
     taille_page: Optional[int] = None
+    curseur: Optional[str] = None
+    limite_comptage: Optional[int] = None
+    avec_comptages_facettes: bool = False
+    en_flux: bool = False
 
     annee_academique: Optional[int] = None
+    recherche: Optional[str] = ''
     type_admission: Optional[str] = ''
     noma: Optional[str] = ''
     matricule_doctorant: Optional[str] = ''
@@ -62,3 +67,11 @@ class ListerTousParcoursDoctorauxQuery(interface.QueryRequest):
 class RecupererInformationsTableauBordQuery(interface.QueryRequest):
     commission_proximite: Optional[str] = ''
     cdds: Optional[List[str]] = None
+
+
+@attr.dataclass(frozen=True, slots=True)
+class ListerFileAttenteParcoursDoctorauxQuery(interface.QueryRequest):
+    file_attente: str
+    taille_page: int
+    curseur: Optional[str] = None
+    demandeur: Optional[str] = ''
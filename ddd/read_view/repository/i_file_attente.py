@@ -0,0 +1,55 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+
+from abc import abstractmethod
+from typing import Optional
+
+from admission.views import PaginatedList
+from osis_common.ddd import interface
+from parcours_doctoral.ddd.read_view.dto.file_attente import (
+    ElementFileAttenteDTO,
+)
+
+
+class IFileAttenteRepository(interface.ReadModelRepository):
+    @classmethod
+    @abstractmethod
+    def get(
+        cls,
+        file_attente: str,
+        taille_page: int,
+        curseur: Optional[str] = None,
+        demandeur: Optional[str] = '',
+    ) -> PaginatedList[ElementFileAttenteDTO]:
+        """
+        Retrieve the doctorates waiting in a work queue of the managers, from the oldest to the most recent one.
+        :param file_attente: the name of the work queue (from ChoixFileAttenteGestionnaire)
+        :param taille_page: the number of doctorates per page
+        :param curseur: an opaque cursor returned with a previous page (in the 'curseur_suivant' attribute of the
+        list) from which the next page is sought
+        :param demandeur: the uuid of the person whose visibility scope restricts the doctorates
+        """
+        raise NotImplementedError
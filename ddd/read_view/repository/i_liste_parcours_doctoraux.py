@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -62,5 +62,26 @@ class IListeParcoursDoctorauxRepository(interface.ReadModelRepository):
         page: Optional[int] = None,
         taille_page: Optional[int] = None,
         demandeur: Optional[str] = '',
+        curseur: Optional[str] = None,
+        limite_comptage: Optional[int] = None,
+        recherche: Optional[str] = '',
+        avec_comptages_facettes: bool = False,
+        en_flux: bool = False,
     ) -> ListeParcoursDoctoralRechercheDTO:
+        """
+        Retrieve the doctorates matching the filters.
+        :param page: the number of the page to return (offset pagination)
+        :param taille_page: the number of doctorates per page
+        :param curseur: an opaque cursor returned with a previous page (in the 'curseur_suivant' attribute of the
+        list) from which the next page is sought (keyset pagination), instead of skipping the previous rows
+        :param limite_comptage: if specified, the doctorates are only counted up to this value (or up to the end of the
+        requested page if it is further) plus one, the 'comptage_incomplet' attribute of the list telling whether the
+        count has been stopped. The following pages remain reachable.
+        :param recherche: free text that must be contained in the name, the noma, the thesis title or the project
+        title of the doctorate (each word being searched separately)
+        :param avec_comptages_facettes: if True, the number of doctorates by status, proximity commission, financing
+        type and admission type is also returned (in the 'comptages_facettes' attribute of the list)
+        :param en_flux: if True, the doctorates are returned through an iterator retrieving them by chunks, instead of
+        a list (the pagination and the facet counts are then ignored)
+        """
         raise NotImplementedError
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,11 +24,13 @@
 #
 # ##############################################################################
 
+from .lister_file_attente_service import lister_file_attente
 from .lister_parcours_doctoraux_service import lister_parcours_doctoraux
 from .recuperer_informations_tableau_bord_service import recuperer_informations_tableau_bord
 
 
 __all__ = [
+    'lister_file_attente',
     'lister_parcours_doctoraux',
     'recuperer_informations_tableau_bord',
 ]
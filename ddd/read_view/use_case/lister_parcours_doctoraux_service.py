@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,6 +24,7 @@
 #
 # ##############################################################################
 import datetime
+from typing import Iterator, Union
 
 from admission.views import PaginatedList
 from ddd.logic.shared_kernel.academic_year.domain.service.get_current_academic_year import (
@@ -45,7 +46,7 @@ def lister_parcours_doctoraux(
     cmd: 'ListerTousParcoursDoctorauxQuery',
     lister_tous_parcours_doctoraux_service: 'IListeParcoursDoctorauxRepository',
     academic_year_repository: 'IAcademicYearRepository',
-) -> 'PaginatedList[ParcoursDoctoralRechercheDTO]':
+) -> 'Union[PaginatedList[ParcoursDoctoralRechercheDTO], Iterator[ParcoursDoctoralRechercheDTO]]':
     annee_courante = (
         GetCurrentAcademicYear()
         .get_starting_academic_year(
@@ -79,4 +80,9 @@ def lister_parcours_doctoraux(
         page=cmd.page,
         taille_page=cmd.taille_page,
         demandeur=cmd.demandeur,
+        curseur=cmd.curseur,
+        limite_comptage=cmd.limite_comptage,
+        recherche=cmd.recherche,
+        avec_comptages_facettes=cmd.avec_comptages_facettes,
+        en_flux=cmd.en_flux,
     ).parcours_doctoraux
@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -76,6 +76,11 @@ class IParcoursDoctoralRepository(interface.AbstractRepository, metaclass=ABCMet
     ) -> 'ParcoursDoctoralDTO':
         raise NotImplementedError
 
+    @classmethod
+    @abc.abstractmethod
+    def get_dtos(cls, entity_ids: List['ParcoursDoctoralIdentity']) -> List['ParcoursDoctoralDTO']:
+        raise NotImplementedError
+
     @classmethod
     @abc.abstractmethod
     def get_cotutelle_dto(cls, entity_id: 'ParcoursDoctoralIdentity') -> 'CotutelleDTO':
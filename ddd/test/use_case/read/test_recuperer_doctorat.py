@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -26,7 +26,10 @@
 
 from django.test import TestCase
 
-from parcours_doctoral.ddd.commands import RecupererParcoursDoctoralQuery
+from parcours_doctoral.ddd.commands import (
+    RecupererParcoursDoctorauxQuery,
+    RecupererParcoursDoctoralQuery,
+)
 from parcours_doctoral.ddd.domain.model.enums import ChoixStatutParcoursDoctoral
 from parcours_doctoral.ddd.domain.validator.exceptions import (
     ParcoursDoctoralNonTrouveException,
@@ -66,3 +69,23 @@ class TestRecupererDoctorat(TestCase):
         self.assertEqual(parcours_doctoral_dto.matricule_doctorant, '3')
         self.assertEqual(parcours_doctoral_dto.nom_doctorant, 'Dupond')
         self.assertEqual(parcours_doctoral_dto.prenom_doctorant, 'Pierre')
+
+    def test_should_recuperer_parcours_doctoraux_connus(self):
+        parcours_doctoraux_dtos = self.message_bus.invoke(
+            RecupererParcoursDoctorauxQuery(
+                parcours_doctoraux_uuids=[
+                    'uuid-SC3DP-promoteur-membre',
+                    'inconnu',
+                    'uuid-SC3DP-promoteurs-membres-deja-approuves',
+                ],
+            )
+        )
+
+        self.assertEqual(
+            [parcours_doctoral_dto.uuid for parcours_doctoral_dto in parcours_doctoraux_dtos],
+            ['uuid-SC3DP-promoteur-membre', 'uuid-SC3DP-promoteurs-membres-deja-approuves'],
+        )
+
+    def test_should_recuperer_aucun_parcours_doctoral(self):
+        parcours_doctoraux_dtos = self.message_bus.invoke(RecupererParcoursDoctorauxQuery(parcours_doctoraux_uuids=[]))
+        self.assertEqual(parcours_doctoraux_dtos, [])
@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -35,6 +35,7 @@ from .recuperer_parcours_doctoral_proposition_service import (
     recuperer_parcours_doctoral_proposition,
 )
 from .recuperer_parcours_doctoral_service import recuperer_parcours_doctoral
+from .recuperer_parcours_doctoraux_service import recuperer_parcours_doctoraux
 
 __all__ = [
     'lister_documents',
@@ -43,4 +44,5 @@ __all__ = [
     'recuperer_document',
     'recuperer_parcours_doctoral',
     'recuperer_parcours_doctoral_proposition',
+    'recuperer_parcours_doctoraux',
 ]
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,6 +24,8 @@
 #
 # ##############################################################################
 
+from typing import Dict
+
 from dal import forward
 from django import forms
 from django.conf import settings
@@ -86,6 +88,16 @@ class ParcoursDoctorauxFilterForm(forms.Form):
         required=False,
     )
 
+    recherche = forms.CharField(
+        label=_('Free text search'),
+        required=False,
+        widget=forms.TextInput(
+            attrs={
+                'placeholder': _('Last name / First name / NOMA / Thesis or project title'),
+            },
+        ),
+    )
+
     matricule_doctorant = forms.CharField(
         label=_('Last name / First name / NOMA'),
         required=False,
@@ -410,6 +422,22 @@ class ParcoursDoctorauxFilterForm(forms.Form):
 
         return proximity_commission_choices
 
+    def add_facet_counts(self, facet_counts: Dict[str, Dict[str, int]]):
+        """Display the number of matching doctorates next to each choice of the facet fields."""
+        for field_name, counts in facet_counts.items():
+            self.fields[field_name].choices = self._get_choices_with_counts(self.fields[field_name].choices, counts)
+
+    @classmethod
+    def _get_choices_with_counts(cls, choices, counts: Dict[str, int]):
+        return [
+            (
+                (value, cls._get_choices_with_counts(label, counts))
+                if isinstance(label, (list, tuple))
+                else (value, f'{label} ({counts[value]})' if value in counts else label)
+            )
+            for value, label in choices
+        ]
+
     def clean_taille_page(self):
         return self.cleaned_data.get('taille_page') or self.fields['taille_page'].initial
 
@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -24,6 +24,14 @@
 #
 ##############################################################################
 from infrastructure.utils import AbstractMessageBusCommands
+from parcours_doctoral.ddd.commands import (
+    GetCotutelleQuery,
+    RecupererParcoursDoctoralQuery,
+)
+from parcours_doctoral.ddd.epreuve_confirmation.commands import (
+    RecupererDerniereEpreuveConfirmationQuery,
+)
+from parcours_doctoral.ddd.jury.commands import RecupererJuryQuery
 
 from .parcours_doctoral import handlers as parcours_doctoral_handlers
 from .parcours_doctoral.autorisation_diffusion_these import (
@@ -42,20 +50,35 @@ from .parcours_doctoral.recevabilite import handlers as recevabilite_handlers
 from .parcours_doctoral.soutenance_publique import (
     handlers as soutenance_publique_handlers,
 )
+from .query_memoization import with_read_query_memoization
+from .unit_of_work import with_unit_of_work
+
+# Read queries invoked several times during a request, whose results can be memoized (see start_read_query_memoization)
+MEMOIZED_READ_QUERIES = [
+    GetCotutelleQuery,
+    RecupererDerniereEpreuveConfirmationQuery,
+    RecupererJuryQuery,
+    RecupererParcoursDoctoralQuery,
+]
 
 
 class MessageBusCommands(AbstractMessageBusCommands):
-    command_handlers = {
-        **parcours_doctoral_handlers.COMMAND_HANDLERS,
-        **epreuve_confirmation_handlers.COMMAND_HANDLERS,
-        **formation_handlers.COMMAND_HANDLERS,
-        **jury_handlers.COMMAND_HANDLERS,
-        **defense_privee_handlers.COMMAND_HANDLERS,
-        **soutenance_publique_handlers.COMMAND_HANDLERS,
-        **recevabilite_handlers.COMMAND_HANDLERS,
-        **autorisation_diffusion_these_handlers.COMMAND_HANDLERS,
-        **defense_privee_soutenance_publique_handlers.COMMAND_HANDLERS,
-    }
+    command_handlers = with_unit_of_work(
+        with_read_query_memoization(
+            {
+                **parcours_doctoral_handlers.COMMAND_HANDLERS,
+                **epreuve_confirmation_handlers.COMMAND_HANDLERS,
+                **formation_handlers.COMMAND_HANDLERS,
+                **jury_handlers.COMMAND_HANDLERS,
+                **defense_privee_handlers.COMMAND_HANDLERS,
+                **soutenance_publique_handlers.COMMAND_HANDLERS,
+                **recevabilite_handlers.COMMAND_HANDLERS,
+                **autorisation_diffusion_these_handlers.COMMAND_HANDLERS,
+                **defense_privee_soutenance_publique_handlers.COMMAND_HANDLERS,
+            },
+            memoized_queries=MEMOIZED_READ_QUERIES,
+        ),
+    )
     event_handlers = [
         parcours_doctoral_handlers.EVENT_HANDLERS,
     ]
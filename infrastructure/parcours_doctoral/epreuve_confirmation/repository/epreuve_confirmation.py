@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2024 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -51,6 +51,7 @@ from parcours_doctoral.ddd.epreuve_confirmation.repository.i_epreuve_confirmatio
 from parcours_doctoral.ddd.epreuve_confirmation.validators.exceptions import (
     EpreuveConfirmationNonTrouveeException,
 )
+from parcours_doctoral.infrastructure.unit_of_work import get_unit_of_work
 from parcours_doctoral.models import ParcoursDoctoral
 from parcours_doctoral.models.confirmation_paper import ConfirmationPaper
 
@@ -96,7 +97,11 @@ class EpreuveConfirmationRepository(IEpreuveConfirmationRepository):
 
     @classmethod
     def save(cls, entity: 'EpreuveConfirmation') -> 'EpreuveConfirmationIdentity':
-        related_parcours_doctoral = ParcoursDoctoral.objects.get(uuid=entity.parcours_doctoral_id.uuid)
+        # Only used as a foreign key, so it can be shared with the other saves of the command
+        related_parcours_doctoral = get_unit_of_work().get_reference(
+            ParcoursDoctoral,
+            uuid=entity.parcours_doctoral_id.uuid,
+        )
 
         extended_deadline_params = (
             {
@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -25,7 +25,7 @@
 # ##############################################################################
 from typing import List, Mapping, Optional
 
-from django.db.models import F
+from django.db.models import F, Q
 
 from base.models.student import Student
 from parcours_doctoral.ddd.builder.parcours_doctoral_identity import (
@@ -55,6 +55,7 @@ from parcours_doctoral.ddd.formation.dtos.inscription_unite_enseignement import
 from parcours_doctoral.ddd.formation.repository.i_activite import IActiviteRepository
 from parcours_doctoral.infrastructure.utils import get_doctorate_training_acronym
 from parcours_doctoral.models.activity import Activity
+from parcours_doctoral.models.search_row import ParcoursDoctoralSearchRow
 
 
 class ActiviteRepository(IActiviteRepository):
@@ -315,6 +316,7 @@ class ActiviteRepository(IActiviteRepository):
             # UCL course fields
             course_completed=activite.cours_complete,
         )
+        ParcoursDoctoralSearchRow.objects.refresh(Q(activity__uuid=activite.entity_id.uuid))
 
     @classmethod
     def search(cls, parent_id: Optional[ActiviteIdentity] = None, **kwargs) -> List[Activite]:
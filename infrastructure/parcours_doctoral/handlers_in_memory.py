@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -135,6 +135,10 @@ COMMAND_HANDLERS = {
         cmd,
         parcours_doctoral_repository=_parcours_doctoral_repository,
     ),
+    RecupererParcoursDoctorauxQuery: lambda msg_bus, cmd: recuperer_parcours_doctoraux(
+        cmd,
+        parcours_doctoral_repository=_parcours_doctoral_repository,
+    ),
     RecupererParcoursDoctoralPropositionQuery: lambda msg_bus, cmd: recuperer_parcours_doctoral_proposition(
         cmd,
         parcours_doctoral_repository=_parcours_doctoral_repository,
@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -60,9 +60,12 @@ from parcours_doctoral.ddd.jury.dtos.jury import (
     SignatureMembreJuryDTO,
 )
 from parcours_doctoral.ddd.jury.repository.i_jury import IJuryRepository
+from parcours_doctoral.infrastructure.unit_of_work import get_unit_of_work
 from parcours_doctoral.models import ActorType
 from parcours_doctoral.models.jury import JuryActor
 from parcours_doctoral.models.parcours_doctoral import ParcoursDoctoral
+from parcours_doctoral.models.search_row import ParcoursDoctoralSearchRow
+from parcours_doctoral.utils.cache import bump_parcours_doctoral_permission_versions
 from reference.models.country import Country
 from reference.models.language import Language
 
@@ -163,8 +166,10 @@ class JuryRepository(IJuryRepository):
     @classmethod
     @transaction.atomic
     def save(cls, entity: 'Jury') -> 'JuryIdentity':
+        current_unit_of_work = get_unit_of_work()
+
         codes = list(filter(None, [entity.langue_redaction, entity.langue_soutenance]))
-        languages_by_code = {lang.code: lang for lang in Language.objects.filter(code__in=codes)}
+        languages_by_code = current_unit_of_work.get_references(Language, 'code', codes)
 
         ParcoursDoctoral.objects.filter(uuid=str(entity.entity_id.uuid)).update(
             thesis_proposed_title=entity.titre_propose,
@@ -176,6 +181,11 @@ class JuryRepository(IJuryRepository):
             accounting_situation=entity.situation_comptable,
             jury_approval=entity.approbation_pdf,
         )
+        # The defense method is read by the permissions
+        bump_parcours_doctoral_permission_versions([entity.entity_id.uuid])
+
+        # The thesis title is part of the search text of the doctorate
+        ParcoursDoctoralSearchRow.objects.refresh(Q(uuid=entity.entity_id.uuid))
 
         current_parcours_doctoral = cls._get_queryset().get(uuid=entity.entity_id.uuid)
         if entity.membres:
@@ -184,6 +194,13 @@ class JuryRepository(IJuryRepository):
                 uuid__in=[membre.uuid for membre in entity.membres]
             ).delete()
 
+            # Load the persons of the members at once
+            current_unit_of_work.get_references(
+                Person,
+                'global_id',
+                [membre.matricule for membre in entity.membres if membre.matricule],
+            )
+
             for membre in entity.membres:
                 # We cannot use update_or_create as JuryActor inherits from another models and we get an error
                 try:
@@ -195,7 +212,7 @@ class JuryRepository(IJuryRepository):
 
                 # Handle signature
                 if actor.pk is not None and actor.state != membre.signature.etat.name:
-                    StateHistory.objects.create(state=membre.signature.etat.name, actor_id=actor.id)
+                    current_unit_of_work.register_new(StateHistory(state=membre.signature.etat.name, actor_id=actor.id))
                 if membre.signature.etat.name in [ChoixEtatSignature.APPROVED.name, ChoixEtatSignature.DECLINED.name]:
                     actor.comment = membre.signature.commentaire_externe
                     actor.pdf_from_candidate = membre.signature.pdf
@@ -204,7 +221,7 @@ class JuryRepository(IJuryRepository):
 
                 # Handle the rest
                 if membre.matricule:
-                    person = Person.objects.get(global_id=membre.matricule)
+                    person = current_unit_of_work.get_reference(Person, global_id=membre.matricule)
                     values = {
                         'role': membre.role.name if membre.role else '',
                         'is_promoter': membre.est_promoteur,
@@ -247,7 +264,9 @@ class JuryRepository(IJuryRepository):
                 actor.save()
 
                 if is_create and membre.signature.etat.name != ChoixEtatSignature.NOT_INVITED.name:
-                    StateHistory.objects.create(state=membre.signature.etat.name, actor_id=actor.id)
+                    current_unit_of_work.register_new(StateHistory(state=membre.signature.etat.name, actor_id=actor.id))
+
+            current_unit_of_work.flush()
 
         return entity.entity_id
 
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -27,13 +27,18 @@ from infrastructure.shared_kernel.academic_year.repository.in_memory.academic_ye
     AcademicYearInMemoryRepository,
 )
 from parcours_doctoral.ddd.read_view.queries import (
+    ListerFileAttenteParcoursDoctorauxQuery,
     ListerTousParcoursDoctorauxQuery,
     RecupererInformationsTableauBordQuery,
 )
 from parcours_doctoral.ddd.read_view.use_case import (
+    lister_file_attente,
     lister_parcours_doctoraux,
     recuperer_informations_tableau_bord,
 )
+from parcours_doctoral.infrastructure.parcours_doctoral.read_view.repository.in_memory.file_attente import (
+    FileAttenteInMemoryRepository,
+)
 from parcours_doctoral.infrastructure.parcours_doctoral.read_view.repository.in_memory.liste_parcours_doctoraux import (
     ListeParcoursDoctorauxInMemoryRepository,
 )
@@ -54,4 +59,8 @@ COMMAND_HANDLERS = {
         cmd,
         tableau_bord_repository=TableauBordInMemoryRepository(),
     ),
+    ListerFileAttenteParcoursDoctorauxQuery: lambda msg_bus, cmd: lister_file_attente(
+        cmd,
+        file_attente_repository=FileAttenteInMemoryRepository(),
+    ),
 }
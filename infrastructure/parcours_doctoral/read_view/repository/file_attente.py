@@ -0,0 +1,150 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from typing import Dict, Optional
+
+from django.core import signing
+from django.db.models import Q
+
+from admission.views import PaginatedList
+from parcours_doctoral.ddd.autorisation_diffusion_these.domain.model.enums import (
+    ChoixStatutAutorisationDiffusionThese,
+)
+from parcours_doctoral.ddd.domain.model.enums import (
+    ChoixFileAttenteGestionnaire,
+    ChoixStatutParcoursDoctoral,
+)
+from parcours_doctoral.ddd.read_view.dto.file_attente import ElementFileAttenteDTO
+from parcours_doctoral.ddd.read_view.repository.i_file_attente import (
+    IFileAttenteRepository,
+)
+from parcours_doctoral.infrastructure.parcours_doctoral.read_view.repository.liste_parcours_doctoraux import (
+    CurseurSerializer,
+)
+from parcours_doctoral.infrastructure.utils import (
+    filter_doctorate_queryset_according_to_scope,
+    get_doctorate_visibility_scope,
+)
+from parcours_doctoral.models import ParcoursDoctoral
+
+
+class FileAttenteRepository(IFileAttenteRepository):
+    # Each condition is covered by a partial index (see the ParcoursDoctoral and ThesisDistributionAuthorization models)
+    CONDITIONS_BY_QUEUE: Dict[str, Q] = {
+        ChoixFileAttenteGestionnaire.JURYS_A_APPROUVER_ADRE.name: Q(
+            status=ChoixStatutParcoursDoctoral.JURY_APPROUVE_CDD.name,
+        ),
+        ChoixFileAttenteGestionnaire.AUTORISATIONS_DIFFUSION_A_VALIDER_ADRE.name: Q(
+            thesis_distribution_authorization__status=(
+                ChoixStatutAutorisationDiffusionThese.DIFFUSION_VALIDEE_PROMOTEUR.name
+            ),
+        ),
+        ChoixFileAttenteGestionnaire.AUTORISATIONS_DIFFUSION_A_VALIDER_SCEB.name: Q(
+            thesis_distribution_authorization__status=ChoixStatutAutorisationDiffusionThese.DIFFUSION_VALIDEE_ADRE.name,
+        ),
+        ChoixFileAttenteGestionnaire.PROCES_VERBAUX_CONFIRMATION_A_TRAITER.name: Q(
+            status=ChoixStatutParcoursDoctoral.CONFIRMATION_SOUMISE.name,
+            confirmationpaper__is_active=True,
+            confirmationpaper__supervisor_panel_report__len__gt=0,
+        ),
+    }
+    CURSOR_SALT = 'parcours_doctoral.file_attente.curseur'
+
+    @classmethod
+    def get(
+        cls,
+        file_attente: str,
+        taille_page: int,
+        curseur: Optional[str] = None,
+        demandeur: Optional[str] = '',
+    ) -> PaginatedList[ElementFileAttenteDTO]:
+        qs = ParcoursDoctoral.objects.filter(cls.CONDITIONS_BY_QUEUE[file_attente])
+
+        if demandeur:
+            qs = filter_doctorate_queryset_according_to_scope(qs, get_doctorate_visibility_scope(demandeur))
+
+        # The creation date never changes so the pages stay consistent while the queue is browsed
+        qs = qs.order_by('created_at', 'id')
+
+        cursor_values = cls._decode_cursor(curseur, file_attente) if curseur else None
+        if cursor_values is not None:
+            created_at, pk = cursor_values
+            qs = qs.filter(Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk))
+
+        # Only retrieve the columns that are displayed
+        rows = list(
+            qs.values(
+                'id',
+                'uuid',
+                'status',
+                'created_at',
+                'training__acronym',
+                'student__last_name',
+                'student__first_name',
+            )[:taille_page]
+        )
+
+        result = PaginatedList(id_attribute='uuid')
+        for row in rows:
+            result.append(
+                ElementFileAttenteDTO(
+                    uuid=str(row['uuid']),
+                    statut=row['status'],
+                    sigle_formation=row['training__acronym'],
+                    nom_doctorant=row['student__last_name'],
+                    prenom_doctorant=row['student__first_name'],
+                    cree_le=row['created_at'],
+                )
+            )
+
+        # Cursor from which the next page can be sought
+        result.curseur_suivant = (
+            cls._encode_cursor(file_attente, [rows[-1]['created_at'], rows[-1]['id']])
+            if len(rows) == taille_page
+            else None
+        )
+
+        return result
+
+    @classmethod
+    def _encode_cursor(cls, file_attente: str, values) -> str:
+        return signing.dumps(
+            {'file': file_attente, 'valeurs': values},
+            salt=cls.CURSOR_SALT,
+            serializer=CurseurSerializer,
+        )
+
+    @classmethod
+    def _decode_cursor(cls, curseur: str, file_attente: str):
+        """Return the values of the cursor or None if it is invalid or if it was computed for another queue."""
+        try:
+            data = signing.loads(curseur, salt=cls.CURSOR_SALT, serializer=CurseurSerializer)
+        except signing.BadSignature:
+            return None
+
+        if data.get('file') != file_attente:
+            return None
+
+        return data.get('valeurs')
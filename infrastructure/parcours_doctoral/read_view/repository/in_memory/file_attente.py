@@ -0,0 +1,46 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from typing import Optional
+
+from admission.views import PaginatedList
+from parcours_doctoral.ddd.read_view.dto.file_attente import ElementFileAttenteDTO
+from parcours_doctoral.ddd.read_view.repository.i_file_attente import (
+    IFileAttenteRepository,
+)
+
+
+class FileAttenteInMemoryRepository(IFileAttenteRepository):
+    @classmethod
+    def get(
+        cls,
+        file_attente: str,
+        taille_page: int,
+        curseur: Optional[str] = None,
+        demandeur: Optional[str] = '',
+    ) -> PaginatedList[ElementFileAttenteDTO]:
+        result = PaginatedList(id_attribute='uuid')
+        result.curseur_suivant = None
+        return result
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -66,10 +66,15 @@ class ListeParcoursDoctorauxInMemoryRepository(IListeParcoursDoctorauxRepository
         page: Optional[int] = None,
         taille_page: Optional[int] = None,
         demandeur: Optional[str] = '',
+        curseur: Optional[str] = None,
+        limite_comptage: Optional[int] = None,
+        recherche: Optional[str] = '',
+        avec_comptages_facettes: bool = False,
+        en_flux: bool = False,
     ) -> ListeParcoursDoctoralRechercheDTO:
         result = PaginatedList(id_attribute='uuid')
 
         for parcours_doctoral in ParcoursDoctoralInMemoryRepository.search_dto(matricule_doctorant=matricule_doctorant):
             result.append(parcours_doctoral)
 
-        return ListeParcoursDoctoralRechercheDTO(parcours_doctoraux=result)
+        return ListeParcoursDoctoralRechercheDTO(parcours_doctoraux=iter(result) if en_flux else result)
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,21 +24,32 @@
 #
 # ##############################################################################
 
-from datetime import date
-from typing import Dict, List, Optional, Tuple
+import hashlib
+import json
+from datetime import date, datetime, time
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from django.conf import settings
-from django.db.models import Exists, OuterRef, Q, Sum
-from django.db.models.functions import Coalesce
+from django.core import signing
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Exists, F, OuterRef, Q, QuerySet
 from django.utils.translation import get_language
 
+from admission.ddd.admission.doctorat.preparation.domain.model.enums import (
+    ChoixTypeAdmission,
+)
 from admission.views import PaginatedList
 from parcours_doctoral.ddd.domain.model.enums import (
     BourseRecherche,
+    ChoixCommissionProximiteCDEouCLSM,
+    ChoixCommissionProximiteCDSS,
     ChoixEtapeParcoursDoctoral,
+    ChoixSousDomaineSciences,
     ChoixStatutParcoursDoctoral,
+    ChoixTypeFinancement,
 )
-from parcours_doctoral.ddd.formation.domain.model.enums import StatutActivite
 from parcours_doctoral.ddd.read_view.dto.formation import FormationRechercheDTO
 from parcours_doctoral.ddd.read_view.dto.parcours_doctoral import (
     ListeParcoursDoctoralRechercheDTO,
@@ -51,25 +62,81 @@ from parcours_doctoral.infrastructure.parcours_doctoral.read_view.repository.tab
     TableauBordRepository,
 )
 from parcours_doctoral.infrastructure.utils import (
-    filter_doctorate_queryset_according_to_roles,
+    filter_doctorate_queryset_according_to_scope,
+    get_doctorate_visibility_scope,
     get_entities_with_descendants_ids,
 )
-from parcours_doctoral.models import Activity, ParcoursDoctoral
+from parcours_doctoral.models import ParcoursDoctoral
+from parcours_doctoral.models.search_row import (
+    ParcoursDoctoralSearchRow,
+    normalize_search_text,
+)
+from parcours_doctoral.utils.cache import (
+    get_doctorate_data_version,
+    get_reused_doctorate_data_version,
+)
+
+
+class CurseurJSONEncoder(DjangoJSONEncoder):
+    """
+    JSON encoder keeping the microseconds of the times, which are truncated to milliseconds by the Django encoder,
+    as the values of a cursor must be compared to the exact values of the last row of the previous page.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime, time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class CurseurSerializer(signing.JSONSerializer):
+    """Serializer of the pagination cursors, supporting the values of the sortable fields (dates, decimals...)."""
+
+    def dumps(self, obj):
+        return json.dumps(obj, separators=(',', ':'), cls=CurseurJSONEncoder).encode('latin-1')
 
 
 class ListeParcoursDoctorauxRepository(IListeParcoursDoctorauxRepository):
     DATE_FIELD_BY_DATE_TYPE = {
         ChoixEtapeParcoursDoctoral.ADMISSION.name: 'admission_approved_by_cdd_at__date',
-        ChoixEtapeParcoursDoctoral.CONFIRMATION.name: 'confirmationpaper__confirmation_date',
+        ChoixEtapeParcoursDoctoral.CONFIRMATION.name: 'search_row__active_confirmation_date',
         ChoixEtapeParcoursDoctoral.DEFENSE_PRIVEE.name: 'current_private_defense__datetime__date',
         ChoixEtapeParcoursDoctoral.SOUTENANCE_PUBLIQUE.name: 'defense_datetime__date',
         ChoixEtapeParcoursDoctoral.DECISION_DE_RECEVABILITE.name: 'current_admissibility__decision_date',
     }
-    ADDITIONAL_DATE_CONDITION_BY_DATE_TYPE = {
-        ChoixEtapeParcoursDoctoral.CONFIRMATION.name: {
-            'confirmationpaper__is_active': True,
-        }
+    ORDERING_FIELDS_BY_SORT_FIELD = {
+        'nom_etudiant': ['student__last_name', 'student__first_name'],
+        'formation': ['training__acronym'],
+        'bourse': ['scholarship'],
+        'statut': ['ordered_status'],
+        'date_admission': ['created_at'],
+        'pre_admission': ['admission__type'],
+        'cotutelle': ['cotutelle'],
+        'formation_complementaire': ['follows_an_additional_training'],
+        'en_regle_inscription': ['in_order_of_registration'],
+        'total_credits_valides': ['validated_credits_number'],
     }
+    FACET_FIELD_AND_VALUES_BY_FACET_NAME = {
+        'statuts': ('status', [choice.name for choice in ChoixStatutParcoursDoctoral]),
+        'commission_proximite': (
+            'proximity_commission',
+            [
+                choice.name
+                for enum in [
+                    ChoixCommissionProximiteCDEouCLSM,
+                    ChoixCommissionProximiteCDSS,
+                    ChoixSousDomaineSciences,
+                ]
+                for choice in enum
+            ],
+        ),
+        'type_financement': ('financing_type', [choice.name for choice in ChoixTypeFinancement]),
+        'type_admission': ('admission_type', [choice.name for choice in ChoixTypeAdmission]),
+    }
+    CURSOR_SALT = 'parcours_doctoral.liste_parcours_doctoraux.curseur'
+    RESULT_CACHE_TIMEOUT = 60 * 60  # 1 hour
+    STREAMING_CHUNK_SIZE = 500
+    ENRICHED_SORT_FIELDS = {'bourse', 'formation_complementaire', 'en_regle_inscription', 'total_credits_valides'}
 
     @classmethod
     def get(
@@ -97,37 +164,141 @@ class ListeParcoursDoctorauxRepository(IListeParcoursDoctorauxRepository):
         page: Optional[int] = None,
         taille_page: Optional[int] = None,
         demandeur: Optional[str] = '',
+        curseur: Optional[str] = None,
+        limite_comptage: Optional[int] = None,
+        recherche: Optional[str] = '',
+        avec_comptages_facettes: bool = False,
+        en_flux: bool = False,
+    ) -> ListeParcoursDoctoralRechercheDTO:
+        # The results are shared by the users viewing the same doctorates and dropped when the doctorates change
+        visibility_scope = get_doctorate_visibility_scope(demandeur) if demandeur else None
+        criteria = {
+            'annee_academique_courante': annee_academique_courante,
+            'noma': noma,
+            'matricule_doctorant': matricule_doctorant,
+            'type_admission': type_admission,
+            'statuts': statuts,
+            'annee_academique': annee_academique,
+            'uuid_promoteur': uuid_promoteur,
+            'uuid_president_jury': uuid_president_jury,
+            'cdds': cdds,
+            'commission_proximite': commission_proximite,
+            'type_financement': type_financement,
+            'bourse_recherche': bourse_recherche,
+            'fnrs_fria_fresh': fnrs_fria_fresh,
+            'instituts': instituts,
+            'secteurs': secteurs,
+            'dates': dates,
+            'sigles_formations': sigles_formations,
+            'indicateur_tableau_bord': indicateur_tableau_bord,
+            'tri_inverse': tri_inverse,
+            'champ_tri': champ_tri,
+            'page': page,
+            'taille_page': taille_page,
+            'curseur': curseur,
+            'limite_comptage': limite_comptage,
+            'recherche': recherche,
+            'avec_comptages_facettes': avec_comptages_facettes,
+        }
+
+        # The enrolments come from the annual programmes, whose changes are not covered by the data version, so the
+        # results sorted by them are not cached
+        if en_flux or champ_tri == 'en_regle_inscription':
+            return cls._search(visibility_scope=visibility_scope, en_flux=en_flux, **criteria)
+
+        cache_key = cls._get_result_cache_key(criteria, visibility_scope)
+
+        result = cache.get(cache_key)
+
+        if result is None:
+            # The results of a previous version are kept if the searched doctorates have not changed since then
+            reused_data_version = get_reused_doctorate_data_version()
+            if reused_data_version:
+                result = cache.get(cls._get_result_cache_key(criteria, visibility_scope, reused_data_version))
+                if result is not None:
+                    cache.set(cache_key, result, timeout=cls.RESULT_CACHE_TIMEOUT)
+
+        if result is None:
+            result = cls._search(visibility_scope=visibility_scope, **criteria)
+            cache.set(cache_key, result, timeout=cls.RESULT_CACHE_TIMEOUT)
+        else:
+            # The enrolment status of the cached results is recomputed for the same reason
+            cls._add_enrolment_statuses(result.parcours_doctoraux, annee_academique_courante)
+
+        return result
+
+    @classmethod
+    def _get_result_cache_key(
+        cls,
+        criteria: Dict,
+        visibility_scope: Optional[Tuple],
+        data_version: Optional[str] = None,
+    ) -> str:
+        """
+        Return the key of the cached results for the specified criteria and visibility scope. The criteria are
+        normalized so that the equivalent searches share the same results.
+        :param data_version: the doctorate data version of the results (the current one if not specified)
+        """
+        normalized_criteria = {}
+        for name, value in criteria.items():
+            if not value:
+                continue
+            if isinstance(value, str):
+                value = value.strip()
+            elif isinstance(value, (list, set, tuple)):
+                value = sorted(value, key=str)
+            normalized_criteria[name] = value
+
+        key_data = json.dumps(
+            [normalized_criteria, visibility_scope, get_language()],
+            sort_keys=True,
+            cls=DjangoJSONEncoder,
+        )
+
+        return 'parcours_doctoral_list_result_{version}_{hash}'.format(
+            version=data_version or get_doctorate_data_version(),
+            hash=hashlib.md5(key_data.encode()).hexdigest(),
+        )
+
+    @classmethod
+    def _search(
+        cls,
+        annee_academique_courante: int,
+        noma: Optional[str] = '',
+        matricule_doctorant: Optional[str] = '',
+        type_admission: Optional[str] = '',
+        statuts: Optional[List[str]] = None,
+        annee_academique: Optional[int] = None,
+        uuid_promoteur: Optional[str] = '',
+        uuid_president_jury: Optional[str] = '',
+        cdds: Optional[List[str]] = None,
+        commission_proximite: Optional[str] = '',
+        type_financement: Optional[str] = '',
+        bourse_recherche: Optional[str] = '',
+        fnrs_fria_fresh: Optional[bool] = None,
+        instituts: Optional[List[str]] = None,
+        secteurs: Optional[List[str]] = None,
+        dates: Optional[List[Tuple[str, Optional[date], Optional[date]]]] = None,
+        sigles_formations: Optional[List[str]] = None,
+        indicateur_tableau_bord: Optional[str] = '',
+        tri_inverse: bool = False,
+        champ_tri: Optional[str] = None,
+        page: Optional[int] = None,
+        taille_page: Optional[int] = None,
+        visibility_scope: Optional[Tuple] = None,
+        curseur: Optional[str] = None,
+        limite_comptage: Optional[int] = None,
+        recherche: Optional[str] = '',
+        avec_comptages_facettes: bool = False,
+        en_flux: bool = False,
     ) -> ListeParcoursDoctoralRechercheDTO:
         language_is_french = get_language() == settings.LANGUAGE_CODE_FR
 
-        qs = (
-            ParcoursDoctoral.objects.annotate_training_management_entity()
-            .annotate(
-                scholarship=Coalesce('international_scholarship__short_name', 'other_international_scholarship'),
-            )
-            .annotate(
-                follows_an_additional_training=Exists(
-                    Activity.objects.for_complementary_training_filter().filter(parcours_doctoral_id=OuterRef('pk'))
-                ),
-                validated_credits_number=Sum(
-                    'activity__ects',
-                    filter=Q(activity__status=StatutActivite.ACCEPTEE.name),
-                    default=0,
-                ),
-                in_order_of_registration=Exists(
-                    ParcoursDoctoral.retrieve_valid_enrolments_of_student(
-                        student_id=OuterRef('student_id'),
-                        education_group_id=OuterRef('training__education_group_id'),
-                        academic_year=annee_academique_courante,
-                    )
-                ),
-            )
-            .select_related(
-                'student',
-                'training__academic_year',
-                'training__enrollment_campus',
-                'training__education_group_type',
-            )
+        qs = ParcoursDoctoral.objects.select_related(
+            'student',
+            'training__academic_year',
+            'training__enrollment_campus',
+            'training__education_group_type',
         )
 
         # Add filters
@@ -137,15 +308,14 @@ class ListeParcoursDoctorauxRepository(IListeParcoursDoctorauxRepository):
         if matricule_doctorant:
             qs = qs.filter(student__global_id=matricule_doctorant)
 
-        if type_admission:
-            qs = qs.filter(admission_type=type_admission)
+        if recherche:
+            # Each word must be contained in the normalized search text (lookup backed by a trigram index)
+            for word in normalize_search_text(recherche).split():
+                qs = qs.filter(search_row__search_text__contains=word)
 
         if sigles_formations:
             qs = qs.filter(training__acronym__in=sigles_formations)
 
-        if statuts:
-            qs = qs.filter(status__in=statuts)
-
         if annee_academique:
             qs = qs.filter(training__academic_year__year=annee_academique)
 
@@ -155,8 +325,8 @@ class ListeParcoursDoctorauxRepository(IListeParcoursDoctorauxRepository):
         if uuid_president_jury:
             qs = qs.filter(jury_group__actors__uuid=uuid_president_jury)
 
-        if demandeur:
-            qs = filter_doctorate_queryset_according_to_roles(qs, demandeur)
+        if visibility_scope is not None:
+            qs = filter_doctorate_queryset_according_to_scope(qs, visibility_scope)
 
         if cdds:
             qs = qs.filter(training__management_entity_id__in=get_entities_with_descendants_ids(cdds))
@@ -172,12 +342,6 @@ class ListeParcoursDoctorauxRepository(IListeParcoursDoctorauxRepository):
 
         qs = qs.filter(sector_condition | institute_condition)
 
-        if commission_proximite:
-            qs = qs.filter(proximity_commission=commission_proximite)
-
-        if type_financement:
-            qs = qs.filter(financing_type=type_financement)
-
         if bourse_recherche == BourseRecherche.OTHER.name:
             qs = qs.exclude(other_international_scholarship='')
         elif bourse_recherche:
@@ -202,49 +366,293 @@ class ListeParcoursDoctorauxRepository(IListeParcoursDoctorauxRepository):
                 if date_end:
                     date_filters[f'{date_field}__lte'] = date_end
 
-                additional_condition = cls.ADDITIONAL_DATE_CONDITION_BY_DATE_TYPE.get(date_type)
-                if additional_condition:
-                    date_filters.update(additional_condition)
-
             qs = qs.filter(**date_filters)
 
+        # The facet filters are applied last as the facet counts don't depend on the filter of their own dimension
+        facet_conditions = {
+            'statuts': Q(status__in=statuts) if statuts else Q(),
+            'commission_proximite': Q(proximity_commission=commission_proximite) if commission_proximite else Q(),
+            'type_financement': Q(financing_type=type_financement) if type_financement else Q(),
+            'type_admission': Q(admission_type=type_admission) if type_admission else Q(),
+        }
+
+        facet_counts = cls._get_facet_counts(qs, facet_conditions) if avec_comptages_facettes and not en_flux else None
+
+        for facet_condition in facet_conditions.values():
+            qs = qs.filter(facet_condition)
+
+        # The enriched columns are only computed in SQL if they are used to sort the doctorates
+        enriched_in_sql = champ_tri in cls.ENRICHED_SORT_FIELDS
+
+        if enriched_in_sql:
+            qs = cls._annotate_enriched_columns(qs, annee_academique_courante)
+
         field_order = []
         if champ_tri:
             if champ_tri == 'statut':
                 qs = qs.annotate_ordered_enum('status', 'ordered_status', ChoixStatutParcoursDoctoral)
 
-            field_order = {
-                'nom_etudiant': ['student__last_name', 'student__first_name'],
-                'formation': ['training__acronym'],
-                'bourse': ['scholarship'],
-                'statut': ['ordered_status'],
-                'date_admission': ['created_at'],
-                'pre_admission': ['admission__type'],
-                'cotutelle': ['cotutelle'],
-                'formation_complementaire': ['follows_an_additional_training'],
-                'en_regle_inscription': ['in_order_of_registration'],
-                'total_credits_valides': ['validated_credits_number'],
-            }[champ_tri]
+            field_order = cls.ORDERING_FIELDS_BY_SORT_FIELD[champ_tri]
 
             if tri_inverse:
                 field_order = ['-' + field for field in field_order]
 
-        qs = qs.order_by(*field_order, 'id')
+        field_order = [*field_order, 'id']
+        qs = qs.order_by(*field_order)
+
+        if en_flux:
+            # The rows are fetched by chunks through a server-side cursor and converted on the fly
+            return ListeParcoursDoctoralRechercheDTO(
+                parcours_doctoraux=(
+                    cls.load_dto_from_model(parcours_doctoral, language_is_french)
+                    for parcours_doctoral in cls._iterate_enriched_doctorates(
+                        doctorates=qs.iterator(chunk_size=cls.STREAMING_CHUNK_SIZE),
+                        annee_academique_courante=annee_academique_courante,
+                        enriched_in_sql=enriched_in_sql,
+                    )
+                )
+            )
 
         # Paginate the queryset
-        if page and taille_page:
-            result = PaginatedList(complete_list=qs.all().values_list('uuid', flat=True))
+        cursor_values = cls._decode_cursor(curseur, champ_tri, tri_inverse) if curseur and taille_page else None
+        total_count = None
+
+        # The count is bounded but always covers the requested page, with one more row telling if there are other
+        # ones, so that the following pages remain reachable
+        count_limit = max(limite_comptage, (page or 1) * (taille_page or 0)) + 1 if limite_comptage else None
+
+        if cursor_values is not None:
+            # Keyset pagination: seek the rows following the last one of the previous page
+            total_count = cls._count(qs, count_limit)
+            qs = qs.filter(cls._get_cursor_condition(field_order, cursor_values))[:taille_page]
+            result = PaginatedList(id_attribute='uuid')
+        elif page and taille_page:
+            # The sorted uuids give the total count and the navigation between the doctorates, so they are bounded too
+            sorted_uuids = qs.all().values_list('uuid', flat=True)
+            if count_limit:
+                sorted_uuids = sorted_uuids[:count_limit]
+            sorted_uuids = list(sorted_uuids)
+            total_count = len(sorted_uuids)
+            result = PaginatedList(complete_list=sorted_uuids)
+            result.uuids_tries = sorted_uuids
             bottom = (page - 1) * taille_page
             top = page * taille_page
             qs = qs[bottom:top]
         else:
             result = PaginatedList(id_attribute='uuid')
 
-        for parcours_doctoral in qs:
+        # Ids from which the enrolment status of the cached results is recomputed
+        result.identifiants_inscriptions = {}
+
+        parcours_doctoral = None
+        for parcours_doctoral in cls._iterate_enriched_doctorates(
+            doctorates=qs,
+            annee_academique_courante=annee_academique_courante,
+            enriched_in_sql=enriched_in_sql,
+        ):
             result.append(cls.load_dto_from_model(parcours_doctoral, language_is_french))
+            result.identifiants_inscriptions[parcours_doctoral.uuid] = (
+                parcours_doctoral.student_id,
+                parcours_doctoral.training.education_group_id,
+            )
+
+        if total_count is not None:
+            result.total_count = total_count
+
+        result.comptage_incomplet = count_limit is not None and total_count == count_limit
+
+        result.comptages_facettes = facet_counts
+
+        # Cursor from which the next page can be sought
+        result.curseur_suivant = (
+            cls._encode_cursor(
+                champ_tri, tri_inverse, [cls._get_field_value(parcours_doctoral, field) for field in field_order]
+            )
+            if taille_page and len(result) == taille_page
+            else None
+        )
 
         return ListeParcoursDoctoralRechercheDTO(parcours_doctoraux=result)
 
+    @classmethod
+    def _annotate_enriched_columns(cls, qs: QuerySet, annee_academique_courante: int) -> QuerySet:
+        """Annotate the queryset with the enriched columns, computed in SQL for each doctorate."""
+        return qs.annotate(
+            scholarship=F('search_row__scholarship'),
+            follows_an_additional_training=F('search_row__follows_an_additional_training'),
+            validated_credits_number=F('search_row__validated_credits_number'),
+            in_order_of_registration=Exists(
+                ParcoursDoctoral.retrieve_valid_enrolments_of_student(
+                    student_id=OuterRef('student_id'),
+                    education_group_id=OuterRef('training__education_group_id'),
+                    academic_year=annee_academique_courante,
+                )
+            ),
+        )
+
+    @classmethod
+    def _iterate_enriched_doctorates(
+        cls,
+        doctorates: Iterable[ParcoursDoctoral],
+        annee_academique_courante: int,
+        enriched_in_sql: bool,
+    ) -> Iterator[ParcoursDoctoral]:
+        """
+        Yield the doctorates once the enriched columns have been added to them, with a few batched queries for each
+        chunk of doctorates (unless they have already been computed in SQL).
+        """
+        if enriched_in_sql:
+            yield from doctorates
+            return
+
+        doctorates = iter(doctorates)
+        chunk = list(islice(doctorates, cls.STREAMING_CHUNK_SIZE))
+        while chunk:
+            cls._enrich_doctorates(chunk, annee_academique_courante)
+            yield from chunk
+            chunk = list(islice(doctorates, cls.STREAMING_CHUNK_SIZE))
+
+    @classmethod
+    def _enrich_doctorates(cls, doctorates: List[ParcoursDoctoral], annee_academique_courante: int):
+        """Add the enriched columns to the specified doctorates."""
+        search_rows = {
+            row['parcours_doctoral_id']: row
+            for row in ParcoursDoctoralSearchRow.objects.filter(
+                parcours_doctoral_id__in=[doctorate.pk for doctorate in doctorates],
+            ).values(
+                'parcours_doctoral_id',
+                'scholarship',
+                'follows_an_additional_training',
+                'validated_credits_number',
+            )
+        }
+
+        valid_enrolments = ParcoursDoctoral.retrieve_students_and_education_groups_with_valid_enrolments(
+            students_ids={doctorate.student_id for doctorate in doctorates},
+            education_groups_ids={doctorate.training.education_group_id for doctorate in doctorates},
+            academic_year=annee_academique_courante,
+        )
+
+        for doctorate in doctorates:
+            search_row = search_rows.get(doctorate.pk, {})
+            doctorate.scholarship = search_row.get('scholarship')
+            doctorate.follows_an_additional_training = search_row.get('follows_an_additional_training')
+            doctorate.validated_credits_number = search_row.get('validated_credits_number')
+            doctorate.in_order_of_registration = (
+                doctorate.student_id,
+                doctorate.training.education_group_id,
+            ) in valid_enrolments
+
+    @classmethod
+    def _add_enrolment_statuses(cls, doctorates: PaginatedList, annee_academique_courante: int):
+        """Update the enrolment status of the specified doctorates from the current enrolments of their students."""
+        enrolment_ids = getattr(doctorates, 'identifiants_inscriptions', None)
+        if not enrolment_ids:
+            return
+
+        valid_enrolments = ParcoursDoctoral.retrieve_students_and_education_groups_with_valid_enrolments(
+            students_ids={student_id for student_id, _ in enrolment_ids.values()},
+            education_groups_ids={education_group_id for _, education_group_id in enrolment_ids.values()},
+            academic_year=annee_academique_courante,
+        )
+
+        for doctorate in doctorates:
+            doctorate.en_regle_inscription = enrolment_ids.get(doctorate.uuid) in valid_enrolments
+
+    @classmethod
+    def _get_facet_counts(cls, qs: QuerySet, facet_conditions: Dict[str, Q]) -> Dict[str, Dict[str, int]]:
+        """
+        Return the number of doctorates by value of each facet, computed in a single query with filtered aggregates.
+        The count of a facet value depends on the conditions of the other facets but not on the one of its own facet.
+        :param qs: the queryset filtered by the non-facet conditions
+        :param facet_conditions: the conditions of the facets, by facet name
+        """
+        aggregates = {}
+
+        for facet_name, (field, values) in cls.FACET_FIELD_AND_VALUES_BY_FACET_NAME.items():
+            other_facets_condition = Q()
+            for other_facet_name, facet_condition in facet_conditions.items():
+                if other_facet_name != facet_name:
+                    other_facets_condition &= facet_condition
+
+            for index, value in enumerate(values):
+                aggregates[f'{facet_name}_{index}'] = Count('pk', filter=other_facets_condition & Q(**{field: value}))
+
+        counts = qs.order_by().aggregate(**aggregates)
+
+        return {
+            facet_name: {value: counts[f'{facet_name}_{index}'] for index, value in enumerate(values)}
+            for facet_name, (_, values) in cls.FACET_FIELD_AND_VALUES_BY_FACET_NAME.items()
+        }
+
+    @classmethod
+    def _count(cls, qs: QuerySet, limit: Optional[int]) -> int:
+        """Return the number of rows of the queryset, bounded by the specified limit (if any)."""
+        qs = qs.order_by()
+        return qs[:limit].count() if limit else qs.count()
+
+    @classmethod
+    def _get_field_value(cls, obj, field: str):
+        """Return the value of the (possibly related and descending) ordering field for the specified object."""
+        for attribute_name in field.lstrip('-').split('__'):
+            if obj is None:
+                break
+            obj = getattr(obj, attribute_name)
+        return obj
+
+    @classmethod
+    def _get_cursor_condition(cls, field_order: List[str], cursor_values: List) -> Q:
+        """
+        Return the condition selecting the rows located after the cursor, according to the ordering, knowing that
+        PostgreSQL considers null values as larger than any non-null value.
+        :param field_order: the ordering fields (descending fields are prefixed by '-')
+        :param cursor_values: the values of the ordering fields for the last row of the previous page
+        """
+        condition = Q(pk__in=[])
+        previous_fields_equality = Q()
+
+        for field, value in zip(field_order, cursor_values):
+            descending = field.startswith('-')
+            field = field.lstrip('-')
+
+            if value is None:
+                next_rows_condition = Q(**{f'{field}__isnull': False}) if descending else Q(pk__in=[])
+                same_rows_condition = Q(**{f'{field}__isnull': True})
+            else:
+                next_rows_condition = (
+                    Q(**{f'{field}__lt': value})
+                    if descending
+                    else Q(**{f'{field}__gt': value}) | Q(**{f'{field}__isnull': True})
+                )
+                same_rows_condition = Q(**{field: value})
+
+            condition |= previous_fields_equality & next_rows_condition
+            previous_fields_equality &= same_rows_condition
+
+        return condition
+
+    @classmethod
+    def _encode_cursor(cls, champ_tri: Optional[str], tri_inverse: bool, values: List) -> str:
+        return signing.dumps(
+            {'tri': champ_tri or '', 'inverse': tri_inverse, 'valeurs': values},
+            salt=cls.CURSOR_SALT,
+            serializer=CurseurSerializer,
+            compress=True,
+        )
+
+    @classmethod
+    def _decode_cursor(cls, curseur: str, champ_tri: Optional[str], tri_inverse: bool) -> Optional[List]:
+        """Return the values of the cursor or None if it is invalid or if it was computed for another ordering."""
+        try:
+            data = signing.loads(curseur, salt=cls.CURSOR_SALT, serializer=CurseurSerializer)
+        except signing.BadSignature:
+            return None
+
+        if data.get('tri') != (champ_tri or '') or data.get('inverse') != tri_inverse:
+            return None
+
+        return data.get('valeurs')
+
     @classmethod
     def load_dto_from_model(
         cls,
@@ -258,8 +666,11 @@ class ListeParcoursDoctorauxRepository(IListeParcoursDoctorauxRepository):
             genre_doctorant=parcours_doctoral.student.gender,
             nom_doctorant=parcours_doctoral.student.last_name,
             prenom_doctorant=parcours_doctoral.student.first_name,
-            email_doctorant=parcours_doctoral.student.email
-            if parcours_doctoral.student.email else parcours_doctoral.student.private_email,
+            email_doctorant=(
+                parcours_doctoral.student.email
+                if parcours_doctoral.student.email
+                else parcours_doctoral.student.private_email
+            ),
             formation=FormationRechercheDTO(
                 sigle=parcours_doctoral.training.acronym,
                 code=parcours_doctoral.training.partial_acronym,
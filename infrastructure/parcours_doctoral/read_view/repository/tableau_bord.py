@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -23,15 +23,15 @@
 #  see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
-import datetime
+import bisect
+from collections import defaultdict
 from typing import Dict, List, Optional
 
+from django.core.cache import cache
 from django.db.models.aggregates import Count
-from django.db.models.expressions import ExpressionWrapper, F
-from django.db.models.fields import DateField
 from django.db.models.functions.datetime import Now
-from django.db.models.lookups import GreaterThanOrEqual
 from django.db.models.query_utils import Q
+from django.utils import timezone
 
 from admission.ddd.admission.doctorat.preparation.read_view.domain.enums.tableau_bord import (
     IndicateurTableauBordEnum,
@@ -48,24 +48,36 @@ from parcours_doctoral.ddd.read_view.repository.i_tableau_bord import (
     ITableauBordRepository,
 )
 from parcours_doctoral.infrastructure.utils import get_entities_with_descendants_ids
-from parcours_doctoral.models import ParcoursDoctoral
+from parcours_doctoral.models import DashboardIndicatorCounter, ParcoursDoctoral
+from parcours_doctoral.utils.cache import (
+    get_admission_data_version,
+    get_doctorate_data_version,
+)
 
 
 class TableauBordRepository(TableauBordRepositoryAdmissionMixin, ITableauBordRepository):
+    # The indicators depending on the current date can't be counted in advance. The doctorates matching the condition
+    # are part of the indicator from the warning date computed in their search row (so filtered through an index).
+    TIME_BASED_INDICATORS = {
+        IndicateurTableauBordEnum.CONFIRMATION_ECHEANCE_2_MOIS.name: (
+            Q(
+                status__in=[
+                    ChoixStatutParcoursDoctoral.ADMIS.name,
+                    ChoixStatutParcoursDoctoral.CONFIRMATION_A_REPRESENTER.name,
+                ],
+            ),
+            'search_row__confirmation_warning_datetime',
+        ),
+        IndicateurTableauBordEnum.AUTORISATION_DIFFUSION_THESE_ECHEANCE_15_JOURS.name: (
+            Q(),
+            'search_row__thesis_distribution_warning_datetime',
+        ),
+    }
+
     DOCTORATE_DJANGO_FILTER_BY_INDICATOR = {
         IndicateurTableauBordEnum.CONFIRMATION_ECHEANCE_2_MOIS.name: Q(
-            GreaterThanOrEqual(
-                Now(),
-                ExpressionWrapper(
-                    F('created_at') + (F('confirmationpaper__confirmation_deadline') - F('created_at')) * 0.75,
-                    output_field=DateField(),
-                ),
-            ),
-            confirmationpaper__is_active=True,
-            status__in=[
-                ChoixStatutParcoursDoctoral.ADMIS.name,
-                ChoixStatutParcoursDoctoral.CONFIRMATION_A_REPRESENTER.name,
-            ],
+            TIME_BASED_INDICATORS[IndicateurTableauBordEnum.CONFIRMATION_ECHEANCE_2_MOIS.name][0],
+            search_row__confirmation_warning_datetime__lte=Now(),
         ),
         IndicateurTableauBordEnum.CONFIRMATION_SOUMISE.name: Q(
             status=ChoixStatutParcoursDoctoral.CONFIRMATION_SOUMISE.name,
@@ -125,15 +137,8 @@ class TableauBordRepository(TableauBordRepositoryAdmissionMixin, ITableauBordRep
             defense_minutes__len__gt=0,
         ),
         IndicateurTableauBordEnum.AUTORISATION_DIFFUSION_THESE_ECHEANCE_15_JOURS.name: Q(
-            Q(
-                Q(thesis_distribution_authorization__isnull=True)
-                | Q(
-                    thesis_distribution_authorization__status=(
-                        ChoixStatutAutorisationDiffusionThese.DIFFUSION_NON_SOUMISE.name
-                    )
-                )
-            )
-            & Q(defense_datetime__lte=Now() + datetime.timedelta(days=14))
+            TIME_BASED_INDICATORS[IndicateurTableauBordEnum.AUTORISATION_DIFFUSION_THESE_ECHEANCE_15_JOURS.name][0],
+            search_row__thesis_distribution_warning_datetime__lte=Now(),
         ),
         IndicateurTableauBordEnum.AUTORISATION_DIFFUSION_THESE_REJET_ADRE.name: Q(
             thesis_distribution_authorization__status=ChoixStatutAutorisationDiffusionThese.DIFFUSION_REFUSEE_ADRE.name,
@@ -143,34 +148,135 @@ class TableauBordRepository(TableauBordRepositoryAdmissionMixin, ITableauBordRep
         ),
     }
 
+    # The values are cached by management entity and proximity commission to answer any selection from the same data
+    GROUPED_VALUES_CACHE_TIMEOUT = 5 * 60
+
+    @classmethod
+    def get_counted_doctorate_filters(cls) -> Dict[str, Q]:
+        """Return the filters of the doctorate indicators whose values are maintained in the counters."""
+        return {
+            indicator: django_filter
+            for indicator, django_filter in cls.DOCTORATE_DJANGO_FILTER_BY_INDICATOR.items()
+            if indicator not in cls.TIME_BASED_INDICATORS
+        }
+
+    @classmethod
+    def _get_grouped_values(cls) -> Dict:
+        """
+        Return the values of the indicators by management entity id and proximity commission, cached until the data
+        change. For the time-based indicators, the sorted warning dates of the matching doctorates are returned instead
+        so that the values can be computed at any time.
+        """
+        cache_key = 'parcours_doctoral_dashboard_grouped_values_{doctorate_version}_{admission_version}'.format(
+            doctorate_version=get_doctorate_data_version(),
+            admission_version=get_admission_data_version(),
+        )
+
+        grouped_values = cache.get(cache_key)
+
+        if grouped_values is None:
+            grouped_values = cls._compute_grouped_values()
+            cache.set(cache_key, grouped_values, timeout=cls.GROUPED_VALUES_CACHE_TIMEOUT)
+
+        return grouped_values
+
+    @classmethod
+    def _compute_grouped_values(cls) -> Dict:
+        counts = defaultdict(lambda: defaultdict(int))
+        warning_datetimes = defaultdict(lambda: defaultdict(list))
+
+        for counter in DashboardIndicatorCounter.objects.exclude(count=0):
+            counts[(counter.management_entity_id, counter.proximity_commission)][counter.indicator] += counter.count
+
+        for indicator, (django_filter, warning_datetime_field) in cls.TIME_BASED_INDICATORS.items():
+            for management_entity_id, proximity_commission, warning_datetime in (
+                ParcoursDoctoral.objects.filter(django_filter, **{f'{warning_datetime_field}__isnull': False})
+                .order_by()
+                .values_list('training__management_entity_id', 'proximity_commission', warning_datetime_field)
+            ):
+                warning_datetimes[(management_entity_id, proximity_commission)][indicator].append(warning_datetime)
+
+        for group in (
+            DoctorateAdmission.objects.order_by()
+            .values('training__management_entity_id', 'proximity_commission')
+            .annotate(
+                **{
+                    indicator: Count('pk', filter=django_filter)
+                    for indicator, django_filter in cls.ADMISSION_DJANGO_FILTER_BY_INDICATOR.items()
+                }
+            )
+        ):
+            for indicator in cls.ADMISSION_DJANGO_FILTER_BY_INDICATOR:
+                if group[indicator]:
+                    counts[(group['training__management_entity_id'], group['proximity_commission'])][
+                        indicator
+                    ] += group[indicator]
+
+        return {
+            'counts': {key: dict(values) for key, values in counts.items()},
+            'warning_datetimes': {
+                key: {indicator: sorted(datetimes) for indicator, datetimes in values.items()}
+                for key, values in warning_datetimes.items()
+            },
+        }
+
     @classmethod
     def _get_valeurs_indicateurs(
         cls,
         commission_proximite: Optional[str],
         cdds: Optional[List[str]],
     ) -> Dict[str, int]:
-        common_filters = Q()
-        if commission_proximite:
-            common_filters &= Q(proximity_commission=commission_proximite)
-
-        if cdds:
-            common_filters &= Q(training__management_entity_id__in=get_entities_with_descendants_ids(cdds))
-
-        doctorate_results = ParcoursDoctoral.objects.aggregate(
-            **{
-                indicator: Count('pk', filter=django_filter & common_filters)
-                for indicator, django_filter in cls.DOCTORATE_DJANGO_FILTER_BY_INDICATOR.items()
-            }
-        )
+        grouped_values = cls._get_grouped_values()
+        cdds_ids = set(get_entities_with_descendants_ids(cdds)) if cdds else None
 
-        admission_results = DoctorateAdmission.objects.aggregate(
-            **{
-                indicator: Count('pk', filter=django_filter & common_filters)
-                for indicator, django_filter in cls.ADMISSION_DJANGO_FILTER_BY_INDICATOR.items()
-            }
-        )
+        def is_selected(management_entity_id, proximity_commission):
+            return (not commission_proximite or proximity_commission == commission_proximite) and (
+                cdds_ids is None or management_entity_id in cdds_ids
+            )
+
+        results = {
+            indicator: 0
+            for indicator in [*cls.DOCTORATE_DJANGO_FILTER_BY_INDICATOR, *cls.ADMISSION_DJANGO_FILTER_BY_INDICATOR]
+        }
+
+        for key, values in grouped_values['counts'].items():
+            if is_selected(*key):
+                for indicator, value in values.items():
+                    results[indicator] += value
+
+        now = timezone.now()
+        for key, values in grouped_values['warning_datetimes'].items():
+            if is_selected(*key):
+                for indicator, datetimes in values.items():
+                    results[indicator] += bisect.bisect_right(datetimes, now)
+
+        return results
+
+    @classmethod
+    def get_cache_validation_data(cls) -> Dict:
+        """
+        Return the data from which the cached dashboard pages are validated, apart from the doctorate data version: the
+        next date on which a time-based indicator changes and the values of the admission indicators, as some changes
+        of the admissions don't change the admission data version (the values being cached for a few minutes).
+        """
+        grouped_values = cls._get_grouped_values()
+        now = timezone.now()
+
+        next_warning_datetime = None
+        for values in grouped_values['warning_datetimes'].values():
+            for datetimes in values.values():
+                index = bisect.bisect_right(datetimes, now)
+                if index < len(datetimes) and (
+                    next_warning_datetime is None or datetimes[index] < next_warning_datetime
+                ):
+                    next_warning_datetime = datetimes[index]
 
         return {
-            **doctorate_results,
-            **admission_results,
+            'next_warning_datetime': next_warning_datetime.isoformat() if next_warning_datetime else None,
+            'admission_values': sorted(
+                (str(key), indicator, value)
+                for key, values in grouped_values['counts'].items()
+                for indicator, value in values.items()
+                if indicator in cls.ADMISSION_DJANGO_FILTER_BY_INDICATOR
+            ),
         }
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -26,7 +26,7 @@
 from collections import defaultdict
 from typing import List, Optional, Union
 
-from django.db.models import F, Prefetch
+from django.db.models import F, Prefetch, Q
 from django.db.models.functions import Coalesce
 from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
@@ -53,12 +53,18 @@ from parcours_doctoral.ddd.jury.domain.model.enums import RoleJury
 from parcours_doctoral.ddd.repository.i_groupe_de_supervision import (
     IGroupeDeSupervisionRepository,
 )
+from parcours_doctoral.infrastructure.unit_of_work import (
+    UnitOfWork,
+    get_unit_of_work,
+)
 from parcours_doctoral.models import (
     ActorType,
     JuryActor,
     ParcoursDoctoral,
+    ParcoursDoctoralSearchRow,
     ParcoursDoctoralSupervisionActor,
 )
+from parcours_doctoral.utils.cache import invalidate_parcours_doctoral_permission_objects
 from reference.models.country import Country
 
 
@@ -184,12 +190,24 @@ class GroupeDeSupervisionRepository(IGroupeDeSupervisionRepository):
         current_members.exclude(uuid__in=[s.membre_CA_id.uuid for s in entity.signatures_membres_CA]).delete()
 
         # Update existing actors
-        cls._update_members(current_promoteurs, entity.signatures_promoteurs, entity.promoteur_reference_id)
-        cls._update_members(current_members, entity.signatures_membres_CA)
+        current_unit_of_work = get_unit_of_work()
+        cls._update_members(
+            current_unit_of_work,
+            current_promoteurs,
+            entity.signatures_promoteurs,
+            entity.promoteur_reference_id,
+        )
+        cls._update_members(current_unit_of_work, current_members, entity.signatures_membres_CA)
+
+        if current_unit_of_work.flush():
+            # The bulk writes do not send any signal
+            invalidate_parcours_doctoral_permission_objects(Q(supervision_group_id=groupe.pk))
+            ParcoursDoctoralSearchRow.objects.filter(parcours_doctoral__supervision_group_id=groupe.pk).touch()
 
     @classmethod
     def _update_members(
         cls,
+        current_unit_of_work: UnitOfWork,
         member_list: list,
         signature_list: Union[List[SignaturePromoteur], List[SignatureMembreCA]],
         reference_promoter: Optional[PromoteurIdentity] = None,
@@ -197,7 +215,7 @@ class GroupeDeSupervisionRepository(IGroupeDeSupervisionRepository):
         for actor in member_list:
             membre = cls._get_member(signature_list, str(actor.uuid))
             if actor.state != membre.etat.name:
-                StateHistory.objects.create(state=membre.etat.name, actor_id=actor.id)
+                current_unit_of_work.register_new(StateHistory(state=membre.etat.name, actor_id=actor.id))
                 if membre.etat.name in [ChoixEtatSignature.APPROVED.name, ChoixEtatSignature.DECLINED.name]:
                     actor.comment = membre.commentaire_externe
                     actor.parcoursdoctoralsupervisionactor.pdf_from_candidate = membre.pdf
@@ -214,7 +232,7 @@ class GroupeDeSupervisionRepository(IGroupeDeSupervisionRepository):
                 and (not reference_promoter or str(actor.uuid) != str(reference_promoter.uuid))
             ):
                 actor.parcoursdoctoralsupervisionactor.is_reference_promoter = False
-                actor.parcoursdoctoralsupervisionactor.save()
+                current_unit_of_work.register_dirty(actor.parcoursdoctoralsupervisionactor, 'is_reference_promoter')
             elif (
                 # Actor is the reference promoter and need to be updated
                 reference_promoter
@@ -222,7 +240,7 @@ class GroupeDeSupervisionRepository(IGroupeDeSupervisionRepository):
                 and str(actor.uuid) == str(reference_promoter.uuid)
             ):
                 actor.parcoursdoctoralsupervisionactor.is_reference_promoter = True
-                actor.parcoursdoctoralsupervisionactor.save()
+                current_unit_of_work.register_dirty(actor.parcoursdoctoralsupervisionactor, 'is_reference_promoter')
 
     @classmethod
     def _get_member(cls, signatures: list, uuid: str) -> Union[SignaturePromoteur, SignatureMembreCA]:
@@ -245,8 +263,9 @@ class GroupeDeSupervisionRepository(IGroupeDeSupervisionRepository):
         country_code: Optional[str] = '',
         language: Optional[str] = '',
     ) -> 'SignataireIdentity':
+        current_unit_of_work = get_unit_of_work()
         groupe = Process.objects.get(uuid=groupe_id.uuid)
-        person = Person.objects.get(global_id=matricule) if matricule else None
+        person = current_unit_of_work.get_reference(Person, global_id=matricule) if matricule else None
         new_actor = ParcoursDoctoralSupervisionActor.objects.create(
             process=groupe,
             person=person,
@@ -257,7 +276,7 @@ class GroupeDeSupervisionRepository(IGroupeDeSupervisionRepository):
             is_doctor=is_doctor,
             institute=institute,
             city=city,
-            country=Country.objects.get(iso_code=country_code) if country_code else None,
+            country=current_unit_of_work.get_reference(Country, iso_code=country_code) if country_code else None,
             language=language,
         )
         if type == ActorType.PROMOTER:
@@ -357,6 +376,8 @@ class GroupeDeSupervisionRepository(IGroupeDeSupervisionRepository):
             is_doctor=is_doctor,
             institute=institute,
             city=city,
-            country=Country.objects.get(iso_code=country_code) if country_code else None,
+            country=get_unit_of_work().get_reference(Country, iso_code=country_code) if country_code else None,
             language=language,
         )
+        # The update does not send any signal
+        invalidate_parcours_doctoral_permission_objects(Q(supervision_group__uuid=groupe_id.uuid))
@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -248,6 +248,11 @@ class ParcoursDoctoralInMemoryRepository(InMemoryGenericRepository, IParcoursDoc
             date_retrait_diplome=parcours_doctoral.date_retrait_diplome,
         )
 
+    @classmethod
+    def get_dtos(cls, entity_ids: List['ParcoursDoctoralIdentity']) -> List['ParcoursDoctoralDTO']:
+        existing_entity_ids = {entity.entity_id for entity in cls.entities}
+        return [cls.get_dto(entity_id) for entity_id in entity_ids if entity_id in existing_entity_ids]
+
     @classmethod
     def get_cotutelle_dto(cls, entity_id: 'ParcoursDoctoralIdentity') -> 'CotutelleDTO':
         return cls.get_dto(entity_id).cotutelle
@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -74,6 +74,7 @@ from parcours_doctoral.ddd.dtos.parcours_doctoral import (
 from parcours_doctoral.ddd.repository.i_parcours_doctoral import (
     IParcoursDoctoralRepository,
 )
+from parcours_doctoral.infrastructure.unit_of_work import get_unit_of_work
 from parcours_doctoral.models import Document
 from parcours_doctoral.models.parcours_doctoral import (
     ParcoursDoctoral as ParcoursDoctoralModel,
@@ -208,15 +209,18 @@ class ParcoursDoctoralRepository(IParcoursDoctoralRepository):
 
     @classmethod
     def save(cls, entity: 'ParcoursDoctoral') -> None:
-        training = EducationGroupYear.objects.get(
+        current_unit_of_work = get_unit_of_work()
+
+        training = current_unit_of_work.get_reference(
+            EducationGroupYear,
             acronym=entity.formation_id.sigle,
             academic_year__year=entity.formation_id.annee,
         )
 
-        student = Person.objects.get(global_id=entity.matricule_doctorant)
+        student = current_unit_of_work.get_reference(Person, global_id=entity.matricule_doctorant)
 
         codes = list(filter(None, [entity.projet.langue_redaction_these, entity.langue_soutenance_publique]))
-        languages_by_code = {lang.code: lang for lang in Language.objects.filter(code__in=codes)} if codes else {}
+        languages_by_code = current_unit_of_work.get_references(Language, 'code', codes) if codes else {}
 
         ParcoursDoctoralModel.objects.update_or_create(
             uuid=entity.entity_id.uuid,
@@ -229,7 +233,7 @@ class ParcoursDoctoralRepository(IParcoursDoctoralRepository):
                 'project_abstract': entity.projet.resume,
                 'thesis_language': languages_by_code.get(entity.projet.langue_redaction_these),
                 'thesis_institute': (
-                    EntityVersion.objects.get(uuid=entity.projet.institut_these.uuid)
+                    current_unit_of_work.get_reference(EntityVersion, uuid=entity.projet.institut_these.uuid)
                     if entity.projet.institut_these
                     else None
                 ),
@@ -302,45 +306,103 @@ class ParcoursDoctoralRepository(IParcoursDoctoralRepository):
             raise ParcoursDoctoralNonTrouveException
 
         try:
-            parcours_doctoral: ParcoursDoctoralModel = (
-                ParcoursDoctoralModel.objects.select_related(
-                    'student__birth_country',
-                    'international_scholarship',
-                    'training__academic_year',
-                    'training__education_group_type',
-                    'thesis_language',
-                    'thesis_institute',
-                    'defense_language',
-                )
-                .annotate_training_management_entity()
-                .annotate_with_student_registration_id()
-                .annotate_last_status_update()
-                .annotate(
-                    admission_uuid=F('admission__uuid'),
-                )
-                .annotate_secteur_formation()
-                .get(search_filter)
-            )
+            parcours_doctoral: ParcoursDoctoralModel = cls._get_dto_queryset().get(search_filter)
         except ParcoursDoctoralModel.DoesNotExist:
             raise ParcoursDoctoralNonTrouveException
 
-        i18n_fields_names = cls._get_i18n_fields_names()
+        return cls._get_dtos_from_models([parcours_doctoral])[0]
+
+    @classmethod
+    def get_dtos(cls, entity_ids: List['ParcoursDoctoralIdentity']) -> List['ParcoursDoctoralDTO']:
+        if not entity_ids:
+            return []
+
+        doctorates_by_uuid = {
+            str(doctorate.uuid): doctorate
+            for doctorate in cls._get_dto_queryset().filter(uuid__in=[entity_id.uuid for entity_id in entity_ids])
+        }
 
-        campuses = cls.get_teaching_campuses_dtos([parcours_doctoral.training_id])
+        # Keep the order of the identities and ignore the unknown ones
+        doctorates = []
+        for entity_id in entity_ids:
+            doctorate = doctorates_by_uuid.get(str(entity_id.uuid))
+            if doctorate:
+                doctorates.append(doctorate)
 
-        management_entities = cls.get_management_entities_dtos([parcours_doctoral.training.management_entity_id])
-        management_entity = management_entities.get(parcours_doctoral.training.management_entity_id)
+        return cls._get_dtos_from_models(doctorates)
+
+    @classmethod
+    def _get_dto_queryset(cls) -> QuerySet[ParcoursDoctoralModel]:
+        return (
+            ParcoursDoctoralModel.objects.select_related(
+                'student__birth_country',
+                'international_scholarship',
+                'training__academic_year',
+                'training__education_group_type',
+                'thesis_language',
+                'thesis_institute',
+                'defense_language',
+            )
+            .annotate_training_management_entity()
+            .annotate_with_student_registration_id()
+            .annotate_last_status_update()
+            .annotate(
+                admission_uuid=F('admission__uuid'),
+            )
+            .annotate_secteur_formation()
+        )
 
-        last_archive = (
+    @classmethod
+    def _get_last_archives(cls, doctorate_ids: List[int]) -> Dict[int, Document]:
+        # Only the most recent archive of each doctorate is selected (DISTINCT ON)
+        archives = (
             Document.objects.filter(
-                related_doctorate=parcours_doctoral,
+                related_doctorate_id__in=doctorate_ids,
                 document_type=TypeDocument.SYSTEME.name,
                 name=DOCUMENT_ARCHIVE_NAME,
             )
-            .order_by('updated_at')
-            .last()
+            .order_by('related_doctorate_id', '-updated_at')
+            .distinct('related_doctorate_id')
         )
 
+        return {archive.related_doctorate_id: archive for archive in archives}
+
+    @classmethod
+    def _get_dtos_from_models(cls, doctorates: List[ParcoursDoctoralModel]) -> List['ParcoursDoctoralDTO']:
+        i18n_fields_names = cls._get_i18n_fields_names()
+
+        training_ids = []
+        management_entity_ids = []
+        doctorate_ids = []
+        for doctorate in doctorates:
+            training_ids.append(doctorate.training_id)
+            management_entity_ids.append(doctorate.training.management_entity_id)
+            doctorate_ids.append(doctorate.pk)
+
+        campuses = cls.get_teaching_campuses_dtos(training_ids)
+        management_entities = cls.get_management_entities_dtos(management_entity_ids)
+        last_archives = cls._get_last_archives(doctorate_ids) if doctorate_ids else {}
+
+        return [
+            cls._get_dto_from_model(
+                parcours_doctoral=doctorate,
+                i18n_fields_names=i18n_fields_names,
+                campuses=campuses,
+                management_entity=management_entities.get(doctorate.training.management_entity_id),
+                last_archive=last_archives.get(doctorate.pk),
+            )
+            for doctorate in doctorates
+        ]
+
+    @classmethod
+    def _get_dto_from_model(
+        cls,
+        parcours_doctoral: ParcoursDoctoralModel,
+        i18n_fields_names: Dict[str, str],
+        campuses: Dict[int, CampusDTO],
+        management_entity: Optional[EntiteGestionDTO],
+        last_archive: Optional[Document],
+    ) -> 'ParcoursDoctoralDTO':
         return ParcoursDoctoralDTO(
             uuid=str(parcours_doctoral.uuid),
             uuid_admission=str(parcours_doctoral.admission_uuid or ''),  # from annotation
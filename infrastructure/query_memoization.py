@@ -0,0 +1,101 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, Optional
+
+from django.core.signals import request_finished
+from django.dispatch import receiver
+
+from osis_common.ddd import interface
+
+__all__ = [
+    'start_read_query_memoization',
+    'stop_read_query_memoization',
+    'with_read_query_memoization',
+]
+
+# Results of the memoized read queries by query, None if the memoization is not enabled
+_read_query_results: ContextVar[Optional[Dict[interface.QueryRequest, object]]] = ContextVar(
+    'parcours_doctoral_read_query_results',
+    default=None,
+)
+
+
+def start_read_query_memoization():
+    """
+    Enable the memoization of the read queries until the end of the current request. Any other command invoked in the
+    meantime clears the memoized results.
+    """
+    _read_query_results.set({})
+
+
+@receiver(request_finished)
+def stop_read_query_memoization(**kwargs):
+    _read_query_results.set(None)
+
+
+def _memoized_query_handler(handler: Callable) -> Callable:
+    def wrapper(msg_bus, cmd):
+        results = _read_query_results.get()
+        if results is None:
+            return handler(msg_bus, cmd)
+        if cmd not in results:
+            results[cmd] = handler(msg_bus, cmd)
+        return results[cmd]
+
+    return wrapper
+
+
+def _invalidating_command_handler(handler: Callable) -> Callable:
+    def wrapper(msg_bus, cmd):
+        results = _read_query_results.get()
+        if results is None:
+            return handler(msg_bus, cmd)
+        results.clear()
+        try:
+            return handler(msg_bus, cmd)
+        finally:
+            # The queries invoked by the command may have read the data before their update
+            results.clear()
+
+    return wrapper
+
+
+def with_read_query_memoization(command_handlers: Dict[type, Callable], memoized_queries: Iterable[type]) -> Dict:
+    """
+    Return the command handlers whose handlers of the specified read queries are memoized when the memoization is
+    enabled, and whose handlers of the commands clear the memoized results.
+    """
+    memoized_queries = set(memoized_queries)
+    handlers = {}
+    for message_type, handler in command_handlers.items():
+        if message_type in memoized_queries:
+            handlers[message_type] = _memoized_query_handler(handler)
+        elif not issubclass(message_type, interface.QueryRequest):
+            handlers[message_type] = _invalidating_command_handler(handler)
+        else:
+            handlers[message_type] = handler
+    return handlers
@@ -0,0 +1,159 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, Optional, Tuple, Type
+
+from django.db import models
+
+from osis_common.ddd import interface
+
+__all__ = [
+    'UnitOfWork',
+    'get_unit_of_work',
+    'unit_of_work',
+    'with_unit_of_work',
+]
+
+
+class UnitOfWork:
+    """
+    Cache the reference lookups of the repositories and collect their pending writes, to save them in batches.
+    """
+
+    __slots__ = ['_references', '_new_instances', '_dirty_instances']
+
+    def __init__(self):
+        self._references: Dict[Tuple[Type[models.Model], frozenset], models.Model] = {}
+        self._new_instances: Dict[Type[models.Model], list] = defaultdict(list)
+        self._dirty_instances: Dict[Tuple[Type[models.Model], Tuple[str, ...]], dict] = defaultdict(dict)
+
+    def get_reference(self, model: Type[models.Model], **lookup) -> models.Model:
+        """Return the instance matching the lookup, raise the DoesNotExist exception of the model if not found."""
+        key = (model, frozenset(lookup.items()))
+        if key not in self._references:
+            self._references[key] = model.objects.get(**lookup)
+        return self._references[key]
+
+    def get_references(
+        self,
+        model: Type[models.Model],
+        field_name: str,
+        values: Iterable,
+    ) -> Dict[object, models.Model]:
+        """Return the instances whose field matches one of the values, by value. The unknown values are ignored."""
+        values = set(values)
+        missing_values = [
+            value for value in values if (model, frozenset({(field_name, value)})) not in self._references
+        ]
+
+        if missing_values:
+            for instance in model.objects.filter(**{f'{field_name}__in': missing_values}):
+                self._references[(model, frozenset({(field_name, getattr(instance, field_name))}))] = instance
+
+        references = {}
+        for value in values:
+            instance = self._references.get((model, frozenset({(field_name, value)})))
+            if instance is not None:
+                references[value] = instance
+        return references
+
+    def register_new(self, *instances: models.Model):
+        """Create the instances at the next flush."""
+        for instance in instances:
+            self._new_instances[type(instance)].append(instance)
+
+    def register_dirty(self, instance: models.Model, *fields: str):
+        """Update the fields of the instance at the next flush. The instance is updated without sending signals."""
+        self._dirty_instances[(type(instance), tuple(sorted(fields)))][instance.pk] = instance
+
+    def flush(self) -> bool:
+        """Save the pending writes with one query by model and return whether something has been saved."""
+        new_instances, self._new_instances = self._new_instances, defaultdict(list)
+        dirty_instances, self._dirty_instances = self._dirty_instances, defaultdict(dict)
+
+        for model, instances in new_instances.items():
+            model.objects.bulk_create(instances)
+
+        for (model, fields), instances in dirty_instances.items():
+            model.objects.bulk_update(instances.values(), fields)
+
+        return bool(new_instances or dirty_instances)
+
+
+# Unit of work of the command being handled, None if no command is being handled
+_current_unit_of_work: ContextVar[Optional[UnitOfWork]] = ContextVar(
+    'parcours_doctoral_unit_of_work',
+    default=None,
+)
+
+
+def get_unit_of_work() -> UnitOfWork:
+    """
+    Return the unit of work of the command being handled. Outside a command, return a new unit of work whose cache is
+    only shared by the callers using the returned instance.
+    """
+    return _current_unit_of_work.get() or UnitOfWork()
+
+
+@contextmanager
+def unit_of_work():
+    """Share a unit of work until the end of the block, the commands invoked by a command share the same one."""
+    current_unit_of_work = _current_unit_of_work.get()
+    if current_unit_of_work is not None:
+        yield current_unit_of_work
+        return
+
+    current_unit_of_work = UnitOfWork()
+    token = _current_unit_of_work.set(current_unit_of_work)
+    try:
+        yield current_unit_of_work
+        current_unit_of_work.flush()
+    finally:
+        _current_unit_of_work.reset(token)
+
+
+def _unit_of_work_command_handler(handler: Callable) -> Callable:
+    def wrapper(msg_bus, cmd):
+        # No transaction is opened: the writes already saved by a failing command, e.g. the notifications, are kept
+        with unit_of_work():
+            return handler(msg_bus, cmd)
+
+    return wrapper
+
+
+def with_unit_of_work(command_handlers: Dict[type, Callable]) -> Dict:
+    """
+    Return the command handlers whose handlers of the commands share a unit of work. The transaction management of the
+    commands is unchanged, the pending writes of a failing command are discarded.
+    """
+    return {
+        message_type: (
+            handler if issubclass(message_type, interface.QueryRequest) else _unit_of_work_command_handler(handler)
+        )
+        for message_type, handler in command_handlers.items()
+    }
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,11 +24,18 @@
 #
 # ##############################################################################
 
+import datetime
+import uuid
+from collections import defaultdict
+from contextvars import ContextVar
 from email.message import EmailMessage
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
 
 from django.conf import settings
-from django.contrib.auth.models import User
-from django.db.models import Func, Q
+from django.core.cache import cache
+from django.core.signals import request_finished, request_started
+from django.db.models import Q
+from django.dispatch import receiver
 from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 
@@ -38,8 +45,22 @@ from base.models.entity_version import (
 )
 from base.models.enums.entity_type import PEDAGOGICAL_ENTITY_TYPES
 from education_group.contrib.models import EducationGroupRoleModel
+from osis_role import role
 from osis_role.contrib.models import EntityRoleModel
-from osis_role.contrib.permissions import _get_relevant_roles
+
+ENTITY_TREE_CACHE_TIMEOUT = 60 * 60 * 24  # 1 day
+ENTITY_TREE_VERSION_CACHE_KEY = 'parcours_doctoral_entity_tree_version'
+ROLE_ASSIGNMENTS_CACHE_TIMEOUT = 60 * 60 * 24  # 1 day
+ROLE_ASSIGNMENTS_VERSION_CACHE_KEY = 'parcours_doctoral_role_assignments_version'
+
+# Copy of the entity tree in the process memory, along with its version
+_entity_tree_by_version = {}
+
+# Role assignments already read during the current request, by person uuid
+_request_person_role_assignments: ContextVar[Optional[Dict]] = ContextVar(
+    'parcours_doctoral_request_person_role_assignments',
+    default=None,
+)
 
 FORMATTED_EMAIL_FOR_HISTORY = """{sender_label} : {sender}
 {recipient_label} : {recipient}
@@ -80,47 +101,231 @@ def get_message_to_historize(message: EmailMessage) -> dict:
     }
 
 
-def get_entities_with_descendants_ids(entities_acronyms):
+def get_entity_tree() -> Dict[str, Dict]:
+    """
+    Return the hierarchy of the entities, loaded from the entity versions valid today and cached until they change or
+    until the end of the day. A copy is kept in the process memory as long as the shared version doesn't change.
+    :return: a dictionary containing the ids of the pedagogical entities by acronym ('pedagogical_ids_by_acronym'),
+    the ids of the child entities by entity id ('children_ids') and the ids of the parent entities by entity id
+    ('parents_ids')
+    """
+    # The valid entity versions also change with the date
+    version = '{}_{}'.format(
+        cache.get_or_set(ENTITY_TREE_VERSION_CACHE_KEY, lambda: uuid.uuid4().hex, timeout=None),
+        datetime.date.today().isoformat(),
+    )
+
+    if _entity_tree_by_version.get('version') != version:
+        _entity_tree_by_version.clear()
+        _entity_tree_by_version['version'] = version
+        _entity_tree_by_version['tree'] = cache.get_or_set(
+            f'parcours_doctoral_entity_tree_{version}',
+            _load_entity_tree,
+            timeout=ENTITY_TREE_CACHE_TIMEOUT,
+        )
+
+    return _entity_tree_by_version['tree']
+
+
+def invalidate_entity_tree():
+    cache.set(ENTITY_TREE_VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def _load_entity_tree() -> Dict[str, Dict]:
+    tree = {
+        'pedagogical_ids_by_acronym': defaultdict(set),
+        'children_ids': defaultdict(set),
+        'parents_ids': defaultdict(set),
+    }
+
+    today = datetime.date.today()
+    entity_versions = EntityVersion.objects.filter(
+        Q(end_date__isnull=True) | Q(end_date__gte=today),
+        start_date__lte=today,
+    ).values('entity_id', 'parent_id', 'acronym', 'entity_type')
+
+    for entity_version in entity_versions:
+        if (
+            entity_version['entity_type'] in PEDAGOGICAL_ENTITY_TYPES
+            or entity_version['acronym'] in PEDAGOGICAL_ENTITY_ADDED_EXCEPTIONS
+        ):
+            tree['pedagogical_ids_by_acronym'][entity_version['acronym']].add(entity_version['entity_id'])
+
+        if entity_version['parent_id']:
+            tree['children_ids'][entity_version['parent_id']].add(entity_version['entity_id'])
+            tree['parents_ids'][entity_version['entity_id']].add(entity_version['parent_id'])
+
+    return {name: dict(ids_by_key) for name, ids_by_key in tree.items()}
+
+
+def _walk_entity_tree(entities_acronyms, direction: str) -> Set[int]:
+    tree = get_entity_tree()
+
+    entities_ids = set()
+    for acronym in entities_acronyms:
+        entities_ids |= tree['pedagogical_ids_by_acronym'].get(acronym, set())
+
+    entities_to_visit = list(entities_ids)
+    while entities_to_visit:
+        for related_entity_id in tree[direction].get(entities_to_visit.pop(), set()):
+            if related_entity_id not in entities_ids:
+                entities_ids.add(related_entity_id)
+                entities_to_visit.append(related_entity_id)
+
+    return entities_ids
+
+
+def get_entities_with_descendants_ids(entities_acronyms) -> Set[int]:
     """
     From a list of pedagogical entities acronyms, get a set of ids of the entities and their descendants.
     :param entities_acronyms: A list of acronyms of pedagogical entities
     :return: A set of entities ids
     """
     if entities_acronyms:
-        cte = (
-            EntityVersion.objects.filter(acronym__in=entities_acronyms)
-            .filter(Q(entity_type__in=PEDAGOGICAL_ENTITY_TYPES) | Q(acronym__in=PEDAGOGICAL_ENTITY_ADDED_EXCEPTIONS))
-            .with_parents()
-        )
-        qs = cte.queryset().with_cte(cte).annotate(level=Func('parents', function='cardinality'))
-        return set(qs.values_list('entity_id', flat=True))
+        return _walk_entity_tree(entities_acronyms, direction='children_ids')
     return set()
 
 
-def filter_doctorate_queryset_according_to_roles(queryset, person_uuid):
-    user = User.objects.filter(person__uuid=person_uuid).first()
+def get_entities_with_ancestors_ids(entities_acronyms) -> Set[int]:
+    """
+    From a list of pedagogical entities acronyms, get a set of ids of the entities and their ancestors.
+    :param entities_acronyms: A list of acronyms of pedagogical entities
+    :return: A set of entities ids
+    """
+    if entities_acronyms:
+        return _walk_entity_tree(entities_acronyms, direction='parents_ids')
+    return set()
 
-    roles = _get_relevant_roles(user, 'parcours_doctoral.view_parcours_doctoral')
 
-    # Filter managed entities
-    entities_conditions = Q()
-    for entity_aware_role in [r for r in roles if issubclass(r, EntityRoleModel)]:
-        entities_conditions |= Q(
-            training__management_entity_id__in=entity_aware_role.objects.filter(
-                person__uuid=person_uuid
-            ).get_entities_ids()
-        )
+class RoleAssignment(NamedTuple):
+    """
+    Role assigned to a person, with the managed entities (resp. education groups) if the role depends on them, else
+    None.
+    """
+
+    entities_ids: Optional[FrozenSet[int]]
+    education_groups_ids: Optional[FrozenSet[int]]
 
-    # Filter managed education groups
-    education_group_conditions = Q()
-    for education_aware_role in [r for r in roles if issubclass(r, EducationGroupRoleModel)]:
-        education_group_conditions |= Q(
-            training__education_group_id__in=education_aware_role.objects.filter(person__uuid=person_uuid).values_list(
-                'education_group_id'
-            )
+
+@receiver(request_started, dispatch_uid='parcours_doctoral_start_request_person_role_assignments')
+def start_request_person_role_assignments(**kwargs):
+    """Start keeping the role assignments read during the current request."""
+    _request_person_role_assignments.set({})
+
+
+@receiver(request_finished, dispatch_uid='parcours_doctoral_stop_request_person_role_assignments')
+def stop_request_person_role_assignments(**kwargs):
+    _request_person_role_assignments.set(None)
+
+
+def get_person_role_assignments(person_uuid) -> Dict[str, RoleAssignment]:
+    """
+    Return the roles assigned to a person, by label of role model. They are cached until the roles of the person or the
+    entities change, and only read once from the cache during a request.
+    """
+    request_assignments = _request_person_role_assignments.get()
+    if request_assignments is not None and str(person_uuid) in request_assignments:
+        return request_assignments[str(person_uuid)]
+
+    assignments = cache.get_or_set(
+        _get_person_role_assignments_cache_key(person_uuid),
+        lambda: _compute_person_role_assignments(person_uuid),
+        timeout=ROLE_ASSIGNMENTS_CACHE_TIMEOUT,
+    )
+
+    if request_assignments is not None:
+        request_assignments[str(person_uuid)] = assignments
+
+    return assignments
+
+
+def invalidate_person_role_assignments(person_uuid):
+    cache.delete(_get_person_role_assignments_cache_key(person_uuid))
+    request_assignments = _request_person_role_assignments.get()
+    if request_assignments is not None:
+        request_assignments.pop(str(person_uuid), None)
+
+
+def invalidate_all_person_role_assignments():
+    cache.set(ROLE_ASSIGNMENTS_VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+    request_assignments = _request_person_role_assignments.get()
+    if request_assignments is not None:
+        request_assignments.clear()
+
+
+def _get_person_role_assignments_cache_key(person_uuid) -> str:
+    # The version allows to invalidate the roles of every person at once
+    version = cache.get_or_set(ROLE_ASSIGNMENTS_VERSION_CACHE_KEY, lambda: uuid.uuid4().hex, timeout=None)
+    return f'parcours_doctoral_role_assignments_{version}_{person_uuid}'
+
+
+def _compute_person_role_assignments(person_uuid) -> Dict[str, RoleAssignment]:
+    assignments = {}
+
+    for role_model in role.role_manager.roles:
+        role_qs = role_model.objects.filter(person__uuid=person_uuid)
+
+        if not role_qs.exists():
+            continue
+
+        assignments[role_model._meta.label] = RoleAssignment(
+            entities_ids=(frozenset(role_qs.get_entities_ids()) if issubclass(role_model, EntityRoleModel) else None),
+            education_groups_ids=(
+                frozenset(role_qs.values_list('education_group_id', flat=True))
+                if issubclass(role_model, EducationGroupRoleModel)
+                else None
+            ),
         )
 
-    return queryset.filter(entities_conditions, education_group_conditions)
+    return assignments
+
+
+def get_doctorate_visibility_scope(person_uuid) -> Tuple[Optional[List[int]], Optional[List[int]]]:
+    """
+    Resolve the doctorates that a person can view through their roles, from the cached roles of the person.
+    :param person_uuid: the uuid of the person
+    :return: a tuple containing the sorted ids of the managed entities and the sorted ids of the managed education
+    groups. An element is None if the person has no role restricting the doctorates on this criterion.
+    """
+    role_models_by_label = {role_model._meta.label: role_model for role_model in role.role_manager.roles}
+
+    entities_ids = None
+    education_groups_ids = None
+
+    for role_label, assignment in get_person_role_assignments(person_uuid).items():
+        role_model = role_models_by_label.get(role_label)
+        if role_model is None or 'parcours_doctoral.view_parcours_doctoral' not in role_model.rule_set():
+            continue
+
+        # Managed entities
+        if assignment.entities_ids is not None:
+            entities_ids = (entities_ids or set()) | assignment.entities_ids
+
+        # Managed education groups
+        if assignment.education_groups_ids is not None:
+            education_groups_ids = (education_groups_ids or set()) | assignment.education_groups_ids
+
+    return (
+        sorted(entities_ids) if entities_ids is not None else None,
+        sorted(education_groups_ids) if education_groups_ids is not None else None,
+    )
+
+
+def filter_doctorate_queryset_according_to_scope(queryset, scope):
+    """Filter the doctorates according to a visibility scope, as returned by get_doctorate_visibility_scope."""
+    entities_ids, education_groups_ids = scope
+
+    conditions = Q()
+    if entities_ids is not None:
+        conditions &= Q(training__management_entity_id__in=entities_ids)
+    if education_groups_ids is not None:
+        conditions &= Q(training__education_group_id__in=education_groups_ids)
+
+    return queryset.filter(conditions)
+
+
+def filter_doctorate_queryset_according_to_roles(queryset, person_uuid):
+    return filter_doctorate_queryset_according_to_scope(queryset, get_doctorate_visibility_scope(person_uuid))
 
 
 def get_doctorate_training_acronym(doctorate_acronym: str):
@@ -0,0 +1,100 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from collections import defaultdict
+
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from parcours_doctoral.infrastructure.parcours_doctoral.read_view.repository.tableau_bord import (
+    TableauBordRepository,
+)
+from parcours_doctoral.models import DashboardIndicatorCounter, ParcoursDoctoral
+from parcours_doctoral.models.search_row import ParcoursDoctoralSearchRow
+
+
+class Command(BaseCommand):
+    help = 'Check the counters of the dashboard indicators against the doctorate data and rebuild them if asked.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fix',
+            action='store_true',
+            help='Rebuild the counters and the indicators of the search rows if they differ from the data.',
+        )
+
+    def handle(self, *args, **options):
+        indicator_filters = TableauBordRepository.get_counted_doctorate_filters()
+
+        live_values = defaultdict(int)
+        for group in (
+            ParcoursDoctoral.objects.order_by()
+            .values('training__management_entity_id', 'proximity_commission')
+            .annotate(
+                **{
+                    indicator: Count('pk', filter=django_filter)
+                    for indicator, django_filter in indicator_filters.items()
+                }
+            )
+        ):
+            for indicator in indicator_filters:
+                if group[indicator]:
+                    live_values[
+                        (indicator, group['training__management_entity_id'], group['proximity_commission'])
+                    ] += group[indicator]
+
+        counted_values = defaultdict(int)
+        for counter in DashboardIndicatorCounter.objects.all():
+            if counter.count:
+                counted_values[
+                    (counter.indicator, counter.management_entity_id, counter.proximity_commission)
+                ] += counter.count
+
+        differences = sorted(
+            (
+                (key, counted_values.get(key, 0), live_values.get(key, 0))
+                for key in set(live_values) | set(counted_values)
+                if counted_values.get(key, 0) != live_values.get(key, 0)
+            ),
+            key=str,
+        )
+
+        if not differences:
+            self.stdout.write(self.style.SUCCESS('The dashboard counters are up to date.'))
+            return
+
+        for (indicator, management_entity_id, proximity_commission), counted_value, live_value in differences:
+            self.stdout.write(
+                f'{indicator} (entity: {management_entity_id}, commission: {proximity_commission or "-"}): '
+                f'{counted_value} counted instead of {live_value}'
+            )
+
+        if options['fix']:
+            with transaction.atomic():
+                DashboardIndicatorCounter.objects.all().delete()
+                ParcoursDoctoralSearchRow.objects.update(dashboard_indicators=[])
+                ParcoursDoctoralSearchRow.objects.refresh()
+            self.stdout.write(self.style.SUCCESS('The dashboard counters have been rebuilt.'))
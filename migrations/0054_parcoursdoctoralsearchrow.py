@@ -0,0 +1,143 @@
+# Generated by Django 5.2.12 on 2026-10-16 10:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def initialize_the_search_rows(apps, schema_editor):
+    ParcoursDoctoral = apps.get_model("parcours_doctoral", "ParcoursDoctoral")
+    ParcoursDoctoralSearchRow = apps.get_model("parcours_doctoral", "ParcoursDoctoralSearchRow")
+    Activity = apps.get_model("parcours_doctoral", "Activity")
+    ConfirmationPaper = apps.get_model("parcours_doctoral", "ConfirmationPaper")
+    EntityVersion = apps.get_model("base", "EntityVersion")
+
+    doctorates = ParcoursDoctoral.objects.annotate(
+        computed_management_entity_acronym=Subquery(
+            EntityVersion.objects.filter(entity_id=OuterRef("training__management_entity_id"))
+            .order_by("-start_date")
+            .values("acronym")[:1]
+        ),
+        computed_scholarship=Coalesce("international_scholarship__short_name", "other_international_scholarship"),
+        computed_follows_an_additional_training=Exists(
+            Activity.objects.filter(parcours_doctoral_id=OuterRef("pk"), context="COMPLEMENTARY_TRAINING").exclude(
+                Q(category="UCL_COURSE", course_completed=False)
+            )
+        ),
+        computed_validated_credits_number=Coalesce(
+            Subquery(
+                Activity.objects.filter(parcours_doctoral_id=OuterRef("pk"), status="ACCEPTEE")
+                .values("parcours_doctoral_id")
+                .annotate(total=Sum("ects"))
+                .values("total")
+            ),
+            0,
+            output_field=models.DecimalField(),
+        ),
+        computed_active_confirmation_date=Subquery(
+            ConfirmationPaper.objects.filter(parcours_doctoral_id=OuterRef("pk"), is_active=True).values(
+                "confirmation_date"
+            )[:1]
+        ),
+    ).order_by()
+
+    ParcoursDoctoralSearchRow.objects.bulk_create(
+        (
+            ParcoursDoctoralSearchRow(
+                parcours_doctoral_id=doctorate.pk,
+                management_entity_acronym=doctorate.computed_management_entity_acronym or "",
+                scholarship=doctorate.computed_scholarship or "",
+                follows_an_additional_training=doctorate.computed_follows_an_additional_training,
+                validated_credits_number=doctorate.computed_validated_credits_number,
+                active_confirmation_date=doctorate.computed_active_confirmation_date,
+            )
+            for doctorate in doctorates.iterator(chunk_size=1000)
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parcours_doctoral", "0053_alter_activity_type"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ParcoursDoctoralSearchRow",
+            fields=[
+                (
+                    "parcours_doctoral",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="search_row",
+                        serialize=False,
+                        to="parcours_doctoral.parcoursdoctoral",
+                        verbose_name="Doctorate",
+                    ),
+                ),
+                (
+                    "management_entity_acronym",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        max_length=50,
+                        verbose_name="Management entity",
+                    ),
+                ),
+                (
+                    "scholarship",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        max_length=255,
+                        verbose_name="Scholarship",
+                    ),
+                ),
+                (
+                    "follows_an_additional_training",
+                    models.BooleanField(
+                        default=False,
+                        verbose_name="Additional training",
+                    ),
+                ),
+                (
+                    "validated_credits_number",
+                    models.DecimalField(
+                        decimal_places=1,
+                        default=0,
+                        max_digits=5,
+                        verbose_name="Validated credits total",
+                    ),
+                ),
+                (
+                    "active_confirmation_date",
+                    models.DateField(
+                        blank=True,
+                        null=True,
+                        verbose_name="Confirmation exam date",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["scholarship"], name="pd_search_row_scholarship"),
+                    models.Index(fields=["validated_credits_number"], name="pd_search_row_credits"),
+                    models.Index(fields=["active_confirmation_date"], name="pd_search_row_confirmation"),
+                ],
+            },
+        ),
+        migrations.RunPython(
+            code=initialize_the_search_rows,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.12 on 2026-10-16 11:03
+
+import unicodedata
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def normalize_search_text(value):
+    decomposed_value = unicodedata.normalize("NFKD", value)
+    return " ".join(
+        "".join(character for character in decomposed_value if not unicodedata.combining(character)).lower().split()
+    )
+
+
+def initialize_the_search_texts(apps, schema_editor):
+    ParcoursDoctoral = apps.get_model("parcours_doctoral", "ParcoursDoctoral")
+    ParcoursDoctoralSearchRow = apps.get_model("parcours_doctoral", "ParcoursDoctoralSearchRow")
+    Student = apps.get_model("base", "Student")
+
+    doctorates = (
+        ParcoursDoctoral.objects.annotate(
+            student_registration_id=Subquery(
+                Student.objects.filter(person_id=OuterRef("student_id")).values("registration_id")[:1]
+            ),
+        )
+        .order_by()
+        .values_list(
+            "pk",
+            "student__last_name",
+            "student__first_name",
+            "student_registration_id",
+            "thesis_proposed_title",
+            "project_title",
+        )
+    )
+
+    rows = []
+    for pk, *values in doctorates.iterator(chunk_size=1000):
+        rows.append(
+            ParcoursDoctoralSearchRow(
+                parcours_doctoral_id=pk,
+                search_text=normalize_search_text(" ".join(value for value in values if value)),
+            )
+        )
+
+    ParcoursDoctoralSearchRow.objects.bulk_update(rows, fields=["search_text"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parcours_doctoral", "0054_parcoursdoctoralsearchrow"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="parcoursdoctoralsearchrow",
+            name="search_text",
+            field=models.TextField(blank=True, default="", verbose_name="Search text"),
+        ),
+        migrations.RunPython(
+            code=initialize_the_search_texts,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AddIndex(
+            model_name="parcoursdoctoralsearchrow",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_text"], name="pd_search_row_text", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
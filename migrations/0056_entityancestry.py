@@ -0,0 +1,137 @@
+# Generated by Django 5.2.12 on 2026-10-16 21:40
+
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def initialize_the_entity_ancestries(apps, schema_editor):
+    EntityAncestry = apps.get_model("parcours_doctoral", "EntityAncestry")
+    EntityVersion = apps.get_model("base", "EntityVersion")
+
+    versions_by_entity_id = defaultdict(list)
+    parents_ids = defaultdict(set)
+
+    for entity_version in EntityVersion.objects.values(
+        "id",
+        "entity_id",
+        "parent_id",
+        "entity_type",
+        "start_date",
+        "end_date",
+    ):
+        versions_by_entity_id[entity_version["entity_id"]].append(entity_version)
+        if entity_version["parent_id"]:
+            parents_ids[entity_version["entity_id"]].add(entity_version["parent_id"])
+
+    rows = []
+    for entity_id in versions_by_entity_id:
+        depth_by_ancestor_id = {entity_id: 0}
+        ancestors_to_visit = [entity_id]
+        while ancestors_to_visit:
+            current_entity_id = ancestors_to_visit.pop(0)
+            for parent_id in parents_ids[current_entity_id]:
+                if parent_id not in depth_by_ancestor_id:
+                    depth_by_ancestor_id[parent_id] = depth_by_ancestor_id[current_entity_id] + 1
+                    ancestors_to_visit.append(parent_id)
+
+        for ancestor_id, depth in depth_by_ancestor_id.items():
+            for ancestor_version in versions_by_entity_id[ancestor_id]:
+                rows.append(
+                    EntityAncestry(
+                        entity_id=entity_id,
+                        ancestor_id=ancestor_id,
+                        ancestor_version_id=ancestor_version["id"],
+                        ancestor_type=ancestor_version["entity_type"] or "",
+                        depth=depth,
+                        start_date=ancestor_version["start_date"],
+                        end_date=ancestor_version["end_date"],
+                    )
+                )
+
+    EntityAncestry.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0723_delete_learningunitenrollment"),
+        ("parcours_doctoral", "0055_parcoursdoctoralsearchrow_search_text"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EntityAncestry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "ancestor_type",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        max_length=50,
+                        verbose_name="Ancestor type",
+                    ),
+                ),
+                (
+                    "depth",
+                    models.PositiveSmallIntegerField(
+                        verbose_name="Depth",
+                    ),
+                ),
+                (
+                    "start_date",
+                    models.DateField(
+                        blank=True,
+                        null=True,
+                        verbose_name="Start date",
+                    ),
+                ),
+                (
+                    "end_date",
+                    models.DateField(
+                        blank=True,
+                        null=True,
+                        verbose_name="End date",
+                    ),
+                ),
+                (
+                    "ancestor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="base.entity",
+                        verbose_name="Ancestor",
+                    ),
+                ),
+                (
+                    "ancestor_version",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="base.entityversion",
+                        verbose_name="Ancestor version",
+                    ),
+                ),
+                (
+                    "entity",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="base.entity",
+                        verbose_name="Entity",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["entity", "ancestor_type", "depth"], name="pd_entity_ancestry_type"),
+                ],
+            },
+        ),
+        migrations.RunPython(
+            code=initialize_the_entity_ancestries,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.12 on 2026-10-16 22:10
+
+import uuid
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0723_delete_learningunitenrollment"),
+        ("parcours_doctoral", "0056_entityancestry"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SavedSearch",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("uuid", models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ("name", models.CharField(max_length=255, verbose_name="Name")),
+                ("query_params", models.TextField(blank=True, default="", verbose_name="Query parameters")),
+                (
+                    "filters",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        verbose_name="Filters",
+                    ),
+                ),
+                ("language", models.CharField(blank=True, default="", max_length=10, verbose_name="Language")),
+                ("data_version", models.CharField(blank=True, default="", max_length=32, verbose_name="Data version")),
+                ("visibility_scope", models.JSONField(blank=True, null=True, verbose_name="Visibility scope")),
+                (
+                    "visible_doctorates_number",
+                    models.PositiveIntegerField(blank=True, null=True, verbose_name="Number of visible doctorates"),
+                ),
+                ("refreshed_at", models.DateTimeField(blank=True, null=True, verbose_name="Refreshed at")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "person",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="base.person",
+                        verbose_name="Person",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["name"],
+                "constraints": [
+                    models.UniqueConstraint(fields=("person", "name"), name="pd_saved_search_unique_name"),
+                ],
+            },
+        ),
+    ]
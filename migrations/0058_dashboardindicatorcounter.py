@@ -0,0 +1,75 @@
+# Generated by Django 5.2.12 on 2026-10-16 23:02
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0723_delete_learningunitenrollment"),
+        ("parcours_doctoral", "0057_savedsearch"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DashboardIndicatorCounter",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("indicator", models.CharField(max_length=100, verbose_name="Indicator")),
+                (
+                    "proximity_commission",
+                    models.CharField(blank=True, default="", max_length=255, verbose_name="Proximity commission"),
+                ),
+                ("count", models.IntegerField(default=0, verbose_name="Count")),
+                (
+                    "management_entity",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="base.entity",
+                        verbose_name="Management entity",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("indicator", "management_entity", "proximity_commission"),
+                        name="pd_dashboard_counter_unique_key",
+                    ),
+                ],
+            },
+        ),
+        migrations.AddField(
+            model_name="parcoursdoctoralsearchrow",
+            name="management_entity",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="base.entity",
+                verbose_name="Management entity",
+            ),
+        ),
+        migrations.AddField(
+            model_name="parcoursdoctoralsearchrow",
+            name="proximity_commission",
+            field=models.CharField(blank=True, default="", max_length=255, verbose_name="Proximity commission"),
+        ),
+        migrations.AddField(
+            model_name="parcoursdoctoralsearchrow",
+            name="dashboard_indicators",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=100),
+                blank=True,
+                default=list,
+                size=None,
+                verbose_name="Dashboard indicators",
+            ),
+        ),
+    ]
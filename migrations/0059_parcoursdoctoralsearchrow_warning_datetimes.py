@@ -0,0 +1,96 @@
+# Generated by Django 5.2.12 on 2026-10-16 23:41
+
+import datetime
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def initialize_the_warning_datetimes(apps, schema_editor):
+    ParcoursDoctoral = apps.get_model("parcours_doctoral", "ParcoursDoctoral")
+    ParcoursDoctoralSearchRow = apps.get_model("parcours_doctoral", "ParcoursDoctoralSearchRow")
+    ConfirmationPaper = apps.get_model("parcours_doctoral", "ConfirmationPaper")
+
+    doctorates = (
+        ParcoursDoctoral.objects.annotate(
+            active_confirmation_deadline=Subquery(
+                ConfirmationPaper.objects.filter(
+                    parcours_doctoral_id=OuterRef("pk"),
+                    is_active=True,
+                ).values(
+                    "confirmation_deadline"
+                )[:1]
+            ),
+        )
+        .order_by()
+        .values_list(
+            "pk",
+            "created_at",
+            "active_confirmation_deadline",
+            "defense_datetime",
+            "thesis_distribution_authorization__status",
+        )
+    )
+
+    rows = []
+    for pk, created_at, confirmation_deadline, defense_datetime, authorization_status in doctorates.iterator(
+        chunk_size=1000
+    ):
+        confirmation_warning_datetime = None
+        if confirmation_deadline:
+            deadline = datetime.datetime.combine(confirmation_deadline, datetime.time.min, tzinfo=created_at.tzinfo)
+            confirmation_warning_datetime = created_at + (deadline - created_at) * 0.75
+
+        thesis_distribution_warning_datetime = None
+        if defense_datetime and authorization_status in {None, "DIFFUSION_NON_SOUMISE"}:
+            thesis_distribution_warning_datetime = defense_datetime - datetime.timedelta(days=14)
+
+        rows.append(
+            ParcoursDoctoralSearchRow(
+                parcours_doctoral_id=pk,
+                confirmation_warning_datetime=confirmation_warning_datetime,
+                thesis_distribution_warning_datetime=thesis_distribution_warning_datetime,
+            )
+        )
+
+    ParcoursDoctoralSearchRow.objects.bulk_update(
+        rows,
+        fields=["confirmation_warning_datetime", "thesis_distribution_warning_datetime"],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parcours_doctoral", "0058_dashboardindicatorcounter"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="parcoursdoctoralsearchrow",
+            name="confirmation_warning_datetime",
+            field=models.DateTimeField(blank=True, null=True, verbose_name="Confirmation deadline warning date"),
+        ),
+        migrations.AddField(
+            model_name="parcoursdoctoralsearchrow",
+            name="thesis_distribution_warning_datetime",
+            field=models.DateTimeField(
+                blank=True,
+                null=True,
+                verbose_name="Thesis distribution authorization warning date",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="parcoursdoctoralsearchrow",
+            index=models.Index(fields=["confirmation_warning_datetime"], name="pd_search_row_confirm_warning"),
+        ),
+        migrations.AddIndex(
+            model_name="parcoursdoctoralsearchrow",
+            index=models.Index(fields=["thesis_distribution_warning_datetime"], name="pd_search_row_thesis_warning"),
+        ),
+        migrations.RunPython(
+            initialize_the_warning_datetimes,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
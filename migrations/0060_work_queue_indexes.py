@@ -0,0 +1,29 @@
+# Generated by Django 5.2.12 on 2026-10-16 23:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("parcours_doctoral", "0059_parcoursdoctoralsearchrow_warning_datetimes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="parcoursdoctoral",
+            index=models.Index(
+                condition=models.Q(("status__in", ["JURY_APPROUVE_CDD", "CONFIRMATION_SOUMISE"])),
+                fields=["status", "created_at", "id"],
+                name="pd_work_queue_status",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="thesisdistributionauthorization",
+            index=models.Index(
+                condition=models.Q(("status__in", ["DIFFUSION_VALIDEE_PROMOTEUR", "DIFFUSION_VALIDEE_ADRE"])),
+                fields=["status"],
+                name="pd_work_queue_distribution",
+            ),
+        ),
+    ]
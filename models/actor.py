@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,7 +24,9 @@
 #
 # ##############################################################################
 from django.db import models
-from django.db.models import QuerySet
+from django.db.models import Q, QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 from osis_document_components.fields import FileField
 from osis_signature.models import Actor, ActorManager
@@ -113,3 +115,11 @@ class ParcoursDoctoralSupervisionActor(Actor):
         return f'{self.last_name}, {self.first_name}'
 
     objects = ActorManager.from_queryset(ParcoursDoctoralSupervisionActorQuerySet)()
+
+
+@receiver(post_save, sender=ParcoursDoctoralSupervisionActor)
+@receiver(post_delete, sender=ParcoursDoctoralSupervisionActor)
+def _invalidate_permission_object_cache(sender, instance, **kwargs):
+    from parcours_doctoral.utils.cache import invalidate_parcours_doctoral_permission_objects
+
+    invalidate_parcours_doctoral_permission_objects(Q(supervision_group_id=instance.process_id))
@@ -26,6 +26,9 @@
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 
@@ -302,3 +305,11 @@ class CddConfiguration(models.Model):
 
     def __str__(self):  # pragma: no cover
         return f"Configuration for {self.cdd}"
+
+
+@receiver(post_save, sender=CddConfiguration)
+@receiver(post_delete, sender=CddConfiguration)
+def _invalidate_permission_object_cache(sender, instance, **kwargs):
+    from parcours_doctoral.utils.cache import invalidate_parcours_doctoral_permission_objects
+
+    invalidate_parcours_doctoral_permission_objects(Q(training__management_entity_id=instance.cdd_id))
@@ -0,0 +1,107 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from typing import Dict, Optional, Tuple
+
+from django.db import models
+from django.db.models import F, Sum
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+
+from parcours_doctoral.utils.cache import bump_admission_data_version
+
+__all__ = [
+    'DashboardIndicatorCounter',
+]
+
+
+class DashboardIndicatorCounterQuerySet(models.QuerySet):
+    def apply_deltas(self, deltas: Dict[Tuple[str, Optional[int], str], int]):
+        """
+        Add the deltas to the counters.
+        :param deltas: the variations of the counters, by indicator, management entity id and proximity commission
+        """
+        # The counters are always updated in the same order to prevent deadlocks between concurrent transactions
+        for (indicator, management_entity_id, proximity_commission), delta in sorted(deltas.items(), key=str):
+            if not delta:
+                continue
+            counter, _ = self.get_or_create(
+                indicator=indicator,
+                management_entity_id=management_entity_id,
+                proximity_commission=proximity_commission,
+            )
+            self.filter(pk=counter.pk).update(count=F('count') + delta)
+
+    def get_totals(self) -> Dict[str, int]:
+        """Return the sum of the counters by indicator."""
+        return dict(self.order_by().values('indicator').annotate(total=Sum('count')).values_list('indicator', 'total'))
+
+
+class DashboardIndicatorCounter(models.Model):
+    """
+    Number of doctorates matching a dashboard indicator for a management entity and a proximity commission. The
+    counters are updated with the search rows of the doctorates, which contain their current indicators.
+    """
+
+    indicator = models.CharField(
+        verbose_name=_("Indicator"),
+        max_length=100,
+    )
+    management_entity = models.ForeignKey(
+        'base.Entity',
+        verbose_name=_("Management entity"),
+        on_delete=models.CASCADE,
+        related_name='+',
+        null=True,
+        blank=True,
+    )
+    proximity_commission = models.CharField(
+        verbose_name=_("Proximity commission"),
+        max_length=255,
+        default='',
+        blank=True,
+    )
+    count = models.IntegerField(
+        verbose_name=_("Count"),
+        default=0,
+    )
+
+    objects = models.Manager.from_queryset(DashboardIndicatorCounterQuerySet)()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['indicator', 'management_entity', 'proximity_commission'],
+                name='pd_dashboard_counter_unique_key',
+            ),
+        ]
+
+
+@receiver(post_save, sender='admission.DoctorateAdmission')
+@receiver(post_delete, sender='admission.DoctorateAdmission')
+def _bump_admission_data_version(sender, instance, **kwargs):
+    # The admission indicators of the dashboard are cached with this version
+    bump_admission_data_version()
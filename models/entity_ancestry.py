@@ -0,0 +1,220 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+
+from base.models.entity_version import EntityVersion
+
+__all__ = [
+    'EntityAncestry',
+]
+
+
+class EntityAncestryQuerySet(models.QuerySet):
+    def refresh(self, entities_ids: Optional[Iterable[int]] = None, batch_size=1000):
+        """
+        Compute and save the ancestries of the entities.
+        :param entities_ids: the ids of the entities whose ancestries, and the ones of their descendants, must be
+        refreshed (all of them if not specified)
+        :param batch_size: the number of rows saved in a single query
+        """
+        if entities_ids is None:
+            versions_by_entity_id = self._get_versions_by_entity_id(EntityVersion.objects.all())
+            entities_to_refresh = set(versions_by_entity_id)
+        else:
+            entities_to_refresh = self._get_entities_with_descendants(entities_ids)
+            versions_by_entity_id = self._get_versions_with_ancestors(entities_to_refresh)
+
+        rows = []
+        for entity_id in entities_to_refresh:
+            for (ancestor_version_id, depth, start_date, end_date), ancestor_version in self._walk_ancestors(
+                entity_id,
+                versions_by_entity_id,
+            ).items():
+                rows.append(
+                    self.model(
+                        entity_id=entity_id,
+                        ancestor_id=ancestor_version['entity_id'],
+                        ancestor_version_id=ancestor_version_id,
+                        ancestor_type=ancestor_version['entity_type'] or '',
+                        depth=depth,
+                        start_date=start_date,
+                        end_date=end_date,
+                    )
+                )
+
+        with transaction.atomic():
+            if entities_ids is None:
+                self.all().delete()
+            else:
+                self.filter(entity_id__in=entities_to_refresh).delete()
+            self.bulk_create(rows, batch_size=batch_size)
+
+    @staticmethod
+    def _get_versions_by_entity_id(entity_versions):
+        versions_by_entity_id = defaultdict(list)
+        for entity_version in entity_versions.values(
+            'id',
+            'entity_id',
+            'parent_id',
+            'entity_type',
+            'start_date',
+            'end_date',
+        ):
+            versions_by_entity_id[entity_version['entity_id']].append(entity_version)
+        return versions_by_entity_id
+
+    @staticmethod
+    def _get_entities_with_descendants(entities_ids):
+        """Return the specified entities and their descendants, loaded level by level."""
+        entities_with_descendants = set(entities_ids)
+        entities_to_visit = set(entities_with_descendants)
+
+        while entities_to_visit:
+            entities_to_visit = (
+                set(EntityVersion.objects.filter(parent_id__in=entities_to_visit).values_list('entity_id', flat=True))
+                - entities_with_descendants
+            )
+            entities_with_descendants |= entities_to_visit
+
+        return entities_with_descendants
+
+    def _get_versions_with_ancestors(self, entities_ids):
+        """Return the versions of the specified entities and of their ancestors, loaded level by level."""
+        versions_by_entity_id = defaultdict(list)
+        entities_to_visit = set(entities_ids)
+
+        while entities_to_visit:
+            loaded_versions_by_entity_id = self._get_versions_by_entity_id(
+                EntityVersion.objects.filter(entity_id__in=entities_to_visit)
+            )
+            versions_by_entity_id.update(loaded_versions_by_entity_id)
+            entities_to_visit = {
+                entity_version['parent_id']
+                for entity_versions in loaded_versions_by_entity_id.values()
+                for entity_version in entity_versions
+                if entity_version['parent_id']
+            } - set(versions_by_entity_id)
+
+        return versions_by_entity_id
+
+    @staticmethod
+    def _intersect_periods(first_period, second_period):
+        """Return the intersection of two periods (a missing bound is unlimited), or None if it is empty."""
+        start_dates = [start_date for start_date in (first_period[0], second_period[0]) if start_date]
+        end_dates = [end_date for end_date in (first_period[1], second_period[1]) if end_date]
+        start_date = max(start_dates) if start_dates else None
+        end_date = min(end_dates) if end_dates else None
+        if start_date and end_date and start_date > end_date:
+            return None
+        return start_date, end_date
+
+    def _walk_ancestors(self, entity_id, versions_by_entity_id):
+        """
+        Return the versions of the entity and of its ancestors, indexed by the version id, the depth and the period
+        during which the whole path from the entity to the version is valid.
+        """
+        ancestor_versions = {}
+        paths_to_visit = [(entity_id, 0, (None, None), {entity_id})]
+
+        while paths_to_visit:
+            current_entity_id, depth, path_period, visited_entities_ids = paths_to_visit.pop()
+            for entity_version in versions_by_entity_id.get(current_entity_id, []):
+                period = self._intersect_periods(
+                    path_period,
+                    (entity_version['start_date'], entity_version['end_date']),
+                )
+                if period is None:
+                    continue
+                ancestor_versions[(entity_version['id'], depth, *period)] = entity_version
+                parent_id = entity_version['parent_id']
+                if parent_id and parent_id not in visited_entities_ids:
+                    paths_to_visit.append((parent_id, depth + 1, period, visited_entities_ids | {parent_id}))
+
+        return ancestor_versions
+
+
+class EntityAncestry(models.Model):
+    """
+    Closure table of the entity hierarchy: a row links an entity to a version of the entity itself or of one of its
+    ancestors. The rows are refreshed when the entity versions are saved.
+    """
+
+    entity = models.ForeignKey(
+        'base.Entity',
+        verbose_name=_("Entity"),
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    ancestor = models.ForeignKey(
+        'base.Entity',
+        verbose_name=_("Ancestor"),
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    ancestor_version = models.ForeignKey(
+        'base.EntityVersion',
+        verbose_name=_("Ancestor version"),
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    ancestor_type = models.CharField(
+        verbose_name=_("Ancestor type"),
+        max_length=50,
+        default='',
+        blank=True,
+    )
+    depth = models.PositiveSmallIntegerField(
+        verbose_name=_("Depth"),
+    )
+    start_date = models.DateField(
+        verbose_name=_("Start date"),
+        null=True,
+        blank=True,
+    )
+    end_date = models.DateField(
+        verbose_name=_("End date"),
+        null=True,
+        blank=True,
+    )
+
+    objects = models.Manager.from_queryset(EntityAncestryQuerySet)()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['entity', 'ancestor_type', 'depth'], name='pd_entity_ancestry_type'),
+        ]
+
+
+@receiver(post_save, sender=EntityVersion)
+@receiver(post_delete, sender=EntityVersion)
+def _refresh_entity_ancestries(sender, instance, **kwargs):
+    EntityAncestry.objects.refresh(entities_ids=[instance.entity_id])
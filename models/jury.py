@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,6 +24,9 @@
 #
 # ##############################################################################
 from django.db import models
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import pgettext_lazy
 from osis_document_components.fields import FileField
@@ -116,3 +119,11 @@ class JuryActor(Actor):
     @property
     def complete_name(self):
         return f'{self.last_name}, {self.first_name}'
+
+
+@receiver(post_save, sender=JuryActor)
+@receiver(post_delete, sender=JuryActor)
+def _invalidate_permission_object_cache(sender, instance, **kwargs):
+    from parcours_doctoral.utils.cache import invalidate_parcours_doctoral_permission_objects
+
+    invalidate_parcours_doctoral_permission_objects(Q(jury_group_id=instance.process_id))
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -25,8 +25,8 @@
 # ##############################################################################
 import uuid
 from datetime import date
+from typing import Set, Tuple
 
-from django.core.cache import cache
 from django.db import models
 from django.db.models import (
     Case,
@@ -40,7 +40,7 @@ from django.db.models import (
     When,
 )
 from django.db.models.functions import Coalesce, Concat, JSONObject, Mod, Replace
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -60,10 +60,10 @@ from base.models.enums.education_group_types import TrainingType
 from base.models.enums.entity_type import FACULTY, SECTOR
 from base.models.person import Person
 from base.models.student import Student
-from base.utils.cte import CTESubquery
 from epc.models.enums.etat_inscription import EtatInscriptionFormation
 from epc.models.inscription_programme_annuel import InscriptionProgrammeAnnuel
 from osis_profile.constants import JPEG_MIME_TYPE, PNG_MIME_TYPE
+from osis_role.contrib.models import RoleModel
 from parcours_doctoral.ddd.domain.model.enums import (
     ChoixCommissionProximiteCDEouCLSM,
     ChoixCommissionProximiteCDSS,
@@ -74,6 +74,12 @@ from parcours_doctoral.ddd.domain.model.enums import (
 )
 from parcours_doctoral.ddd.jury.domain.model.enums import FormuleDefense
 from parcours_doctoral.ddd.repository.i_parcours_doctoral import CAMPUS_LETTRE_DOSSIER
+from parcours_doctoral.infrastructure.utils import (
+    invalidate_all_person_role_assignments,
+    invalidate_entity_tree,
+    invalidate_person_role_assignments,
+)
+from parcours_doctoral.models.entity_ancestry import EntityAncestry
 from program_management.models.education_group_version import EducationGroupVersion
 
 __all__ = [
@@ -201,32 +207,31 @@ class ParcoursDoctoralQuerySet(models.QuerySet):
             },
         )
 
-    def annotate_faculte_formation(self):
-        cte = EntityVersion.objects.with_children(entity_id=OuterRef("training__management_entity_id"))
-        faculty_subqs = (
-            cte.join(EntityVersion, id=cte.col.id)
-            .with_cte(cte)
-            .filter(entity_type=FACULTY)
+    def _get_training_management_entity_ancestors(self, entity_type):
+        """Return the current versions of the closest ancestors of the specified type of the management entity."""
+        return (
+            EntityAncestry.objects.filter(
+                entity_id=OuterRef("training__management_entity_id"),
+                ancestor_type=entity_type,
+            )
             .exclude(end_date__lte=date.today())
+            .order_by("depth")
         )
 
+    def annotate_faculte_formation(self):
+        faculty_subqs = self._get_training_management_entity_ancestors(FACULTY)
+
         return self.annotate(
-            intitule_faculte_formation=CTESubquery(faculty_subqs.values("title")[:1]),
-            sigle_faculte_formation=CTESubquery(faculty_subqs.values("acronym")[:1]),
+            intitule_faculte_formation=Subquery(faculty_subqs.values("ancestor_version__title")[:1]),
+            sigle_faculte_formation=Subquery(faculty_subqs.values("ancestor_version__acronym")[:1]),
         )
 
     def annotate_secteur_formation(self):
-        cte = EntityVersion.objects.with_children(entity_id=OuterRef("training__management_entity_id"))
-        sector_subqs = (
-            cte.join(EntityVersion, id=cte.col.id)
-            .with_cte(cte)
-            .filter(entity_type=SECTOR)
-            .exclude(end_date__lte=date.today())
-        )
+        sector_subqs = self._get_training_management_entity_ancestors(SECTOR)
 
         return self.annotate(
-            intitule_secteur_formation=CTESubquery(sector_subqs.values("title")[:1]),
-            sigle_secteur_formation=CTESubquery(sector_subqs.values("acronym")[:1]),
+            intitule_secteur_formation=Subquery(sector_subqs.values("ancestor_version__title")[:1]),
+            sigle_secteur_formation=Subquery(sector_subqs.values("ancestor_version__acronym")[:1]),
         )
 
 
@@ -617,6 +622,19 @@ class ParcoursDoctoral(models.Model):
     class Meta:
         verbose_name = _("Doctoral training")
         ordering = ('-created_at',)
+        indexes = [
+            # Work queues of the managers, browsed from the oldest doctorate
+            models.Index(
+                fields=['status', 'created_at', 'id'],
+                condition=Q(
+                    status__in=[
+                        ChoixStatutParcoursDoctoral.JURY_APPROUVE_CDD.name,
+                        ChoixStatutParcoursDoctoral.CONFIRMATION_SOUMISE.name,
+                    ]
+                ),
+                name='pd_work_queue_status',
+            ),
+        ]
         permissions = [
             ('validate_registration', _("Can validate registration")),
             ('approve_jury', _("Can approve jury")),
@@ -643,6 +661,28 @@ class ParcoursDoctoral(models.Model):
             etat_inscription=EtatInscriptionFormation.INSCRIT_AU_ROLE.name,
         )
 
+    @classmethod
+    def retrieve_students_and_education_groups_with_valid_enrolments(
+        cls,
+        students_ids,
+        education_groups_ids,
+        academic_year,
+    ) -> Set[Tuple[int, int]]:
+        """
+        Return the pairs (student id, education group id) of the valid enrolments of the specified students for the
+        specified courses for a specific year or for the year following it.
+        """
+        return set(
+            InscriptionProgrammeAnnuel.objects.filter(
+                programme__offer__education_group_id__in=education_groups_ids,
+                programme__offer__academic_year__year__in=[academic_year, academic_year + 1],
+                programme_cycle__etudiant__person_id__in=students_ids,
+                etat_inscription=EtatInscriptionFormation.INSCRIT_AU_ROLE.name,
+            )
+            .values_list('programme_cycle__etudiant__person_id', 'programme__offer__education_group_id')
+            .distinct()
+        )
+
     @cached_property
     def has_valid_enrollment(self):
         """
@@ -661,9 +701,63 @@ class ParcoursDoctoral(models.Model):
             academic_year=current_academic_year,
         ).exists()
 
+    # The following properties are read by the permission predicates, which also receive the cached permission objects
+    # exposing them (see ParcoursDoctoralPermissionObject)
+    @property
+    def training_management_entity_id(self):
+        return self.training.management_entity_id
+
+    @property
+    def training_education_group_id(self):
+        return self.training.education_group_id
+
+    @property
+    def is_complementary_training_enabled(self):
+        return (
+            hasattr(self.training.management_entity, 'doctorate_config')
+            and self.training.management_entity.doctorate_config.is_complementary_training_enabled
+        )
+
+    @property
+    def thesis_distribution_authorization_status(self):
+        if hasattr(self, 'thesis_distribution_authorization'):
+            return self.thesis_distribution_authorization.status
+
+    @property
+    def supervision_actors(self):
+        from parcours_doctoral.auth.permission_object import (
+            SupervisionActorPermissionData,
+        )
+
+        if not self.supervision_group_id:
+            return ()
+
+        return tuple(
+            SupervisionActorPermissionData(*values)
+            for values in self.supervision_group.actors.order_by('pk').values_list(
+                'person_id',
+                'parcoursdoctoralsupervisionactor__type',
+                'parcoursdoctoralsupervisionactor__is_reference_promoter',
+            )
+        )
+
+    @property
+    def jury_actors(self):
+        from parcours_doctoral.auth.permission_object import JuryActorPermissionData
+
+        if not self.jury_group_id:
+            return ()
+
+        return tuple(
+            JuryActorPermissionData(*values)
+            for values in self.jury_group.actors.order_by('pk').values_list('person_id', 'juryactor__role')
+        )
+
     def save(self, *args, **kwargs) -> None:
         super().save(*args, **kwargs)
-        cache.delete('parcours_doctoral_permission_{}'.format(self.uuid))
+        from parcours_doctoral.utils.cache import bump_parcours_doctoral_permission_versions
+
+        bump_parcours_doctoral_permission_versions([self.uuid])
 
     def __str__(self):
         return str(self.uuid)
@@ -675,19 +769,29 @@ def _invalidate_doctorate_cache(sender, instance, **kwargs):
         instance.education_group_type.category == Categories.TRAINING.name
         and instance.education_group_type.name == TrainingType.PHD.name
     ):  # pragma: no branch
-        keys = [
-            f'parcours_doctoral_permission_{a_uuid}'
-            for a_uuid in ParcoursDoctoral.objects.filter(training_id=instance.pk).values_list('uuid', flat=True)
-        ]
-        if keys:
-            cache.delete_many(keys)
-
-
-@receiver(post_save, sender=Person)
-def _invalidate_candidate_cache(sender, instance, **kwargs):
-    keys = [
-        f'parcours_doctoral_permission_{a_uuid}'
-        for a_uuid in ParcoursDoctoral.objects.filter(student_id=instance.pk).values_list('uuid', flat=True)
-    ]
-    if keys:
-        cache.delete_many(keys)
+        from parcours_doctoral.utils.cache import invalidate_parcours_doctoral_permission_objects
+
+        invalidate_parcours_doctoral_permission_objects(Q(training_id=instance.pk))
+
+
+@receiver(post_delete, sender=ParcoursDoctoral)
+def _invalidate_permission_object_cache(sender, instance, **kwargs):
+    from parcours_doctoral.utils.cache import bump_parcours_doctoral_permission_versions
+
+    bump_parcours_doctoral_permission_versions([instance.uuid])
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def _invalidate_role_assignments_cache(sender, instance, **kwargs):
+    if isinstance(instance, RoleModel):
+        for person_uuid in Person.objects.filter(pk=instance.person_id).values_list('uuid', flat=True):
+            invalidate_person_role_assignments(person_uuid)
+
+
+@receiver(post_save, sender=EntityVersion)
+@receiver(post_delete, sender=EntityVersion)
+def _invalidate_entities_cache(sender, instance, **kwargs):
+    invalidate_entity_tree()
+    # The managed entities may include the descendant entities
+    invalidate_all_person_role_assignments()
@@ -0,0 +1,210 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import datetime
+import uuid
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.http import QueryDict
+from django.urls import reverse
+from django.utils import timezone, translation
+from django.utils.translation import gettext_lazy as _
+
+from parcours_doctoral.infrastructure.utils import (
+    filter_doctorate_queryset_according_to_scope,
+    get_doctorate_visibility_scope,
+)
+from parcours_doctoral.models.parcours_doctoral import ParcoursDoctoral
+from parcours_doctoral.utils.cache import (
+    get_doctorate_data_version,
+    reuse_doctorate_data_version,
+)
+
+__all__ = [
+    'SavedSearch',
+]
+
+# Duration of the transactions whose changes can be committed after the refresh of a search that started later
+CHANGES_COMMIT_MARGIN = datetime.timedelta(minutes=10)
+
+
+class SavedSearchQuerySet(models.QuerySet):
+    def refresh_outdated(self):
+        """
+        Refresh the saved searches whose data or visibility scope have changed. Only the results of the searches whose
+        visible doctorates have changed are computed again.
+        """
+        for saved_search in self.select_related('person'):
+            if not saved_search.is_up_to_date:
+                saved_search.refresh()
+
+
+class SavedSearch(models.Model):
+    """
+    Named filters of the doctorate list saved by a person. Their shared cached results are computed again in
+    background when the doctorates visible to the person or their roles change.
+    """
+
+    uuid = models.UUIDField(
+        default=uuid.uuid4,
+        editable=False,
+        unique=True,
+    )
+    person = models.ForeignKey(
+        'base.Person',
+        verbose_name=_("Person"),
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    name = models.CharField(
+        verbose_name=_("Name"),
+        max_length=255,
+    )
+    query_params = models.TextField(
+        verbose_name=_("Query parameters"),
+        default='',
+        blank=True,
+    )
+    filters = models.JSONField(
+        verbose_name=_("Filters"),
+        default=dict,
+        blank=True,
+        encoder=DjangoJSONEncoder,
+    )
+    language = models.CharField(
+        verbose_name=_("Language"),
+        max_length=10,
+        default='',
+        blank=True,
+    )
+    data_version = models.CharField(
+        verbose_name=_("Data version"),
+        max_length=32,
+        default='',
+        blank=True,
+    )
+    visibility_scope = models.JSONField(
+        verbose_name=_("Visibility scope"),
+        null=True,
+        blank=True,
+    )
+    visible_doctorates_number = models.PositiveIntegerField(
+        verbose_name=_("Number of visible doctorates"),
+        null=True,
+        blank=True,
+    )
+    refreshed_at = models.DateTimeField(
+        verbose_name=_("Refreshed at"),
+        null=True,
+        blank=True,
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+    )
+
+    objects = models.Manager.from_queryset(SavedSearchQuerySet)()
+
+    class Meta:
+        ordering = ['name']
+        constraints = [
+            models.UniqueConstraint(fields=['person', 'name'], name='pd_saved_search_unique_name'),
+        ]
+
+    def __str__(self):
+        return self.name
+
+    def get_absolute_url(self):
+        query_params = QueryDict(self.query_params, mutable=True)
+        query_params['recherche_sauvegardee'] = str(self.uuid)
+        return f"{reverse('parcours_doctoral:list')}?{query_params.urlencode()}"
+
+    @property
+    def query_filters(self):
+        """Return the filters as expected by the doctorate list query."""
+        filters = {**self.filters}
+        if filters.get('dates'):
+            filters['dates'] = [
+                (
+                    date_type,
+                    datetime.date.fromisoformat(start_date) if start_date else None,
+                    datetime.date.fromisoformat(end_date) if end_date else None,
+                )
+                for date_type, start_date, end_date in filters['dates']
+            ]
+        return filters
+
+    @property
+    def is_up_to_date(self):
+        return self.data_version == get_doctorate_data_version() and self.visibility_scope == list(
+            get_doctorate_visibility_scope(self.person.uuid)
+        )
+
+    def refresh(self):
+        """
+        Compute again the first page of the results, which is cached for the doctorate list. The results cached for
+        the previous data version are kept if the doctorates visible to the person have not changed since then.
+        """
+        from base.templatetags.pagination_bs5 import DEFAULT_PAGINATOR_SIZE
+        from infrastructure.messages_bus import message_bus_instance
+        from parcours_doctoral.views.list import ParcoursDoctoralList
+
+        # The version and the date are retrieved first so that the changes made during the search trigger a refresh
+        previous_data_version = self.data_version
+        previous_refreshed_at = self.refreshed_at
+        self.data_version = get_doctorate_data_version()
+        self.refreshed_at = timezone.now()
+
+        visibility_scope = list(get_doctorate_visibility_scope(self.person.uuid))
+        visible_doctorates = filter_doctorate_queryset_according_to_scope(
+            ParcoursDoctoral.objects.all(), visibility_scope
+        )
+        visible_doctorates_number = visible_doctorates.count()
+
+        # The deleted doctorates are detected by their number, and the dashboard indicators depend on the time
+        unchanged_doctorates = (
+            previous_refreshed_at is not None
+            and visibility_scope == self.visibility_scope
+            and visible_doctorates_number == self.visible_doctorates_number
+            and not self.filters.get('indicateur_tableau_bord')
+            and not visible_doctorates.filter(
+                search_row__updated_at__gte=previous_refreshed_at - CHANGES_COMMIT_MARGIN,
+            ).exists()
+        )
+        self.visibility_scope = visibility_scope
+        self.visible_doctorates_number = visible_doctorates_number
+
+        # Same query as the one of the list opening the saved search, so that they share the cached results
+        with translation.override(self.language or settings.LANGUAGE_CODE):
+            with reuse_doctorate_data_version(previous_data_version if unchanged_doctorates else None):
+                message_bus_instance.invoke(
+                    ParcoursDoctoralList.get_list_query(
+                        filters={'taille_page': DEFAULT_PAGINATOR_SIZE, **self.query_filters, 'page': 1},
+                        demandeur=self.person.uuid,
+                    )
+                )
+
+        self.save(update_fields=['data_version', 'visibility_scope', 'visible_doctorates_number', 'refreshed_at'])
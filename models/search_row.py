@@ -0,0 +1,508 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import datetime
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models, transaction
+from django.db.models import Count, Exists, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from base.models.entity_version import EntityVersion
+from base.models.person import Person
+from base.models.student import Student
+from parcours_doctoral.ddd.autorisation_diffusion_these.domain.model.enums import (
+    ChoixStatutAutorisationDiffusionThese,
+)
+from parcours_doctoral.ddd.formation.domain.model.enums import StatutActivite
+from parcours_doctoral.models.activity import Activity
+from parcours_doctoral.models.actor import ParcoursDoctoralSupervisionActor
+from parcours_doctoral.models.admissibility import Admissibility
+from parcours_doctoral.models.confirmation_paper import ConfirmationPaper
+from parcours_doctoral.models.dashboard_indicator_counter import (
+    DashboardIndicatorCounter,
+)
+from parcours_doctoral.models.jury import JuryActor
+from parcours_doctoral.models.parcours_doctoral import ParcoursDoctoral
+from parcours_doctoral.models.private_defense import PrivateDefense
+from parcours_doctoral.models.thesis_distribution_authorization import (
+    ThesisDistributionAuthorization,
+)
+from parcours_doctoral.utils.cache import bump_doctorate_data_version
+from reference.models.scholarship import Scholarship
+
+__all__ = [
+    'ParcoursDoctoralSearchRow',
+]
+
+
+def normalize_search_text(value: Optional[str]) -> str:
+    """Return the text without accents, in lower case and with single spaces, as stored in the search rows."""
+    if not value:
+        return ''
+    decomposed_value = unicodedata.normalize('NFKD', value)
+    return ' '.join(
+        ''.join(character for character in decomposed_value if not unicodedata.combining(character)).lower().split()
+    )
+
+
+class ParcoursDoctoralSearchRowQuerySet(models.QuerySet):
+    def refresh(self, doctorate_filter: Optional[Q] = None, batch_size=1000) -> int:
+        """
+        Compute and save the search rows of the doctorates.
+        :param doctorate_filter: the condition selecting the doctorates to refresh (all of them if not specified)
+        :param batch_size: the number of rows saved in a single query
+        :return: the number of refreshed rows
+        """
+        doctorates = ParcoursDoctoral.objects.all()
+
+        if doctorate_filter is not None:
+            doctorates = doctorates.filter(doctorate_filter).distinct()
+
+        doctorates = (
+            doctorates.annotate_training_management_entity()
+            .annotate_with_student_registration_id()
+            .annotate(
+                computed_scholarship=Coalesce(
+                    'international_scholarship__short_name', 'other_international_scholarship'
+                ),
+                computed_follows_an_additional_training=Exists(
+                    Activity.objects.for_complementary_training_filter().filter(parcours_doctoral_id=OuterRef('pk'))
+                ),
+                computed_validated_credits_number=Coalesce(
+                    Subquery(
+                        Activity.objects.filter(
+                            parcours_doctoral_id=OuterRef('pk'),
+                            status=StatutActivite.ACCEPTEE.name,
+                        )
+                        .values('parcours_doctoral_id')
+                        .annotate(total=Sum('ects'))
+                        .values('total')
+                    ),
+                    0,
+                    output_field=models.DecimalField(),
+                ),
+                computed_active_confirmation_date=Subquery(
+                    ConfirmationPaper.objects.filter(
+                        parcours_doctoral_id=OuterRef('pk'),
+                        is_active=True,
+                    ).values(
+                        'confirmation_date'
+                    )[:1]
+                ),
+                computed_active_confirmation_deadline=Subquery(
+                    ConfirmationPaper.objects.filter(
+                        parcours_doctoral_id=OuterRef('pk'),
+                        is_active=True,
+                    ).values(
+                        'confirmation_deadline'
+                    )[:1]
+                ),
+            )
+            .order_by()
+            .values_list(
+                'pk',
+                'training__management_entity_id',
+                'proximity_commission',
+                'sigle_entite_gestion',
+                'computed_scholarship',
+                'computed_follows_an_additional_training',
+                'computed_validated_credits_number',
+                'computed_active_confirmation_date',
+                'computed_active_confirmation_deadline',
+                'created_at',
+                'defense_datetime',
+                'thesis_distribution_authorization__status',
+                'student__last_name',
+                'student__first_name',
+                'student_registration_id',
+                'thesis_proposed_title',
+                'project_title',
+                named=True,
+            )
+        )
+
+        rows = []
+        refreshed_rows_number = 0
+        for doctorate in doctorates.iterator(chunk_size=batch_size):
+            rows.append(
+                self.model(
+                    parcours_doctoral_id=doctorate.pk,
+                    management_entity_id=doctorate.training__management_entity_id,
+                    management_entity_acronym=doctorate.sigle_entite_gestion or '',
+                    proximity_commission=doctorate.proximity_commission,
+                    scholarship=doctorate.computed_scholarship or '',
+                    follows_an_additional_training=doctorate.computed_follows_an_additional_training,
+                    validated_credits_number=doctorate.computed_validated_credits_number,
+                    active_confirmation_date=doctorate.computed_active_confirmation_date,
+                    confirmation_warning_datetime=self._get_confirmation_warning_datetime(
+                        created_at=doctorate.created_at,
+                        confirmation_deadline=doctorate.computed_active_confirmation_deadline,
+                    ),
+                    thesis_distribution_warning_datetime=self._get_thesis_distribution_warning_datetime(
+                        defense_datetime=doctorate.defense_datetime,
+                        authorization_status=doctorate.thesis_distribution_authorization__status,
+                    ),
+                    search_text=normalize_search_text(
+                        ' '.join(
+                            value
+                            for value in [
+                                doctorate.student__last_name,
+                                doctorate.student__first_name,
+                                doctorate.student_registration_id,
+                                doctorate.thesis_proposed_title,
+                                doctorate.project_title,
+                            ]
+                            if value
+                        )
+                    ),
+                )
+            )
+
+            if len(rows) >= batch_size:
+                self._save_rows(rows)
+                refreshed_rows_number += len(rows)
+                rows = []
+
+        if rows:
+            self._save_rows(rows)
+            refreshed_rows_number += len(rows)
+
+        if refreshed_rows_number:
+            bump_doctorate_data_version()
+
+        return refreshed_rows_number
+
+    def touch(self) -> int:
+        """
+        Mark the rows as updated when a change of their doctorates does not alter their content, but can alter the
+        results of the searches, so that the saved searches depending on them are refreshed.
+        :return: the number of touched rows
+        """
+        touched_rows_number = self.update(updated_at=timezone.now())
+
+        if touched_rows_number:
+            bump_doctorate_data_version()
+
+        return touched_rows_number
+
+    def _save_rows(self, rows):
+        doctorates_ids = [row.parcours_doctoral_id for row in rows]
+
+        with transaction.atomic():
+            # The doctorates are locked so that the concurrent refreshes, including the ones creating the rows, compute
+            # and count the indicators one after the other
+            list(ParcoursDoctoral.objects.select_for_update().filter(pk__in=doctorates_ids).order_by('pk').values('pk'))
+
+            indicators_by_doctorate_id = self._get_dashboard_indicators(doctorates_ids)
+            for row in rows:
+                row.dashboard_indicators = indicators_by_doctorate_id.get(row.parcours_doctoral_id, [])
+
+            previous_rows = self.filter(parcours_doctoral_id__in=doctorates_ids)
+
+            deltas = defaultdict(int)
+            for previous_row in previous_rows:
+                for indicator in previous_row.dashboard_indicators:
+                    deltas[(indicator, previous_row.management_entity_id, previous_row.proximity_commission)] -= 1
+            for row in rows:
+                for indicator in row.dashboard_indicators:
+                    deltas[(indicator, row.management_entity_id, row.proximity_commission)] += 1
+
+            self.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=['parcours_doctoral'],
+                update_fields=[
+                    'management_entity',
+                    'management_entity_acronym',
+                    'proximity_commission',
+                    'scholarship',
+                    'follows_an_additional_training',
+                    'validated_credits_number',
+                    'active_confirmation_date',
+                    'confirmation_warning_datetime',
+                    'thesis_distribution_warning_datetime',
+                    'search_text',
+                    'dashboard_indicators',
+                    'updated_at',
+                ],
+            )
+
+            DashboardIndicatorCounter.objects.apply_deltas(deltas)
+
+    @staticmethod
+    def _get_confirmation_warning_datetime(
+        created_at: datetime.datetime,
+        confirmation_deadline: Optional[datetime.date],
+    ) -> Optional[datetime.datetime]:
+        """Return the date from which the confirmation deadline is considered as approaching (75% of the delay)."""
+        if not confirmation_deadline:
+            return None
+        deadline = datetime.datetime.combine(confirmation_deadline, datetime.time.min, tzinfo=created_at.tzinfo)
+        return created_at + (deadline - created_at) * 0.75
+
+    @staticmethod
+    def _get_thesis_distribution_warning_datetime(
+        defense_datetime: Optional[datetime.datetime],
+        authorization_status: Optional[str],
+    ) -> Optional[datetime.datetime]:
+        """Return the date from which the thesis distribution authorization should have been submitted."""
+        if not defense_datetime or authorization_status not in {
+            None,
+            ChoixStatutAutorisationDiffusionThese.DIFFUSION_NON_SOUMISE.name,
+        }:
+            return None
+        return defense_datetime - datetime.timedelta(days=14)
+
+    @staticmethod
+    def _get_dashboard_indicators(doctorates_ids: Iterable[int]) -> Dict[int, List[str]]:
+        """Return the dashboard indicators that can be counted in advance, by doctorate id."""
+        from parcours_doctoral.infrastructure.parcours_doctoral.read_view.repository.tableau_bord import (
+            TableauBordRepository,
+        )
+
+        indicator_filters = TableauBordRepository.get_counted_doctorate_filters()
+
+        doctorates = (
+            ParcoursDoctoral.objects.filter(pk__in=doctorates_ids)
+            .order_by()
+            .values('pk')
+            .annotate(
+                **{
+                    indicator: Count('pk', filter=django_filter)
+                    for indicator, django_filter in indicator_filters.items()
+                }
+            )
+        )
+
+        return {
+            doctorate['pk']: [indicator for indicator in indicator_filters if doctorate[indicator]]
+            for doctorate in doctorates
+        }
+
+
+class ParcoursDoctoralSearchRow(models.Model):
+    """
+    Read model of a doctorate containing the computed data used to search, filter and sort the doctorates.
+    The rows are refreshed when the related data are saved.
+    """
+
+    parcours_doctoral = models.OneToOneField(
+        'parcours_doctoral.ParcoursDoctoral',
+        verbose_name=_("Doctorate"),
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='search_row',
+    )
+    management_entity = models.ForeignKey(
+        'base.Entity',
+        verbose_name=_("Management entity"),
+        on_delete=models.SET_NULL,
+        related_name='+',
+        null=True,
+        blank=True,
+    )
+    management_entity_acronym = models.CharField(
+        verbose_name=_("Management entity"),
+        max_length=50,
+        default='',
+        blank=True,
+    )
+    scholarship = models.CharField(
+        verbose_name=_("Scholarship"),
+        max_length=255,
+        default='',
+        blank=True,
+    )
+    follows_an_additional_training = models.BooleanField(
+        verbose_name=_("Additional training"),
+        default=False,
+    )
+    validated_credits_number = models.DecimalField(
+        verbose_name=_("Validated credits total"),
+        max_digits=5,
+        decimal_places=1,
+        default=0,
+    )
+    active_confirmation_date = models.DateField(
+        verbose_name=_("Confirmation exam date"),
+        null=True,
+        blank=True,
+    )
+    confirmation_warning_datetime = models.DateTimeField(
+        verbose_name=_("Confirmation deadline warning date"),
+        null=True,
+        blank=True,
+    )
+    thesis_distribution_warning_datetime = models.DateTimeField(
+        verbose_name=_("Thesis distribution authorization warning date"),
+        null=True,
+        blank=True,
+    )
+    search_text = models.TextField(
+        verbose_name=_("Search text"),
+        default='',
+        blank=True,
+    )
+    proximity_commission = models.CharField(
+        verbose_name=_("Proximity commission"),
+        max_length=255,
+        default='',
+        blank=True,
+    )
+    dashboard_indicators = ArrayField(
+        base_field=models.CharField(max_length=100),
+        verbose_name=_("Dashboard indicators"),
+        default=list,
+        blank=True,
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+    )
+
+    objects = models.Manager.from_queryset(ParcoursDoctoralSearchRowQuerySet)()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['scholarship'], name='pd_search_row_scholarship'),
+            models.Index(fields=['validated_credits_number'], name='pd_search_row_credits'),
+            models.Index(fields=['active_confirmation_date'], name='pd_search_row_confirmation'),
+            models.Index(fields=['confirmation_warning_datetime'], name='pd_search_row_confirm_warning'),
+            models.Index(fields=['thesis_distribution_warning_datetime'], name='pd_search_row_thesis_warning'),
+            GinIndex(fields=['search_text'], name='pd_search_row_text', opclasses=['gin_trgm_ops']),
+        ]
+
+
+@receiver(post_save, sender=ParcoursDoctoral)
+def _refresh_doctorate_search_row(sender, instance, **kwargs):
+    ParcoursDoctoralSearchRow.objects.refresh(Q(pk=instance.pk))
+
+
+@receiver(post_save, sender=Activity)
+@receiver(post_save, sender=ConfirmationPaper)
+@receiver(post_save, sender=PrivateDefense)
+@receiver(post_save, sender=Admissibility)
+@receiver(post_save, sender=ThesisDistributionAuthorization)
+def _refresh_doctorate_search_row_from_related_object(sender, instance, **kwargs):
+    ParcoursDoctoralSearchRow.objects.refresh(Q(pk=instance.parcours_doctoral_id))
+
+
+@receiver(post_delete, sender=Activity)
+@receiver(post_delete, sender=ConfirmationPaper)
+@receiver(post_delete, sender=PrivateDefense)
+@receiver(post_delete, sender=Admissibility)
+@receiver(post_delete, sender=ThesisDistributionAuthorization)
+def _refresh_doctorate_search_row_from_deleted_related_object(sender, instance, origin=None, **kwargs):
+    # The row is deleted with the doctorate, and its counted indicators must stay the ones removed with it
+    origin_model = origin.model if isinstance(origin, models.QuerySet) else type(origin)
+    if origin_model is ParcoursDoctoral:
+        return
+
+    # Only update the existing row as the doctorate may be being deleted too
+    ParcoursDoctoralSearchRow.objects.refresh(Q(pk=instance.parcours_doctoral_id, search_row__isnull=False))
+
+
+def _refresh_doctorate_search_rows_from_shared_object(doctorate_filter: Q, update_fields, searched_fields):
+    """
+    Refresh the search rows of the doctorates related to a saved object that is shared with the rest of OSIS, only if
+    the saved fields can be searched and if some doctorates are concerned.
+    """
+    if update_fields is not None and not searched_fields.intersection(update_fields):
+        return
+
+    if ParcoursDoctoral.objects.filter(doctorate_filter).exists():
+        ParcoursDoctoralSearchRow.objects.refresh(doctorate_filter)
+
+
+@receiver(post_save, sender=Person)
+def _refresh_doctorate_search_rows_from_person(sender, instance, update_fields=None, **kwargs):
+    _refresh_doctorate_search_rows_from_shared_object(
+        doctorate_filter=Q(student_id=instance.pk),
+        update_fields=update_fields,
+        searched_fields={'last_name', 'first_name'},
+    )
+
+
+@receiver(post_save, sender=Student)
+def _refresh_doctorate_search_rows_from_student(sender, instance, update_fields=None, **kwargs):
+    _refresh_doctorate_search_rows_from_shared_object(
+        doctorate_filter=Q(student_id=instance.person_id),
+        update_fields=update_fields,
+        searched_fields={'registration_id', 'person', 'person_id'},
+    )
+
+
+@receiver(post_save, sender=Scholarship)
+def _refresh_doctorate_search_rows_from_scholarship(sender, instance, update_fields=None, **kwargs):
+    _refresh_doctorate_search_rows_from_shared_object(
+        doctorate_filter=Q(international_scholarship_id=instance.pk),
+        update_fields=update_fields,
+        searched_fields={'short_name'},
+    )
+
+
+@receiver(post_save, sender=EntityVersion)
+def _refresh_doctorate_search_rows_from_entity_version(sender, instance, update_fields=None, **kwargs):
+    _refresh_doctorate_search_rows_from_shared_object(
+        doctorate_filter=Q(training__management_entity_id=instance.entity_id),
+        update_fields=update_fields,
+        searched_fields={'acronym', 'start_date', 'end_date', 'entity', 'entity_id'},
+    )
+
+
+@receiver(post_delete, sender=ParcoursDoctoral)
+def _bump_doctorate_data_version(sender, instance, **kwargs):
+    # The other changes are covered by the refresh of the search rows
+    bump_doctorate_data_version()
+
+
+@receiver(post_save, sender=ParcoursDoctoralSupervisionActor)
+@receiver(post_delete, sender=ParcoursDoctoralSupervisionActor)
+def _touch_doctorate_search_row_from_supervision_actor(sender, instance, **kwargs):
+    ParcoursDoctoralSearchRow.objects.filter(parcours_doctoral__supervision_group_id=instance.process_id).touch()
+
+
+@receiver(post_save, sender=JuryActor)
+@receiver(post_delete, sender=JuryActor)
+def _touch_doctorate_search_row_from_jury_actor(sender, instance, **kwargs):
+    ParcoursDoctoralSearchRow.objects.filter(parcours_doctoral__jury_group_id=instance.process_id).touch()
+
+
+@receiver(post_delete, sender=ParcoursDoctoralSearchRow)
+def _remove_deleted_doctorate_from_dashboard_counters(sender, instance, **kwargs):
+    DashboardIndicatorCounter.objects.apply_deltas(
+        {
+            (indicator, instance.management_entity_id, instance.proximity_commission): -1
+            for indicator in instance.dashboard_indicators
+        }
+    )
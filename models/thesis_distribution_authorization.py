@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -25,6 +25,9 @@
 # ##############################################################################
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 from osis_signature.contrib.fields import SignatureProcessField
 from osis_signature.models import Actor
@@ -119,6 +122,21 @@ class ThesisDistributionAuthorization(models.Model):
 
     signature_group = SignatureProcessField()
 
+    class Meta:
+        indexes = [
+            # Work queues of the ADRE and SCEB managers
+            models.Index(
+                fields=['status'],
+                condition=models.Q(
+                    status__in=[
+                        ChoixStatutAutorisationDiffusionThese.DIFFUSION_VALIDEE_PROMOTEUR.name,
+                        ChoixStatutAutorisationDiffusionThese.DIFFUSION_VALIDEE_ADRE.name,
+                    ]
+                ),
+                name='pd_work_queue_distribution',
+            ),
+        ]
+
 
 class ThesisDistributionAuthorizationActor(Actor):
     """This model extends Actor from OSIS-Signature"""
@@ -139,3 +157,11 @@ class ThesisDistributionAuthorizationActor(Actor):
         blank=True,
         verbose_name=_('Grounds for denied'),
     )
+
+
+@receiver(post_save, sender=ThesisDistributionAuthorization)
+@receiver(post_delete, sender=ThesisDistributionAuthorization)
+def _invalidate_permission_object_cache(sender, instance, **kwargs):
+    from parcours_doctoral.utils.cache import invalidate_parcours_doctoral_permission_objects
+
+    invalidate_parcours_doctoral_permission_objects(Q(pk=instance.parcours_doctoral_id))
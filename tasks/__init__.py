@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2022 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -27,13 +27,17 @@
 from celery.schedules import crontab
 
 from backoffice.celery import app as celery_app
-from . import process_parcours_doctoral_tasks
+from . import process_parcours_doctoral_tasks, refresh_saved_searches
 
 tasks = {
     '|Parcours doctoral| Process tasks': {
         'task': 'parcours_doctoral.tasks.process_parcours_doctoral_tasks.run',
         'schedule': crontab(),  # this runs every minute
     },
+    '|Parcours doctoral| Refresh saved searches': {
+        'task': 'parcours_doctoral.tasks.refresh_saved_searches.run',
+        'schedule': crontab(minute='*/5'),  # this runs every 5 minutes
+    },
 }
 
 celery_app.conf.beat_schedule.update(tasks)
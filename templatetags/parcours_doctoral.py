@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -48,7 +48,7 @@ from osis_profile.utils.utils import (
     format_school_title,
     get_superior_institute_queryset,
 )
-from parcours_doctoral.auth.constants import READ_ACTIONS_BY_TAB, UPDATE_ACTIONS_BY_TAB
+from parcours_doctoral.auth.tab_permissions import get_tab_permissions
 from parcours_doctoral.constants import CAMPUSES_UUIDS
 from parcours_doctoral.ddd.domain.model.enums import (
     STATUTS_PAR_ETAPE_PARCOURS_DOCTORAL,
@@ -172,6 +172,8 @@ def get_valid_tab_tree(context, permission_obj, tab_tree):
     """
     valid_tab_tree = {}
 
+    tab_permissions = get_tab_permissions(context['request'], permission_obj)
+
     # Some tabs are temporary hidden depending on a switch
     doctorate_limited_tabs = waffle.switch_is_active('parcours_doctoral_limited_tabs')
 
@@ -190,7 +192,7 @@ def get_valid_tab_tree(context, permission_obj, tab_tree):
             continue
 
         # Get the accessible sub tabs depending on the user permissions
-        valid_sub_tabs = [tab for tab in sub_tabs if can_read_tab(context, tab.name, permission_obj)]
+        valid_sub_tabs = [tab for tab in sub_tabs if tab_permissions.can_read(tab.name)]
 
         # Only add the parent tab if at least one sub tab is allowed
         if len(valid_sub_tabs) > 0:
@@ -217,9 +219,9 @@ def subtabs_bar(context):
 @register.simple_tag(takes_context=True)
 def current_subtabs(context):
     tab_context = default_tab_context(context)
-    permission_obj = context['view'].get_permission_object()
+    tab_permissions = get_tab_permissions(context['request'], context['view'].get_permission_object())
     tab_context['subtabs'] = (
-        [tab for tab in TAB_TREE[tab_context['active_parent']] if can_read_tab(context, tab.name, permission_obj)]
+        [tab for tab in TAB_TREE[tab_context['active_parent']] if tab_permissions.can_read(tab.name)]
         if tab_context['active_parent']
         else []
     )
@@ -235,14 +237,18 @@ def has_perm(context, perm, obj=None):
 
 @register.simple_tag(takes_context=True)
 def can_read_tab(context, tab_name, obj=None):
-    """Return true if the specified tab can be opened in reading mode for this parcours_doctoral, otherwise return False"""
-    return has_perm(context, READ_ACTIONS_BY_TAB[tab_name], obj)
+    """Return True if the specified tab can be opened in reading mode for this parcours_doctoral, else False."""
+    if not obj:
+        obj = context['view'].get_permission_object()
+    return get_tab_permissions(context['request'], obj).can_read(tab_name)
 
 
 @register.simple_tag(takes_context=True)
 def can_update_tab(context, tab_name, obj=None):
-    """Return true if the specified tab can be opened in update mode for this parcours_doctoral, otherwise return False"""
-    return has_perm(context, UPDATE_ACTIONS_BY_TAB[tab_name], obj)
+    """Return True if the specified tab can be opened in update mode for this parcours_doctoral, else False."""
+    if not obj:
+        obj = context['view'].get_permission_object()
+    return get_tab_permissions(context['request'], obj).can_update(tab_name)
 
 
 @register.simple_tag(takes_context=True)
@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -23,8 +23,10 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+from unittest.mock import patch
 
 import freezegun
+from django.contrib.auth.models import User
 from django.shortcuts import resolve_url
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -187,6 +189,17 @@ class SupervisedDoctorateListViewTestCase(QueriesAssertionsMixin, APITestCase):
 
         self.assertEqual(second_doctorate['uuid'], str(self.second_doctorate.uuid))
 
+    def test_list_with_promoter_checks_each_permission_once(self):
+        self.client.force_authenticate(user=self.promoter.person.user)
+
+        with patch.object(User, 'has_perm', autospec=True, side_effect=User.has_perm) as has_perm:
+            response = self.client.get(self.url, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        object_checks = [call.args[1:3] for call in has_perm.call_args_list if len(call.args) > 2]
+        self.assertEqual(len(object_checks), len(set(object_checks)))
+
     def test_list_with_ca_member(self):
         self.client.force_authenticate(user=self.committee_member.person.user)
 
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -26,6 +26,7 @@
 
 from unittest import mock, skip
 
+from django.db.models import Q
 from django.test import TestCase
 
 from base.tests.factories.entity import EntityFactory
@@ -33,9 +34,15 @@ from epc.models.enums.etat_inscription import EtatInscriptionFormation
 from epc.tests.factories.inscription_programme_annuel import (
     InscriptionProgrammeAnnuelFactory,
 )
+from parcours_doctoral.auth.permission_object import ParcoursDoctoralPermissionObject
 from parcours_doctoral.auth.predicates import (
     parcours_doctoral as parcours_doctoral_predicates,
 )
+from parcours_doctoral.auth.predicates.memo import (
+    get_predicate_memo,
+    start_predicate_memo,
+    stop_predicate_memo,
+)
 from parcours_doctoral.auth.roles.cdd_configurator import CddConfigurator
 from parcours_doctoral.ddd.domain.model.enums import ChoixStatutParcoursDoctoral
 from parcours_doctoral.models import ParcoursDoctoral
@@ -148,3 +155,58 @@ class PredicatesTestCase(TestCase):
         enrolment.save()
 
         self.assertTrue(parcours_doctoral_predicates.is_parcours_doctoral_student(doctorate.student.user, doctorate))
+
+    def test_role_predicates_are_memoized_during_the_request_for_the_permission_objects(self):
+        doctoral_commission = EntityFactory()
+        doctorate = ParcoursDoctoralFactory(training__management_entity=doctoral_commission)
+        manager = CddConfiguratorFactory(entity=doctoral_commission)
+        user = manager.person.user
+        permission_object = ParcoursDoctoralPermissionObject.load(Q(pk=doctorate.pk))[str(doctorate.uuid)]
+        self.predicate_context_patcher.target.context['role_qs'] = CddConfigurator.objects.filter(
+            person=manager.person
+        )
+
+        start_predicate_memo()
+        self.addCleanup(stop_predicate_memo)
+
+        self.assertTrue(parcours_doctoral_predicates.is_part_of_doctoral_commission(user, permission_object))
+        self.assertTrue(parcours_doctoral_predicates.is_part_of_doctoral_commission(user, permission_object))
+
+        memo = get_predicate_memo()
+        self.assertEqual(memo.misses, 1)
+        self.assertEqual(memo.hits, 1)
+
+        # The predicates only comparing attributes are not memoized
+        self.assertFalse(parcours_doctoral_predicates.is_jury_in_progress(user, permission_object))
+        self.assertEqual(memo.misses, 1)
+
+        # Another version of the doctorate is computed again
+        doctorate.status = ChoixStatutParcoursDoctoral.JURY_SOUMIS.name
+        doctorate.save()
+        permission_object = ParcoursDoctoralPermissionObject.load(Q(pk=doctorate.pk))[str(doctorate.uuid)]
+
+        self.assertTrue(parcours_doctoral_predicates.is_part_of_doctoral_commission(user, permission_object))
+        self.assertEqual(memo.misses, 2)
+        self.assertEqual(memo.hits, 1)
+
+        # The memo is dropped at the end of the request
+        stop_predicate_memo()
+        self.assertIsNone(get_predicate_memo())
+        self.assertTrue(parcours_doctoral_predicates.is_part_of_doctoral_commission(user, permission_object))
+
+    def test_role_predicates_are_not_memoized_for_the_models(self):
+        doctoral_commission = EntityFactory()
+        doctorate = ParcoursDoctoralFactory(training__management_entity=doctoral_commission)
+        manager = CddConfiguratorFactory(entity=doctoral_commission)
+        self.predicate_context_patcher.target.context['role_qs'] = CddConfigurator.objects.filter(
+            person=manager.person
+        )
+
+        start_predicate_memo()
+        self.addCleanup(stop_predicate_memo)
+
+        self.assertTrue(parcours_doctoral_predicates.is_part_of_doctoral_commission(manager.person.user, doctorate))
+
+        memo = get_predicate_memo()
+        self.assertEqual(memo.misses, 0)
+        self.assertEqual(memo.hits, 0)
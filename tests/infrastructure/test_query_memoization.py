@@ -0,0 +1,105 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from unittest.mock import Mock
+
+import attr
+from django.test import SimpleTestCase
+
+from osis_common.ddd import interface
+from parcours_doctoral.infrastructure.query_memoization import (
+    start_read_query_memoization,
+    stop_read_query_memoization,
+    with_read_query_memoization,
+)
+
+
+@attr.dataclass(frozen=True, slots=True)
+class _ReadQuery(interface.QueryRequest):
+    uuid: str
+
+
+@attr.dataclass(frozen=True, slots=True)
+class _OtherReadQuery(interface.QueryRequest):
+    uuid: str
+
+
+@attr.dataclass(frozen=True, slots=True)
+class _WriteCommand(interface.CommandRequest):
+    uuid: str
+
+
+class ReadQueryMemoizationTestCase(SimpleTestCase):
+    def setUp(self):
+        self.read_handler = Mock(side_effect=lambda msg_bus, cmd: object())
+        self.other_read_handler = Mock(side_effect=lambda msg_bus, cmd: object())
+        self.write_handler = Mock()
+        self.handlers = with_read_query_memoization(
+            {
+                _ReadQuery: self.read_handler,
+                _OtherReadQuery: self.other_read_handler,
+                _WriteCommand: self.write_handler,
+            },
+            memoized_queries=[_ReadQuery],
+        )
+        self.addCleanup(stop_read_query_memoization)
+
+    def test_queries_are_not_memoized_by_default(self):
+        first_result = self.handlers[_ReadQuery](None, _ReadQuery(uuid='a'))
+        second_result = self.handlers[_ReadQuery](None, _ReadQuery(uuid='a'))
+
+        self.assertIsNot(first_result, second_result)
+        self.assertEqual(self.read_handler.call_count, 2)
+
+    def test_memoized_queries(self):
+        start_read_query_memoization()
+
+        first_result = self.handlers[_ReadQuery](None, _ReadQuery(uuid='a'))
+        self.assertIs(self.handlers[_ReadQuery](None, _ReadQuery(uuid='a')), first_result)
+        self.assertIsNot(self.handlers[_ReadQuery](None, _ReadQuery(uuid='b')), first_result)
+        self.assertEqual(self.read_handler.call_count, 2)
+
+        # Only the specified queries are memoized
+        self.handlers[_OtherReadQuery](None, _OtherReadQuery(uuid='a'))
+        self.handlers[_OtherReadQuery](None, _OtherReadQuery(uuid='a'))
+        self.assertEqual(self.other_read_handler.call_count, 2)
+
+    def test_memoized_queries_are_cleared_by_the_commands(self):
+        start_read_query_memoization()
+
+        first_result = self.handlers[_ReadQuery](None, _ReadQuery(uuid='a'))
+        self.handlers[_WriteCommand](None, _WriteCommand(uuid='a'))
+
+        self.assertIsNot(self.handlers[_ReadQuery](None, _ReadQuery(uuid='a')), first_result)
+        self.assertEqual(self.read_handler.call_count, 2)
+        self.assertEqual(self.write_handler.call_count, 1)
+
+    def test_memoized_queries_are_cleared_at_the_end_of_the_request(self):
+        start_read_query_memoization()
+
+        first_result = self.handlers[_ReadQuery](None, _ReadQuery(uuid='a'))
+        stop_read_query_memoization()
+
+        self.assertIsNot(self.handlers[_ReadQuery](None, _ReadQuery(uuid='a')), first_result)
@@ -0,0 +1,140 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from unittest.mock import Mock
+
+from django.test import TestCase
+
+from osis_common.ddd import interface
+from parcours_doctoral.infrastructure.unit_of_work import (
+    get_unit_of_work,
+    unit_of_work,
+    with_unit_of_work,
+)
+from reference.models.language import Language
+from reference.tests.factories.language import LanguageFactory
+
+
+class UnitOfWorkTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.french = LanguageFactory(code='FR')
+        cls.english = LanguageFactory(code='EN')
+
+    def test_get_reference_is_cached(self):
+        current_unit_of_work = get_unit_of_work()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(current_unit_of_work.get_reference(Language, code='FR'), self.french)
+            self.assertEqual(current_unit_of_work.get_reference(Language, code='FR'), self.french)
+
+        with self.assertRaises(Language.DoesNotExist):
+            current_unit_of_work.get_reference(Language, code='XX')
+
+    def test_get_references_are_loaded_at_once(self):
+        current_unit_of_work = get_unit_of_work()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                current_unit_of_work.get_references(Language, 'code', ['FR', 'EN', 'XX']),
+                {'FR': self.french, 'EN': self.english},
+            )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(current_unit_of_work.get_reference(Language, code='EN'), self.english)
+            self.assertEqual(current_unit_of_work.get_references(Language, 'code', ['FR']), {'FR': self.french})
+
+    def test_flush_pending_writes(self):
+        current_unit_of_work = get_unit_of_work()
+
+        self.assertFalse(current_unit_of_work.flush())
+
+        current_unit_of_work.register_new(LanguageFactory.build(code='DE'), LanguageFactory.build(code='NL'))
+        self.french.name = 'Français'
+        self.english.name = 'Anglais'
+        current_unit_of_work.register_dirty(self.french, 'name')
+        current_unit_of_work.register_dirty(self.english, 'name')
+
+        with self.assertNumQueries(2):
+            self.assertTrue(current_unit_of_work.flush())
+
+        self.assertEqual(Language.objects.filter(code__in=['DE', 'NL']).count(), 2)
+        self.french.refresh_from_db()
+        self.assertEqual(self.french.name, 'Français')
+        self.english.refresh_from_db()
+        self.assertEqual(self.english.name, 'Anglais')
+
+        # The pending writes are only saved once
+        with self.assertNumQueries(0):
+            self.assertFalse(current_unit_of_work.flush())
+
+    def test_unit_of_work_is_shared_during_the_scope(self):
+        self.assertIsNot(get_unit_of_work(), get_unit_of_work())
+
+        with unit_of_work() as current_unit_of_work:
+            self.assertIs(get_unit_of_work(), current_unit_of_work)
+
+            with unit_of_work() as nested_unit_of_work:
+                self.assertIs(nested_unit_of_work, current_unit_of_work)
+
+            current_unit_of_work.register_new(LanguageFactory.build(code='DE'))
+
+        # The pending writes are saved at the end of the scope
+        self.assertTrue(Language.objects.filter(code='DE').exists())
+        self.assertIsNot(get_unit_of_work(), current_unit_of_work)
+
+    def test_with_unit_of_work(self):
+        query_type = type('Query', (interface.QueryRequest,), {})
+        command_type = type('Command', (interface.CommandRequest,), {})
+        query_handler = Mock(side_effect=lambda msg_bus, cmd: (get_unit_of_work(), get_unit_of_work()))
+        command_handler = Mock(side_effect=lambda msg_bus, cmd: (get_unit_of_work(), get_unit_of_work()))
+
+        handlers = with_unit_of_work({query_type: query_handler, command_type: command_handler})
+
+        # The queries do not share a unit of work
+        self.assertIs(handlers[query_type], query_handler)
+        first_unit_of_work, second_unit_of_work = handlers[query_type](None, None)
+        self.assertIsNot(first_unit_of_work, second_unit_of_work)
+
+        # The commands share a unit of work
+        first_unit_of_work, second_unit_of_work = handlers[command_type](None, None)
+        self.assertIs(first_unit_of_work, second_unit_of_work)
+
+    def test_commands_are_not_wrapped_in_a_transaction(self):
+        command_type = type('Command', (interface.CommandRequest,), {})
+
+        def command_handler(msg_bus, cmd):
+            LanguageFactory(code='DE')
+            get_unit_of_work().register_new(LanguageFactory.build(code='NL'))
+            raise ValueError
+
+        handlers = with_unit_of_work({command_type: command_handler})
+
+        with self.assertRaises(ValueError):
+            handlers[command_type](None, None)
+
+        # The writes already saved are kept but the pending ones are discarded
+        self.assertTrue(Language.objects.filter(code='DE').exists())
+        self.assertFalse(Language.objects.filter(code='NL').exists())
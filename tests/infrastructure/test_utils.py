@@ -0,0 +1,213 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import datetime
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from base.models.enums.entity_type import EntityType
+from base.tests.factories.entity_version import (
+    EntityVersionFactory,
+    MainEntityVersionFactory,
+)
+from base.tests.factories.program_manager import ProgramManagerFactory
+from parcours_doctoral.infrastructure.utils import (
+    RoleAssignment,
+    get_doctorate_visibility_scope,
+    get_entities_with_ancestors_ids,
+    get_entities_with_descendants_ids,
+    get_person_role_assignments,
+    start_request_person_role_assignments,
+    stop_request_person_role_assignments,
+)
+from parcours_doctoral.tests.factories.parcours_doctoral import FormationFactory
+from parcours_doctoral.tests.factories.roles import (
+    AdreManagerRoleFactory,
+    CddConfiguratorFactory,
+)
+
+
+class DoctorateVisibilityScopeTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.first_training = FormationFactory()
+        cls.second_training = FormationFactory()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_scope_is_refreshed_when_the_roles_of_the_person_change(self):
+        program_manager_role = ProgramManagerFactory(education_group=self.first_training.education_group)
+        person = program_manager_role.person
+
+        self.assertEqual(
+            get_doctorate_visibility_scope(person.uuid),
+            (None, [self.first_training.education_group_id]),
+        )
+
+        with self.assertNumQueries(0):
+            get_doctorate_visibility_scope(person.uuid)
+
+        ProgramManagerFactory(
+            education_group=self.second_training.education_group,
+            person=person,
+        )
+
+        self.assertEqual(
+            get_doctorate_visibility_scope(person.uuid),
+            (None, sorted([self.first_training.education_group_id, self.second_training.education_group_id])),
+        )
+
+        program_manager_role.delete()
+
+        self.assertEqual(
+            get_doctorate_visibility_scope(person.uuid),
+            (None, [self.second_training.education_group_id]),
+        )
+
+
+class PersonRoleAssignmentsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_role_assignments_are_refreshed_when_the_roles_of_the_person_change(self):
+        cdd_configurator_role = CddConfiguratorFactory()
+        person = cdd_configurator_role.person
+
+        self.assertEqual(
+            get_person_role_assignments(person.uuid),
+            {
+                'parcours_doctoral.CddConfigurator': RoleAssignment(
+                    entities_ids=frozenset([cdd_configurator_role.entity_id]),
+                    education_groups_ids=None,
+                ),
+            },
+        )
+
+        with self.assertNumQueries(0):
+            get_person_role_assignments(person.uuid)
+
+        AdreManagerRoleFactory(person=person)
+
+        self.assertEqual(
+            get_person_role_assignments(person.uuid)['parcours_doctoral.AdreManager'],
+            RoleAssignment(entities_ids=None, education_groups_ids=None),
+        )
+
+        cdd_configurator_role.delete()
+
+        self.assertEqual(list(get_person_role_assignments(person.uuid)), ['parcours_doctoral.AdreManager'])
+
+    def test_role_assignments_are_read_once_from_the_cache_during_a_request(self):
+        person = CddConfiguratorFactory().person
+
+        start_request_person_role_assignments()
+        self.addCleanup(stop_request_person_role_assignments)
+
+        with mock.patch.object(cache, 'get_or_set', wraps=cache.get_or_set) as get_or_set_mock:
+            get_person_role_assignments(person.uuid)
+            get_person_role_assignments(person.uuid)
+
+            # One call for the version of the role assignments, one for the role assignments
+            self.assertEqual(get_or_set_mock.call_count, 2)
+
+            # The role assignments changed during the request are read again
+            AdreManagerRoleFactory(person=person)
+
+            self.assertIn('parcours_doctoral.AdreManager', get_person_role_assignments(person.uuid))
+
+        stop_request_person_role_assignments()
+
+        with mock.patch.object(cache, 'get_or_set', wraps=cache.get_or_set) as get_or_set_mock:
+            get_person_role_assignments(person.uuid)
+            get_person_role_assignments(person.uuid)
+
+            self.assertEqual(get_or_set_mock.call_count, 4)
+
+
+class EntityTreeTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.root_entity = MainEntityVersionFactory(parent=None).entity
+        cls.sector = EntityVersionFactory(parent=cls.root_entity, entity_type=EntityType.SECTOR.name, acronym='SST')
+        cls.commission = EntityVersionFactory(
+            parent=cls.sector.entity,
+            entity_type=EntityType.DOCTORAL_COMMISSION.name,
+            acronym='CDA',
+        )
+
+    def test_get_entities_with_descendants_ids(self):
+        self.assertEqual(get_entities_with_descendants_ids([]), set())
+        self.assertEqual(get_entities_with_descendants_ids(['CDA']), {self.commission.entity_id})
+        self.assertEqual(
+            get_entities_with_descendants_ids(['SST']),
+            {self.sector.entity_id, self.commission.entity_id},
+        )
+
+        # Loaded from the cache
+        with self.assertNumQueries(0):
+            get_entities_with_descendants_ids(['SST'])
+
+        # Refreshed when an entity changes
+        other_commission = EntityVersionFactory(
+            parent=self.sector.entity,
+            entity_type=EntityType.DOCTORAL_COMMISSION.name,
+            acronym='CDSS',
+        )
+
+        self.assertEqual(
+            get_entities_with_descendants_ids(['SST']),
+            {self.sector.entity_id, self.commission.entity_id, other_commission.entity_id},
+        )
+
+    def test_expired_entity_versions_are_not_in_the_entity_tree(self):
+        other_sector = EntityVersionFactory(
+            parent=self.root_entity,
+            entity_type=EntityType.SECTOR.name,
+            acronym='SSH',
+        )
+        # The commission was previously a child of the other sector
+        EntityVersionFactory(
+            entity=self.commission.entity,
+            parent=other_sector.entity,
+            entity_type=EntityType.DOCTORAL_COMMISSION.name,
+            acronym='CDA',
+            start_date=datetime.date(2000, 1, 1),
+            end_date=datetime.date(2001, 1, 1),
+        )
+
+        self.assertEqual(get_entities_with_descendants_ids(['SSH']), {other_sector.entity_id})
+        self.assertEqual(
+            get_entities_with_ancestors_ids(['CDA']),
+            {self.root_entity.pk, self.sector.entity_id, self.commission.entity_id},
+        )
+
+    def test_get_entities_with_ancestors_ids(self):
+        self.assertEqual(
+            get_entities_with_ancestors_ids(['CDA']),
+            {self.root_entity.pk, self.sector.entity_id, self.commission.entity_id},
+        )
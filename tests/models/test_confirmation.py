@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2024 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -28,14 +28,19 @@ import datetime
 from django.core.cache import cache
 from django.test import TestCase
 
+from parcours_doctoral.ddd.jury.domain.model.enums import RoleJury
 from parcours_doctoral.models.confirmation_paper import (
     confirmation_paper_directory_path,
 )
 from parcours_doctoral.tests.factories.confirmation_paper import (
     ConfirmationPaperFactory,
 )
+from parcours_doctoral.tests.factories.jury import JuryActorFactory
 from parcours_doctoral.tests.factories.parcours_doctoral import ParcoursDoctoralFactory
-from parcours_doctoral.utils.cache import get_cached_parcours_doctoral_perm_obj
+from parcours_doctoral.utils.cache import (
+    get_cached_parcours_doctoral_perm_obj,
+    get_parcours_doctoral_permission_version,
+)
 
 
 class ConfirmationPaperTestCase(TestCase):
@@ -59,12 +64,21 @@ class ConfirmationPaperTestCase(TestCase):
 
     def test_permission_cache_dropped_on_training_save(self):
         self.assertEqual(get_cached_parcours_doctoral_perm_obj(self.parcours_doctoral.uuid), self.parcours_doctoral)
-        self.assertIsNotNone(cache.get(f"parcours_doctoral_permission_{self.parcours_doctoral.uuid}"))
+        version = get_parcours_doctoral_permission_version(self.parcours_doctoral.uuid)
+        self.assertIsNotNone(cache.get(f"parcours_doctoral_permission_{self.parcours_doctoral.uuid}_{version}"))
         self.parcours_doctoral.training.save()
-        self.assertIsNone(cache.get(f"parcours_doctoral_permission_{self.parcours_doctoral.uuid}"))
+        self.assertNotEqual(get_parcours_doctoral_permission_version(self.parcours_doctoral.uuid), version)
 
-    def test_permission_cache_dropped_on_student_save(self):
-        self.assertEqual(get_cached_parcours_doctoral_perm_obj(self.parcours_doctoral.uuid), self.parcours_doctoral)
-        self.assertIsNotNone(cache.get(f"parcours_doctoral_permission_{self.parcours_doctoral.uuid}"))
-        self.parcours_doctoral.student.save()
-        self.assertIsNone(cache.get(f"parcours_doctoral_permission_{self.parcours_doctoral.uuid}"))
+    def test_permission_cache_dropped_on_jury_actor_save(self):
+        actor = JuryActorFactory()
+        self.parcours_doctoral.jury_group = actor.process
+        self.parcours_doctoral.save()
+
+        perm_obj = get_cached_parcours_doctoral_perm_obj(self.parcours_doctoral.uuid)
+        self.assertEqual(perm_obj.jury_actors, ((actor.person_id, RoleJury.MEMBRE.name),))
+
+        actor.role = RoleJury.PRESIDENT.name
+        actor.save()
+
+        perm_obj = get_cached_parcours_doctoral_perm_obj(self.parcours_doctoral.uuid)
+        self.assertEqual(perm_obj.jury_actors, ((actor.person_id, RoleJury.PRESIDENT.name),))
@@ -0,0 +1,138 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import datetime
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from base.models.enums.entity_type import EntityType
+from base.tests.factories.entity_version import (
+    EntityVersionFactory,
+    MainEntityVersionFactory,
+)
+from parcours_doctoral.models import EntityAncestry, ParcoursDoctoral
+from parcours_doctoral.tests.factories.parcours_doctoral import (
+    ParcoursDoctoralFactory,
+)
+
+
+class EntityAncestryTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.root = MainEntityVersionFactory(parent=None)
+        cls.sector = EntityVersionFactory(parent=cls.root.entity, entity_type=EntityType.SECTOR.name, acronym='SST')
+        cls.faculty = EntityVersionFactory(
+            parent=cls.sector.entity,
+            entity_type=EntityType.FACULTY.name,
+            acronym='FAC1',
+        )
+        cls.commission = EntityVersionFactory(
+            parent=cls.faculty.entity,
+            entity_type=EntityType.DOCTORAL_COMMISSION.name,
+            acronym='CDA',
+        )
+
+    def _get_ancestors(self, entity_version):
+        return dict(
+            EntityAncestry.objects.filter(entity_id=entity_version.entity_id).values_list('ancestor_id', 'depth')
+        )
+
+    def test_ancestries_are_refreshed_on_entity_version_save(self):
+        self.assertEqual(
+            self._get_ancestors(self.commission),
+            {
+                self.commission.entity_id: 0,
+                self.faculty.entity_id: 1,
+                self.sector.entity_id: 2,
+                self.root.entity_id: 3,
+            },
+        )
+
+        # The descendants are refreshed too
+        self.faculty.parent = self.root.entity
+        self.faculty.save()
+
+        self.assertEqual(
+            self._get_ancestors(self.commission),
+            {
+                self.commission.entity_id: 0,
+                self.faculty.entity_id: 1,
+                self.root.entity_id: 2,
+            },
+        )
+
+    def test_ancestries_through_an_expired_link_are_not_valid_today(self):
+        other_sector = EntityVersionFactory(
+            parent=self.root.entity,
+            entity_type=EntityType.SECTOR.name,
+            acronym='SSH',
+            start_date=datetime.date(2000, 1, 1),
+            end_date=None,
+        )
+        EntityVersionFactory(
+            entity=self.faculty.entity,
+            parent=other_sector.entity,
+            entity_type=EntityType.FACULTY.name,
+            acronym='FAC1',
+            start_date=datetime.date(2000, 1, 1),
+            end_date=datetime.date(2001, 1, 1),
+        )
+
+        self.assertFalse(
+            EntityAncestry.objects.filter(
+                entity_id=self.commission.entity_id,
+                ancestor_id=other_sector.entity_id,
+            )
+            .exclude(end_date__lte=datetime.date.today())
+            .exists()
+        )
+
+    def test_rebuild_command(self):
+        EntityAncestry.objects.all().delete()
+
+        call_command('rebuild_entity_ancestries')
+
+        self.assertEqual(len(self._get_ancestors(self.commission)), 4)
+
+    def test_sector_and_faculty_annotations(self):
+        doctorate = ParcoursDoctoralFactory(training__management_entity=self.commission.entity)
+
+        annotated_doctorate = (
+            ParcoursDoctoral.objects.annotate_faculte_formation().annotate_secteur_formation().get(pk=doctorate.pk)
+        )
+
+        self.assertEqual(annotated_doctorate.sigle_faculte_formation, 'FAC1')
+        self.assertEqual(annotated_doctorate.intitule_faculte_formation, self.faculty.title)
+        self.assertEqual(annotated_doctorate.sigle_secteur_formation, 'SST')
+        self.assertEqual(annotated_doctorate.intitule_secteur_formation, self.sector.title)
+
+        # Ended versions are ignored
+        self.faculty.end_date = datetime.date.today()
+        self.faculty.save()
+
+        annotated_doctorate = ParcoursDoctoral.objects.annotate_faculte_formation().get(pk=doctorate.pk)
+
+        self.assertIsNone(annotated_doctorate.sigle_faculte_formation)
@@ -0,0 +1,194 @@
+# ##############################################################################
+#
+#    OSIS stands for Open Student Information System. It's an application
+#    designed to manage the core business of higher education institutions,
+#    such as universities, faculties, institutes and professional schools.
+#    The core business involves the administration of students, teachers,
+#    courses, programs and so on.
+#
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    A copy of this license - GNU General Public License - is available
+#    at the root of the source code of this program.  If not,
+#    see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import datetime
+from unittest import mock
+
+from django.core.management import call_command
+from django.db.models import Q
+from django.test import TestCase
+
+from base.models.student import Student
+from base.tests.factories.entity_version import EntityVersionFactory
+from base.tests.factories.person import PersonFactory
+from parcours_doctoral.ddd.formation.domain.model.enums import (
+    CategorieActivite,
+    ContexteFormation,
+    StatutActivite,
+)
+from parcours_doctoral.models import ParcoursDoctoralSearchRow
+from parcours_doctoral.models.search_row import ParcoursDoctoralSearchRowQuerySet
+from parcours_doctoral.tests.factories.activity import ActivityFactory
+from parcours_doctoral.tests.factories.confirmation_paper import (
+    ConfirmationPaperFactory,
+)
+from parcours_doctoral.tests.factories.parcours_doctoral import (
+    ParcoursDoctoralFactory,
+)
+from parcours_doctoral.tests.factories.supervision import PromoterFactory
+from parcours_doctoral.utils.cache import get_doctorate_data_version
+from reference.tests.factories.scholarship import DoctorateScholarshipFactory
+
+
+class ParcoursDoctoralSearchRowTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.commission = EntityVersionFactory(acronym='CDA')
+        cls.scholarship = DoctorateScholarshipFactory(short_name='S1')
+
+    def setUp(self):
+        self.doctorate = ParcoursDoctoralFactory(
+            training__management_entity=self.commission.entity,
+            international_scholarship=self.scholarship,
+        )
+
+    def get_search_row(self):
+        return ParcoursDoctoralSearchRow.objects.get(parcours_doctoral=self.doctorate)
+
+    def test_search_row_is_created_with_the_doctorate(self):
+        search_row = self.get_search_row()
+
+        self.assertEqual(search_row.management_entity_acronym, 'CDA')
+        self.assertEqual(search_row.scholarship, 'S1')
+        self.assertFalse(search_row.follows_an_additional_training)
+        self.assertEqual(search_row.validated_credits_number, 0)
+        self.assertIsNone(search_row.active_confirmation_date)
+
+    def test_search_row_is_refreshed_when_the_doctorate_is_saved(self):
+        self.doctorate.international_scholarship = None
+        self.doctorate.other_international_scholarship = 'Other scholarship'
+        self.doctorate.save()
+
+        self.assertEqual(self.get_search_row().scholarship, 'Other scholarship')
+
+    def test_search_text(self):
+        self.doctorate.student.first_name = 'Jérôme'
+        self.doctorate.student.last_name = 'Dupont'
+        self.doctorate.student.save()
+        student = Student.objects.get(person=self.doctorate.student)
+        student.registration_id = '12345678'
+        student.save()
+
+        self.doctorate.project_title = 'Project  TITLE'
+        self.doctorate.thesis_proposed_title = 'Thèse'
+        self.doctorate.save()
+
+        self.assertEqual(self.get_search_row().search_text, 'dupont jerome 12345678 these project title')
+
+    def test_search_row_is_refreshed_when_the_scholarship_is_saved(self):
+        self.scholarship.short_name = 'S2'
+        self.scholarship.save()
+
+        self.assertEqual(self.get_search_row().scholarship, 'S2')
+
+    def test_search_row_is_refreshed_when_the_management_entity_is_saved(self):
+        self.commission.acronym = 'CDB'
+        self.commission.save()
+
+        self.assertEqual(self.get_search_row().management_entity_acronym, 'CDB')
+
+    def test_search_rows_are_not_refreshed_when_an_unrelated_object_is_saved(self):
+        person = PersonFactory()
+        doctorate_data_version = get_doctorate_data_version()
+
+        with mock.patch.object(ParcoursDoctoralSearchRowQuerySet, 'refresh') as refresh_mock:
+            # Saved person without doctorate
+            person.last_name = 'Doe'
+            person.save()
+
+            # Saved field that is not searched
+            self.doctorate.student.email = 'jdoe@example.com'
+            self.doctorate.student.save(update_fields=['email'])
+
+            refresh_mock.assert_not_called()
+
+        # Refreshed doctorates without search row
+        self.assertEqual(ParcoursDoctoralSearchRow.objects.refresh(Q(pk__in=[])), 0)
+
+        self.assertEqual(get_doctorate_data_version(), doctorate_data_version)
+
+    def test_search_row_is_refreshed_when_an_activity_is_saved_or_deleted(self):
+        activity = ActivityFactory(
+            parcours_doctoral=self.doctorate,
+            context=ContexteFormation.COMPLEMENTARY_TRAINING.name,
+            category=CategorieActivite.CONFERENCE.name,
+            status=StatutActivite.SOUMISE.name,
+            ects=10,
+        )
+
+        search_row = self.get_search_row()
+        self.assertTrue(search_row.follows_an_additional_training)
+        self.assertEqual(search_row.validated_credits_number, 0)
+
+        activity.status = StatutActivite.ACCEPTEE.name
+        activity.save()
+
+        self.assertEqual(self.get_search_row().validated_credits_number, 10)
+
+        activity.delete()
+
+        search_row = self.get_search_row()
+        self.assertFalse(search_row.follows_an_additional_training)
+        self.assertEqual(search_row.validated_credits_number, 0)
+
+    def test_search_row_is_refreshed_when_a_confirmation_paper_is_saved(self):
+        confirmation_paper = ConfirmationPaperFactory(
+            parcours_doctoral=self.doctorate,
+            confirmation_date=datetime.date(2024, 1, 1),
+        )
+
+        self.assertEqual(self.get_search_row().active_confirmation_date, datetime.date(2024, 1, 1))
+
+        confirmation_paper.is_active = False
+        confirmation_paper.save()
+
+        self.assertIsNone(self.get_search_row().active_confirmation_date)
+
+    def test_search_row_is_touched_when_a_supervision_actor_is_saved(self):
+        previous_updated_at = self.get_search_row().updated_at
+        doctorate_data_version = get_doctorate_data_version()
+
+        PromoterFactory(process=self.doctorate.supervision_group)
+
+        self.assertGreater(self.get_search_row().updated_at, previous_updated_at)
+        self.assertNotEqual(get_doctorate_data_version(), doctorate_data_version)
+
+    def test_search_row_is_deleted_with_the_doctorate(self):
+        ActivityFactory(parcours_doctoral=self.doctorate)
+        ConfirmationPaperFactory(parcours_doctoral=self.doctorate)
+
+        self.doctorate.delete()
+
+        self.assertFalse(ParcoursDoctoralSearchRow.objects.exists())
+
+    def test_rebuild_search_rows(self):
+        ParcoursDoctoralSearchRow.objects.all().delete()
+
+        call_command('rebuild_parcours_doctoral_search_rows')
+
+        search_row = self.get_search_row()
+
+        self.assertEqual(search_row.management_entity_acronym, 'CDA')
+        self.assertEqual(search_row.scholarship, 'S1')
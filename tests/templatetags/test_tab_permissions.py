@@ -0,0 +1,76 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from unittest.mock import Mock
+
+from django.test import RequestFactory, TestCase
+
+from parcours_doctoral.auth.constants import READ_ACTIONS_BY_TAB, UPDATE_ACTIONS_BY_TAB
+from parcours_doctoral.templatetags.parcours_doctoral import (
+    can_read_tab,
+    can_update_tab,
+)
+
+
+class TabPermissionsTestCase(TestCase):
+    def setUp(self):
+        self.request = RequestFactory().get('/')
+        self.request.user = Mock()
+        self.request.user.has_perm.side_effect = lambda perm, obj: perm in {
+            'parcours_doctoral.view_project',
+            'parcours_doctoral.change_funding',
+        }
+        self.permission_obj = Mock(pk=1)
+        self.context = {
+            'request': self.request,
+            'view': Mock(get_permission_object=Mock(return_value=self.permission_obj)),
+        }
+
+    def test_tab_permissions(self):
+        self.assertTrue(can_read_tab(self.context, 'project'))
+        self.assertFalse(can_read_tab(self.context, 'funding'))
+        self.assertFalse(can_update_tab(self.context, 'project'))
+        self.assertTrue(can_update_tab(self.context, 'funding'))
+
+    def test_each_permission_is_checked_once_per_request(self):
+        for tab_name in READ_ACTIONS_BY_TAB:
+            can_read_tab(self.context, tab_name)
+        for tab_name in UPDATE_ACTIONS_BY_TAB:
+            can_update_tab(self.context, tab_name)
+
+        checked_permissions = [call.args[0] for call in self.request.user.has_perm.call_args_list]
+        self.assertCountEqual(
+            checked_permissions,
+            set(READ_ACTIONS_BY_TAB.values()) | set(UPDATE_ACTIONS_BY_TAB.values()),
+        )
+
+    def test_permissions_are_checked_for_each_doctorate(self):
+        other_permission_obj = Mock(pk=2)
+
+        can_read_tab(self.context, 'project')
+        can_read_tab(self.context, 'project', other_permission_obj)
+
+        checked_objects = {call.args[1] for call in self.request.user.has_perm.call_args_list}
+        self.assertEqual(checked_objects, {self.permission_obj, other_permission_obj})
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -25,10 +25,13 @@
 # ##############################################################################
 import datetime
 import uuid
+from io import StringIO
 from unittest import mock
 from unittest.mock import patch
 
 import freezegun
+from django.core.cache import cache
+from django.core.management import call_command
 from django.db.models.expressions import Value
 from django.shortcuts import resolve_url
 from django.test import TestCase
@@ -43,6 +46,7 @@ from admission.ddd.admission.doctorat.preparation.read_view.domain.enums.tableau
     IndicateurTableauBordEnum,
 )
 from admission.forms import ALL_FEMININE_EMPTY_CHOICE
+from admission.models import DoctorateAdmission
 from admission.tests.factories import DoctorateAdmissionFactory
 from base.models.enums.entity_type import EntityType
 from base.tests.factories.entity import EntityFactory
@@ -50,6 +54,7 @@ from base.tests.factories.entity_version import (
     EntityVersionFactory,
     MainEntityVersionFactory,
 )
+from base.tests.factories.person import PersonFactory
 from base.tests.factories.program_manager import ProgramManagerFactory
 from infrastructure.messages_bus import message_bus_instance
 from parcours_doctoral.ddd.autorisation_diffusion_these.domain.model.enums import (
@@ -72,6 +77,13 @@ from parcours_doctoral.ddd.read_view.dto.tableau_bord import TableauBordDTO
 from parcours_doctoral.ddd.read_view.queries import (
     RecupererInformationsTableauBordQuery,
 )
+from parcours_doctoral.infrastructure.parcours_doctoral.read_view.repository.tableau_bord import (
+    TableauBordRepository,
+)
+from parcours_doctoral.models import (
+    DashboardIndicatorCounter,
+    ParcoursDoctoralSearchRow,
+)
 from parcours_doctoral.tests.factories.authorization_distribution import (
     ThesisDistributionAuthorizationFactory,
 )
@@ -83,11 +95,17 @@ from parcours_doctoral.tests.factories.parcours_doctoral import (
     ParcoursDoctoralFactory,
 )
 from parcours_doctoral.tests.factories.private_defense import PrivateDefenseFactory
+from parcours_doctoral.utils.cache import (
+    get_admission_data_version,
+    get_doctorate_data_version,
+)
 
 
 @override_settings(OSIS_DOCUMENT_BASE_URL='http://dummyurl/')
 class DashboardCommandTestCase(TestCase):
     def setUp(self):
+        cache.clear()
+
         # Mock documents
         patcher = patch("osis_document_components.services.get_remote_token", return_value="foobar")
         patcher.start()
@@ -407,6 +425,10 @@ class DashboardCommandTestCase(TestCase):
                 confirmation_deadline=datetime.date(2024, 12, 31),
             )
 
+            # The warning date is stored at 75% of the delay
+            doctorate.search_row.refresh_from_db()
+            self.assertEqual(doctorate.search_row.confirmation_warning_datetime.date(), datetime.date(2024, 9, 30))
+
             self.assert_dashboard_value(category, indicator, 0)
 
         # Today date: 2024/09/30
@@ -530,6 +552,70 @@ class DashboardCommandTestCase(TestCase):
 
         self.assert_dashboard_value(category, indicator, 0)
 
+    def test_counters_are_reconciled_with_the_data(self):
+        category = CategorieTableauBordEnum.CONFIRMATION.name
+        indicator = IndicateurTableauBordEnum.CONFIRMATION_SOUMISE.name
+
+        doctorate = ParcoursDoctoralFactory(status=ChoixStatutParcoursDoctoral.CONFIRMATION_SOUMISE.name)
+
+        self.assert_dashboard_value(category, indicator, 1)
+        self.assertEqual(
+            DashboardIndicatorCounter.objects.get(
+                indicator=indicator,
+                management_entity=doctorate.training.management_entity,
+                proximity_commission=doctorate.proximity_commission,
+            ).count,
+            1,
+        )
+
+        # Desynchronized counter -> the difference is reported and fixed on demand
+        DashboardIndicatorCounter.objects.filter(indicator=indicator).update(count=3)
+
+        out = StringIO()
+        call_command('reconcile_parcours_doctoral_dashboard_counters', stdout=out)
+        self.assertIn('3 counted instead of 1', out.getvalue())
+        self.assert_dashboard_value(category, indicator, 3)
+
+        call_command('reconcile_parcours_doctoral_dashboard_counters', '--fix', stdout=StringIO())
+        self.assert_dashboard_value(category, indicator, 1)
+
+        out = StringIO()
+        call_command('reconcile_parcours_doctoral_dashboard_counters', stdout=out)
+        self.assertIn('The dashboard counters are up to date.', out.getvalue())
+
+        # Deleted doctorate -> the counters are decremented
+        doctorate.delete()
+        self.assert_dashboard_value(category, indicator, 0)
+
+    def test_values_are_computed_once_for_all_the_selections(self):
+        category = CategorieTableauBordEnum.CONFIRMATION.name
+        indicator = IndicateurTableauBordEnum.CONFIRMATION_SOUMISE.name
+
+        doctorate = ParcoursDoctoralFactory(status=ChoixStatutParcoursDoctoral.CONFIRMATION_SOUMISE.name)
+
+        with patch.object(
+            TableauBordRepository,
+            '_compute_grouped_values',
+            wraps=TableauBordRepository._compute_grouped_values,
+        ) as compute_mock:
+            self.assert_dashboard_value(category, indicator, 1)
+            self.assert_dashboard_value(category, indicator, 1, cdds=['CDA'])
+            self.assert_dashboard_value(
+                category,
+                indicator,
+                0,
+                cdds=['CDA'],
+                commission_proximite=ChoixCommissionProximiteCDSS.ECLI.name,
+            )
+            self.assertEqual(compute_mock.call_count, 1)
+
+            # Updated doctorate -> the values are computed again
+            doctorate.status = ChoixStatutParcoursDoctoral.ADMIS.name
+            doctorate.save()
+
+            self.assert_dashboard_value(category, indicator, 0, cdds=['CDA'])
+            self.assertEqual(compute_mock.call_count, 2)
+
     def test_submitted_public_defense_1(self):
         category = CategorieTableauBordEnum.FORMULE_1_SOUTENANCE_PUBLIQUE.name
         indicator = IndicateurTableauBordEnum.FORMULE_1_SOUTENANCE_PUBLIQUE_SOUMISE.name
@@ -783,6 +869,8 @@ class DashboardViewTestCase(TestCase):
         cls.url = resolve_url('parcours_doctoral:dashboard')
 
     def setUp(self):
+        cache.clear()
+
         # Mock documents
         patcher = patch("osis_document_components.services.get_remote_token", return_value="foobar")
         patcher.start()
@@ -824,6 +912,101 @@ class DashboardViewTestCase(TestCase):
             nb_doctorates,
         )
 
+    def test_get_dashboard_not_modified(self):
+        program_manager = ProgramManagerFactory(education_group=self.cda_training.education_group)
+
+        self.client.force_login(user=program_manager.person.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers['ETag']
+
+        # Same data and filters -> not modified
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # Person without doctorate updated -> not modified
+        PersonFactory().save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # Other filters -> new content
+        response = self.client.get(self.url, {'cdds': ['CDA']}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+        # Updated doctorate -> new content
+        self.cda_doctorate.status = ChoixStatutParcoursDoctoral.ADMIS.name
+        self.cda_doctorate.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self._test_assert_nb_results(context=response.context, nb_admissions=1, nb_doctorates=0)
+
+    def test_get_dashboard_not_modified_until_the_next_warning_date(self):
+        program_manager = ProgramManagerFactory(education_group=self.cda_training.education_group)
+
+        self.client.force_login(user=program_manager.person.user)
+
+        self.cda_doctorate.status = ChoixStatutParcoursDoctoral.ADMIS.name
+        self.cda_doctorate.save()
+        ParcoursDoctoralSearchRow.objects.filter(parcours_doctoral=self.cda_doctorate).update(
+            confirmation_warning_datetime=datetime.datetime(2024, 9, 30, tzinfo=datetime.timezone.utc),
+        )
+
+        with freezegun.freeze_time(datetime.date(2024, 9, 29)):
+            response = self.client.get(self.url)
+
+            self.assertEqual(response.status_code, 200)
+            etag = response.headers['ETag']
+
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304)
+
+        # Reached warning date -> new content
+        with freezegun.freeze_time(datetime.date(2024, 10, 1)):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                response.context['dashboard']
+                .categories[CategorieTableauBordEnum.CONFIRMATION.name]
+                .indicateurs[IndicateurTableauBordEnum.CONFIRMATION_ECHEANCE_2_MOIS.name]
+                .valeur,
+                1,
+            )
+
+    def test_get_dashboard_not_modified_until_the_admission_values_change(self):
+        program_manager = ProgramManagerFactory(education_group=self.cda_training.education_group)
+
+        self.client.force_login(user=program_manager.person.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers['ETag']
+
+        # Admission updated without signal -> not modified while the values are cached
+        DoctorateAdmission.objects.filter(pk=self.cda_admission.pk).update(
+            status=ChoixStatutPropositionDoctorale.EN_BROUILLON.name,
+        )
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # Expired values -> new content
+        cache.delete(
+            'parcours_doctoral_dashboard_grouped_values_{}_{}'.format(
+                get_doctorate_data_version(),
+                get_admission_data_version(),
+            )
+        )
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self._test_assert_nb_results(context=response.context, nb_admissions=0, nb_doctorates=1)
+
     def test_get_dashboard_form_and_data(self):
         # CDA
         program_manager = ProgramManagerFactory(education_group=self.cda_training.education_group)
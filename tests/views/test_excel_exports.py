@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -27,7 +27,9 @@
 import ast
 import datetime
 from decimal import Decimal
+from io import BytesIO
 from typing import List
+from unittest import mock
 
 import freezegun
 from django.contrib.auth.models import User
@@ -35,6 +37,8 @@ from django.template.defaultfilters import yesno
 from django.test import TestCase
 from django.urls import reverse
 from django.utils.translation import gettext as _
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import WorkbookAlreadySaved
 from osis_async.models import AsyncTask
 from osis_async.models.enums import TaskState
 from osis_export.models import Export
@@ -60,6 +64,7 @@ from parcours_doctoral.tests.factories.roles import AdreSecretaryRoleFactory
 from parcours_doctoral.views.excel_exports import (
     SHORT_DATE_FORMAT,
     ParcoursDoctoralListExcelExportView,
+    WriteOnlyWorkbook,
 )
 from reference.tests.factories.country import CountryFactory
 
@@ -270,3 +275,74 @@ class ParcoursDoctoralListExcelExportViewTestCase(QueriesAssertionsMixin, TestCa
         self.assertEqual(row_data[8], yesno(result.formation_complementaire))
         self.assertEqual(row_data[9], '')
         self.assertEqual(row_data[10], Decimal('0'))
+
+    def test_export_objects_are_streamed(self):
+        view = ParcoursDoctoralListExcelExportView()
+
+        ParcoursDoctoralFactory()
+
+        results = view.get_export_objects(
+            filters=str({'matricule_doctorant': self.parcours_doctoral.student.global_id}),
+        )
+
+        self.assertNotIsInstance(results, list)
+        self.assertEqual([result.uuid for result in results], [self.parcours_doctoral.uuid])
+
+    def test_generate_file(self):
+        view = ParcoursDoctoralListExcelExportView()
+
+        ParcoursDoctoralFactory()
+
+        file = view.generate_file(
+            person=self.adre_user.person,
+            filters=str({'matricule_doctorant': self.parcours_doctoral.student.global_id}),
+        )
+
+        workbook = load_workbook(BytesIO(file), read_only=True)
+        rows = list(workbook.worksheets[0].values)
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(list(rows[0]), [str(title) for title in view.get_header()])
+        self.assertEqual(rows[1][0], 'Doe, John')
+        self.assertEqual(len(workbook.worksheets), 2)
+
+    def test_workbook_is_write_only(self):
+        workbook = ParcoursDoctoralListExcelExportView().get_workbook()
+
+        self.assertTrue(workbook.write_only)
+
+        worksheet = workbook.active
+        worksheet.title = 'Title'
+        worksheet.append(['value'])
+
+        self.assertIs(workbook.active, worksheet)
+
+        file = BytesIO()
+        workbook.save(file)
+
+        self.assertEqual(list(load_workbook(file, read_only=True)['Title'].values), [('value',)])
+
+    def test_generate_file_saves_a_write_only_workbook(self):
+        view = ParcoursDoctoralListExcelExportView()
+        workbooks = []
+
+        def get_workbook():
+            workbook = WriteOnlyWorkbook()
+            workbooks.append(workbook)
+            return workbook
+
+        with mock.patch.object(view, 'get_workbook', side_effect=get_workbook):
+            file = view.generate_file(
+                person=self.adre_user.person,
+                filters=str({'matricule_doctorant': self.parcours_doctoral.student.global_id}),
+            )
+
+        self.assertEqual(len(workbooks), 1)
+        self.assertTrue(workbooks[0].write_only)
+
+        # A write-only workbook can only be saved once
+        with self.assertRaises(WorkbookAlreadySaved):
+            workbooks[0].save(BytesIO())
+
+        rows = list(load_workbook(BytesIO(file), read_only=True).worksheets[0].values)
+        self.assertEqual(rows[1][0], 'Doe, John')
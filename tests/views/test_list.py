@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,14 +24,18 @@
 #
 # ##############################################################################
 import datetime
+from unittest import mock
 from uuid import uuid4
 
 import freezegun
+from django.conf import settings
 from django.core.cache import cache
 from django.core.exceptions import NON_FIELD_ERRORS
+from django.core.management import call_command
 from django.forms import MultipleHiddenInput
 from django.shortcuts import reverse
 from django.test import RequestFactory, TestCase, override_settings
+from django.utils import translation
 from django.utils.translation import gettext
 
 from admission.ddd.admission.doctorat.preparation.domain.model.enums import (
@@ -55,6 +59,9 @@ from base.tests.factories.learning_unit_year import LearningUnitYearFactory
 from base.tests.factories.person import PersonFactory
 from base.tests.factories.program_manager import ProgramManagerFactory
 from base.tests.factories.user import UserFactory
+from epc.models.enums.etat_inscription import EtatInscriptionFormation
+from epc.models.inscription_programme_annuel import InscriptionProgrammeAnnuel
+from infrastructure.messages_bus import message_bus_instance
 from parcours_doctoral.ddd.domain.model.enums import (
     STATUTS_ACTIFS,
     BourseRecherche,
@@ -68,8 +75,12 @@ from parcours_doctoral.ddd.formation.domain.model.enums import (
     ContexteFormation,
     StatutActivite,
 )
+from parcours_doctoral.ddd.read_view.queries import ListerTousParcoursDoctorauxQuery
 from parcours_doctoral.forms.list import ALL_FEMININE_EMPTY_CHOICE
-from parcours_doctoral.models import ParcoursDoctoral
+from parcours_doctoral.infrastructure.parcours_doctoral.read_view.repository.liste_parcours_doctoraux import (
+    ListeParcoursDoctorauxRepository,
+)
+from parcours_doctoral.models import ParcoursDoctoral, SavedSearch
 from parcours_doctoral.models.entity_proxy import EntityProxy
 from parcours_doctoral.tests.factories.activity import CourseFactory, VaeFactory
 from parcours_doctoral.tests.factories.confirmation_paper import (
@@ -89,6 +100,7 @@ from parcours_doctoral.tests.factories.supervision import (
     ExternalPromoterFactory,
     PromoterFactory,
 )
+from parcours_doctoral.views.list import ParcoursDoctoralList
 from reference.tests.factories.country import CountryFactory
 from reference.tests.factories.scholarship import DoctorateScholarshipFactory
 
@@ -96,7 +108,7 @@ from reference.tests.factories.scholarship import DoctorateScholarshipFactory
 @freezegun.freeze_time('2023-01-01')
 @override_settings(WAFFLE_CREATE_MISSING_SWITCHES=False)
 class ParcoursDoctoralListTestView(QueriesAssertionsMixin, TestCase):
-    NB_MAX_QUERIES = 28
+    NB_MAX_QUERIES = 29
 
     @classmethod
     def setUpTestData(cls):
@@ -415,6 +427,24 @@ class ParcoursDoctoralListTestView(QueriesAssertionsMixin, TestCase):
         self.assertEqual(dto.en_regle_inscription, True)
         self.assertEqual(dto.total_credits_valides, 0)
 
+    def test_expensive_columns_are_only_computed_in_sql_to_sort(self):
+        self.client.force_login(user=self.program_manager.user)
+
+        with mock.patch.object(
+            ListeParcoursDoctorauxRepository,
+            '_annotate_enriched_columns',
+            wraps=ListeParcoursDoctorauxRepository._annotate_enriched_columns,
+        ) as annotate_mock:
+            response = self._do_request(o='nom_etudiant')
+            self.assertEqual(len(response.context['object_list']), 1)
+            self.assertEqual(response.context['object_list'][0].en_regle_inscription, True)
+            annotate_mock.assert_not_called()
+
+            response = self._do_request(o='en_regle_inscription')
+            self.assertEqual(len(response.context['object_list']), 1)
+            self.assertEqual(response.context['object_list'][0].en_regle_inscription, True)
+            annotate_mock.assert_called_once()
+
     def test_dto_with_complementary_training_activity(self):
         self.client.force_login(user=self.program_manager.user)
 
@@ -571,6 +601,239 @@ class ParcoursDoctoralListTestView(QueriesAssertionsMixin, TestCase):
             [(self.student.global_id, f'{self.student.last_name}, {self.student.first_name}')],
         )
 
+    def test_filter_by_free_text(self):
+        self.client.force_login(user=self.program_manager.user)
+
+        self.doctorate.project_title = 'Étude des réseaux neuronaux'
+        self.doctorate.thesis_proposed_title = 'Thesis title'
+        self.doctorate.save()
+
+        for search in ['doe', 'John Doe', 'etude', 'RÉSEAUX', 'neuro', 'thesis']:
+            with self.subTest(search=search):
+                response = self._do_request(recherche=search)
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.context['object_list']), 1)
+
+        for search in ['unknown', 'John Smith']:
+            with self.subTest(search=search):
+                response = self._do_request(recherche=search)
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(len(response.context['object_list']), 0)
+
+    def test_facet_counts(self):
+        self.client.force_login(user=self.program_manager.user)
+
+        response = self._do_request(type_admission=ChoixTypeAdmission.ADMISSION.name)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['object_list']), 0)
+
+        # The count of a choice doesn't depend on the filter of its own field
+        facet_counts = response.context['facet_counts']
+        self.assertEqual(facet_counts['type_admission'][ChoixTypeAdmission.PRE_ADMISSION.name], 1)
+        self.assertEqual(facet_counts['type_admission'][ChoixTypeAdmission.ADMISSION.name], 0)
+        self.assertEqual(facet_counts['statuts'][ChoixStatutParcoursDoctoral.JURY_APPROUVE_CA.name], 0)
+        self.assertEqual(facet_counts['type_financement'][ChoixTypeFinancement.WORK_CONTRACT.name], 0)
+
+        form = response.context['form']
+        self.assertIn(
+            (ChoixTypeAdmission.PRE_ADMISSION.name, f'{ChoixTypeAdmission.PRE_ADMISSION.value} (1)'),
+            form.fields['type_admission'].choices,
+        )
+
+        response = self._do_request()
+
+        facet_counts = response.context['facet_counts']
+        self.assertEqual(facet_counts['statuts'][ChoixStatutParcoursDoctoral.JURY_APPROUVE_CA.name], 1)
+        self.assertEqual(facet_counts['type_financement'][ChoixTypeFinancement.WORK_CONTRACT.name], 1)
+        self.assertEqual(facet_counts['type_financement'][ChoixTypeFinancement.SEARCH_SCHOLARSHIP.name], 0)
+
+    def test_facet_fields_are_refreshed_by_htmx_requests(self):
+        self.client.force_login(user=self.program_manager.user)
+
+        response = self.client.get(self.url, data=self.default_params, HTTP_HX_REQUEST='true')
+
+        self.assertEqual(response.status_code, 200)
+        for field_name in ['statuts', 'commission_proximite', 'type_financement', 'type_admission']:
+            with self.subTest(field_name=field_name):
+                self.assertContains(response, f'id="id_{field_name}_container"')
+        self.assertContains(response, f'{ChoixStatutParcoursDoctoral.JURY_APPROUVE_CA.value} (1)')
+
+    def test_enrolment_status_of_cached_results_is_up_to_date(self):
+        self.client.force_login(user=self.program_manager.user)
+
+        with mock.patch.object(
+            ListeParcoursDoctorauxRepository,
+            '_search',
+            wraps=ListeParcoursDoctorauxRepository._search,
+        ) as search_mock:
+            response = self._do_request()
+            self.assertEqual(response.context['object_list'][0].en_regle_inscription, True)
+            self.assertEqual(search_mock.call_count, 1)
+
+            # The enrolments are not part of the doctorate data
+            InscriptionProgrammeAnnuel.objects.filter(programme_cycle__etudiant__person=self.doctorate.student).update(
+                etat_inscription=EtatInscriptionFormation.DEMANDE_INCOMPLETE.name,
+            )
+
+            response = self._do_request()
+            self.assertEqual(response.context['object_list'][0].en_regle_inscription, False)
+            self.assertEqual(search_mock.call_count, 1)
+
+            # The results sorted by enrolment status are not cached
+            self._do_request(o='en_regle_inscription')
+            self._do_request(o='en_regle_inscription')
+            self.assertEqual(search_mock.call_count, 3)
+
+    def test_results_are_shared_by_users_with_the_same_scope(self):
+        other_program_manager = PersonFactory()
+        for program_manager_role in self.program_manager_roles:
+            ProgramManagerFactory(education_group=program_manager_role.education_group, person=other_program_manager)
+
+        with mock.patch.object(
+            ListeParcoursDoctorauxRepository,
+            '_search',
+            wraps=ListeParcoursDoctorauxRepository._search,
+        ) as search_mock:
+            self.client.force_login(user=self.program_manager.user)
+            response = self._do_request(statuts=[ChoixStatutParcoursDoctoral.JURY_APPROUVE_CA.name])
+            self.assertEqual(len(response.context['object_list']), 1)
+            self.assertEqual(search_mock.call_count, 1)
+
+            # Same filters and scope -> cached results
+            self.client.force_login(user=other_program_manager.user)
+            response = self._do_request(statuts=[ChoixStatutParcoursDoctoral.JURY_APPROUVE_CA.name])
+            self.assertEqual(len(response.context['object_list']), 1)
+            self.assertEqual(search_mock.call_count, 1)
+
+            # Other scope -> new search
+            self.client.force_login(
+                user=ProgramManagerFactory(education_group=self.doctorate_training.education_group).person.user
+            )
+            self._do_request(statuts=[ChoixStatutParcoursDoctoral.JURY_APPROUVE_CA.name])
+            self.assertEqual(search_mock.call_count, 2)
+
+            # Updated doctorate -> new search
+            self.doctorate.status = ChoixStatutParcoursDoctoral.ADMIS.name
+            self.doctorate.save()
+
+            self.client.force_login(user=other_program_manager.user)
+            response = self._do_request(statuts=[ChoixStatutParcoursDoctoral.JURY_APPROUVE_CA.name])
+            self.assertEqual(len(response.context['object_list']), 0)
+            self.assertEqual(search_mock.call_count, 3)
+
+    def test_saved_search_lists_its_precomputed_doctorates(self):
+        self.client.force_login(user=self.program_manager.user)
+
+        self._do_request(statuts=[ChoixStatutParcoursDoctoral.JURY_APPROUVE_CA.name])
+
+        # Save the last search
+        response = self.client.post(reverse('parcours_doctoral:saved-searches'), data={'name': 'To approve'})
+
+        saved_search = SavedSearch.objects.get(person=self.program_manager)
+        self.assertRedirects(response, saved_search.get_absolute_url(), fetch_redirect_response=False)
+        self.assertEqual(saved_search.name, 'To approve')
+        self.assertEqual(saved_search.filters['statuts'], [ChoixStatutParcoursDoctoral.JURY_APPROUVE_CA.name])
+        self.assertTrue(saved_search.is_up_to_date)
+
+        # Open the saved search -> its criteria are applied and the results computed by the refresh are reused
+        with mock.patch.object(
+            ListeParcoursDoctorauxRepository,
+            '_search',
+            wraps=ListeParcoursDoctorauxRepository._search,
+        ) as search_mock:
+            response = self.client.get(saved_search.get_absolute_url())
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.context['current_saved_search'], saved_search)
+            self.assertEqual([doctorate.uuid for doctorate in response.context['object_list']], [self.doctorate.uuid])
+            search_mock.assert_not_called()
+
+        # Updated doctorate -> the saved search is refreshed by the periodic job
+        self.doctorate.status = ChoixStatutParcoursDoctoral.ADMIS.name
+        self.doctorate.save()
+
+        saved_search.refresh_from_db()
+        self.assertFalse(saved_search.is_up_to_date)
+
+        call_command('refresh_parcours_doctoral_saved_searches')
+
+        saved_search.refresh_from_db()
+        self.assertTrue(saved_search.is_up_to_date)
+
+        with mock.patch.object(
+            ListeParcoursDoctorauxRepository,
+            '_search',
+            wraps=ListeParcoursDoctorauxRepository._search,
+        ) as search_mock:
+            response = self.client.get(saved_search.get_absolute_url())
+
+            self.assertEqual(len(response.context['object_list']), 0)
+            search_mock.assert_not_called()
+
+        # Delete the saved search
+        response = self.client.post(reverse('parcours_doctoral:saved-searches'), data={'delete': saved_search.uuid})
+
+        self.assertRedirects(response, self.url, fetch_redirect_response=False)
+        self.assertFalse(SavedSearch.objects.filter(person=self.program_manager).exists())
+
+    def test_saved_search_keeps_its_results_when_its_doctorates_have_not_changed(self):
+        self.client.force_login(user=self.program_manager.user)
+
+        self._do_request(o='-nom_etudiant', taille_page=50)
+        self.client.post(reverse('parcours_doctoral:saved-searches'), data={'name': 'All'})
+
+        # The page size, the ordering and the language are saved with the search
+        saved_search = SavedSearch.objects.get(person=self.program_manager)
+        self.assertEqual(saved_search.filters['taille_page'], 50)
+        self.assertEqual(saved_search.filters['champ_tri'], 'nom_etudiant')
+        self.assertTrue(saved_search.filters['tri_inverse'])
+        self.assertIn(saved_search.language, [settings.LANGUAGE_CODE_FR, settings.LANGUAGE_CODE_EN])
+        other_language = (
+            settings.LANGUAGE_CODE_EN
+            if saved_search.language == settings.LANGUAGE_CODE_FR
+            else settings.LANGUAGE_CODE_FR
+        )
+
+        # New doctorate that is not visible to the person -> the results are kept for the new data version
+        ParcoursDoctoralFactory()
+
+        saved_search.refresh_from_db()
+        self.assertFalse(saved_search.is_up_to_date)
+
+        with mock.patch.object(
+            ListeParcoursDoctorauxRepository,
+            '_search',
+            wraps=ListeParcoursDoctorauxRepository._search,
+        ) as search_mock:
+            # The results are computed in the language of the search
+            with translation.override(other_language):
+                call_command('refresh_parcours_doctoral_saved_searches')
+
+            saved_search.refresh_from_db()
+            self.assertTrue(saved_search.is_up_to_date)
+            search_mock.assert_not_called()
+
+            response = self.client.get(saved_search.get_absolute_url())
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.context['paginator'].per_page, 50)
+            search_mock.assert_not_called()
+
+        # Updated visible doctorate -> the results are computed again
+        self.doctorate.save()
+
+        with mock.patch.object(
+            ListeParcoursDoctorauxRepository,
+            '_search',
+            wraps=ListeParcoursDoctorauxRepository._search,
+        ) as search_mock:
+            call_command('refresh_parcours_doctoral_saved_searches')
+
+            search_mock.assert_called_once()
+
     def test_filter_by_admission_type(self):
         self.client.force_login(user=self.program_manager.user)
 
@@ -1111,3 +1374,208 @@ class ParcoursDoctoralListTestView(QueriesAssertionsMixin, TestCase):
                 'next': None,
             },
         )
+
+        # Navigation index
+        view_class = response.context['view'].__class__
+        user_id = self.program_manager.user.id
+
+        # The uuid at each position and the position of each uuid are stored
+        _, index_id = cache.get(view_class.cache_key_for_result(user_id=user_id))
+        self.assertEqual(cache.get(view_class.cache_key_for_navigation_slot(index_id, 0)), other_doctorate.uuid.bytes)
+        self.assertEqual(cache.get(view_class.cache_key_for_navigation_slot(index_id, 1)), self.doctorate.uuid.bytes)
+        self.assertEqual(cache.get(view_class.cache_key_for_navigation_position(index_id, self.doctorate.uuid)), 1)
+
+        self.assertEqual(
+            view_class.get_navigation_neighbours(user_id, other_doctorate.uuid),
+            (None, self.doctorate.uuid),
+        )
+        self.assertEqual(
+            view_class.get_navigation_neighbours(user_id, self.doctorate.uuid),
+            (other_doctorate.uuid, None),
+        )
+        self.assertEqual(view_class.get_navigation_neighbours(user_id, uuid4()), (None, None))
+
+        # Only the position of the doctorate and the neighbouring slots are read
+        with mock.patch.object(cache, 'get_many', wraps=cache.get_many) as get_many_mock:
+            view_class.get_navigation_neighbours(user_id, self.doctorate.uuid)
+
+        get_many_mock.assert_called_once_with(
+            [
+                view_class.cache_key_for_navigation_slot(index_id, 0),
+                view_class.cache_key_for_navigation_slot(index_id, 2),
+            ]
+        )
+
+    def test_keyset_pagination(self):
+        other_doctorate = ParcoursDoctoralFactory(
+            training=self.other_doctorate_training,
+            student__first_name='Jim',
+            student__last_name='Doe',
+        )
+
+        query_params = {
+            'champ_tri': 'nom_etudiant',
+            'taille_page': 1,
+            'demandeur': str(self.program_manager.uuid),
+        }
+
+        first_page = message_bus_instance.invoke(ListerTousParcoursDoctorauxQuery(page=1, **query_params))
+
+        self.assertEqual([result.uuid for result in first_page], [other_doctorate.uuid])
+        self.assertEqual(first_page.total_count, 2)
+        self.assertTrue(first_page.curseur_suivant)
+
+        # Seek the next page from the cursor of the previous one and bound the total count
+        second_page = message_bus_instance.invoke(
+            ListerTousParcoursDoctorauxQuery(
+                page=2,
+                curseur=first_page.curseur_suivant,
+                limite_comptage=1,
+                **query_params,
+            )
+        )
+
+        self.assertEqual([result.uuid for result in second_page], [self.doctorate.uuid])
+        self.assertEqual(second_page.total_count, 2)
+        self.assertFalse(second_page.comptage_incomplet)
+        self.assertTrue(second_page.curseur_suivant)
+
+        third_page = message_bus_instance.invoke(
+            ListerTousParcoursDoctorauxQuery(page=3, curseur=second_page.curseur_suivant, **query_params)
+        )
+
+        self.assertEqual(len(third_page), 0)
+        self.assertIsNone(third_page.curseur_suivant)
+
+        # A cursor computed for another ordering is ignored
+        query_params['tri_inverse'] = True
+        first_page = message_bus_instance.invoke(
+            ListerTousParcoursDoctorauxQuery(page=1, curseur=first_page.curseur_suivant, **query_params)
+        )
+
+        self.assertEqual([result.uuid for result in first_page], [self.doctorate.uuid])
+
+        # An invalid cursor is ignored
+        first_page = message_bus_instance.invoke(
+            ListerTousParcoursDoctorauxQuery(page=1, curseur='invalid', **query_params)
+        )
+
+        self.assertEqual([result.uuid for result in first_page], [self.doctorate.uuid])
+
+    def test_keyset_pagination_with_nullable_ordering_field(self):
+        other_doctorate = ParcoursDoctoralFactory(
+            training=self.other_doctorate_training,
+            admission=None,
+        )
+
+        query_params = {
+            'champ_tri': 'pre_admission',
+            'taille_page': 1,
+            'demandeur': str(self.program_manager.uuid),
+        }
+
+        for tri_inverse, expected_uuids in [
+            (False, [self.doctorate.uuid, other_doctorate.uuid]),
+            (True, [other_doctorate.uuid, self.doctorate.uuid]),
+        ]:
+            first_page = message_bus_instance.invoke(
+                ListerTousParcoursDoctorauxQuery(page=1, tri_inverse=tri_inverse, **query_params)
+            )
+            second_page = message_bus_instance.invoke(
+                ListerTousParcoursDoctorauxQuery(
+                    page=2,
+                    curseur=first_page.curseur_suivant,
+                    tri_inverse=tri_inverse,
+                    **query_params,
+                )
+            )
+
+            self.assertEqual([result.uuid for result in [*first_page, *second_page]], expected_uuids)
+
+    def test_keyset_pagination_with_datetime_ordering_field(self):
+        other_doctorate = ParcoursDoctoralFactory(training=self.other_doctorate_training)
+
+        # The creation dates only differ by some microseconds
+        created_at = datetime.datetime(2024, 1, 1, 10, 0, 0, 100, tzinfo=datetime.timezone.utc)
+        ParcoursDoctoral.objects.filter(pk=self.doctorate.pk).update(created_at=created_at)
+        ParcoursDoctoral.objects.filter(pk=other_doctorate.pk).update(
+            created_at=created_at + datetime.timedelta(microseconds=200),
+        )
+
+        query_params = {
+            'champ_tri': 'date_admission',
+            'taille_page': 1,
+            'demandeur': str(self.program_manager.uuid),
+        }
+
+        for tri_inverse, expected_uuids in [
+            (False, [self.doctorate.uuid, other_doctorate.uuid]),
+            (True, [other_doctorate.uuid, self.doctorate.uuid]),
+        ]:
+            first_page = message_bus_instance.invoke(
+                ListerTousParcoursDoctorauxQuery(page=1, tri_inverse=tri_inverse, **query_params)
+            )
+            second_page = message_bus_instance.invoke(
+                ListerTousParcoursDoctorauxQuery(
+                    page=2,
+                    curseur=first_page.curseur_suivant,
+                    tri_inverse=tri_inverse,
+                    **query_params,
+                )
+            )
+
+            self.assertEqual([result.uuid for result in [*first_page, *second_page]], expected_uuids)
+
+    def test_list_count_is_bounded(self):
+        self.client.force_login(user=self.program_manager.user)
+
+        ParcoursDoctoralFactory(training=self.other_doctorate_training)
+
+        with mock.patch.object(ParcoursDoctoralList, 'count_limit', 1):
+            response = self._do_request(taille_page=1)
+
+        self.assertEqual(response.status_code, 200)
+
+        # The count is stopped at the row following the limit
+        self.assertTrue(response.context['partial_count'])
+        self.assertEqual(response.context['paginator'].count, 2)
+        self.assertEqual(len(response.context['object_list']), 1)
+        self.assertTrue(response.context['page_obj'].has_next())
+
+    def test_list_pages_beyond_the_count_limit_are_reachable(self):
+        self.client.force_login(user=self.program_manager.user)
+
+        ParcoursDoctoralFactory(training=self.other_doctorate_training)
+        ParcoursDoctoralFactory(training=self.other_doctorate_training)
+
+        with mock.patch.object(ParcoursDoctoralList, 'count_limit', 1):
+            first_page_response = self._do_request(taille_page=1, page=1)
+            second_page_response = self._do_request(taille_page=1, page=2)
+            last_page_response = self._do_request(taille_page=1, page=3)
+
+        self.assertEqual(second_page_response.status_code, 200)
+        self.assertTrue(second_page_response.context['partial_count'])
+        self.assertTrue(second_page_response.context['page_obj'].has_next())
+
+        # The whole listing is reached, page by page
+        self.assertEqual(last_page_response.status_code, 200)
+        self.assertFalse(last_page_response.context['partial_count'])
+        self.assertEqual(last_page_response.context['paginator'].count, 3)
+        self.assertFalse(last_page_response.context['page_obj'].has_next())
+
+        listed_uuids = [
+            doctorate.uuid
+            for response in [first_page_response, second_page_response, last_page_response]
+            for doctorate in response.context['object_list']
+        ]
+        self.assertEqual(len(set(listed_uuids)), 3)
+
+        # The navigation between the doctorates continues on the displayed pages beyond the limit
+        self.assertEqual(
+            ParcoursDoctoralList.get_navigation_neighbours(self.program_manager.user.id, listed_uuids[2]),
+            (listed_uuids[1], None),
+        )
+        self.assertEqual(
+            ParcoursDoctoralList.get_navigation_neighbours(self.program_manager.user.id, listed_uuids[1]),
+            (listed_uuids[0], listed_uuids[2]),
+        )
@@ -0,0 +1,150 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.shortcuts import resolve_url
+from django.test import TestCase
+
+from base.tests.factories.program_manager import ProgramManagerFactory
+from parcours_doctoral.ddd.autorisation_diffusion_these.domain.model.enums import (
+    ChoixStatutAutorisationDiffusionThese,
+)
+from parcours_doctoral.ddd.domain.model.enums import (
+    ChoixFileAttenteGestionnaire,
+    ChoixStatutParcoursDoctoral,
+)
+from parcours_doctoral.tests.factories.authorization_distribution import (
+    ThesisDistributionAuthorizationFactory,
+)
+from parcours_doctoral.tests.factories.parcours_doctoral import (
+    FormationFactory,
+    ParcoursDoctoralFactory,
+)
+from parcours_doctoral.tests.factories.roles import (
+    AdreManagerRoleFactory,
+    ScebManagerRoleFactory,
+)
+from parcours_doctoral.views.work_queues import WorkQueueView
+
+
+class WorkQueueViewTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.training = FormationFactory()
+        cls.other_training = FormationFactory()
+
+        cls.first_waiting_doctorate = ParcoursDoctoralFactory(training=cls.training)
+        cls.second_waiting_doctorate = ParcoursDoctoralFactory(training=cls.other_training)
+        cls.other_doctorate = ParcoursDoctoralFactory(training=cls.training)
+
+        for doctorate in [cls.first_waiting_doctorate, cls.second_waiting_doctorate]:
+            ThesisDistributionAuthorizationFactory(
+                parcours_doctoral=doctorate,
+                status=ChoixStatutAutorisationDiffusionThese.DIFFUSION_VALIDEE_ADRE.name,
+            )
+        ThesisDistributionAuthorizationFactory(
+            parcours_doctoral=cls.other_doctorate,
+            status=ChoixStatutAutorisationDiffusionThese.DIFFUSION_VALIDEE_SCEB.name,
+        )
+
+        cls.jury_doctorate = ParcoursDoctoralFactory(
+            training=cls.training,
+            status=ChoixStatutParcoursDoctoral.JURY_APPROUVE_CDD.name,
+        )
+        cls.other_jury_doctorate = ParcoursDoctoralFactory(
+            training=cls.other_training,
+            status=ChoixStatutParcoursDoctoral.JURY_APPROUVE_CDD.name,
+        )
+
+        cls.sceb_manager = ScebManagerRoleFactory().person.user
+        cls.adre_manager = AdreManagerRoleFactory().person.user
+        cls.program_manager = ProgramManagerFactory(education_group=cls.training.education_group).person.user
+
+        cls.sceb_url = resolve_url(
+            'parcours_doctoral:work-queue',
+            queue=ChoixFileAttenteGestionnaire.AUTORISATIONS_DIFFUSION_A_VALIDER_SCEB.name,
+        )
+        cls.jury_url = resolve_url(
+            'parcours_doctoral:work-queue',
+            queue=ChoixFileAttenteGestionnaire.JURYS_A_APPROUVER_ADRE.name,
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_unknown_queue(self):
+        self.client.force_login(user=self.sceb_manager)
+
+        response = self.client.get(resolve_url('parcours_doctoral:work-queue', queue='UNKNOWN'))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_queue_is_browsed_from_the_oldest_doctorate(self):
+        self.client.force_login(user=self.sceb_manager)
+
+        with patch.object(WorkQueueView, 'page_size', 1):
+            response = self.client.get(self.sceb_url)
+
+            self.assertEqual(response.status_code, 200)
+            doctorates = response.context['doctorates']
+            self.assertEqual([doctorate.uuid for doctorate in doctorates], [str(self.first_waiting_doctorate.uuid)])
+            self.assertIsNotNone(doctorates.curseur_suivant)
+
+            # Next page
+            response = self.client.get(
+                self.sceb_url,
+                {'curseur': doctorates.curseur_suivant},
+                HTTP_HX_REQUEST='true',
+            )
+
+            self.assertEqual(response.status_code, 200)
+            self.assertTemplateUsed(response, 'parcours_doctoral/work_queue_rows.html')
+            self.assertTemplateNotUsed(response, 'parcours_doctoral/work_queue.html')
+            doctorates = response.context['doctorates']
+            self.assertEqual([doctorate.uuid for doctorate in doctorates], [str(self.second_waiting_doctorate.uuid)])
+            self.assertIsNone(doctorates.curseur_suivant)
+
+    def test_queue_is_restricted_to_the_visible_doctorates(self):
+        self.client.force_login(user=self.adre_manager)
+
+        response = self.client.get(self.jury_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertCountEqual(
+            [doctorate.uuid for doctorate in response.context['doctorates']],
+            [str(self.jury_doctorate.uuid), str(self.other_jury_doctorate.uuid)],
+        )
+
+        self.client.force_login(user=self.program_manager)
+
+        response = self.client.get(self.jury_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [doctorate.uuid for doctorate in response.context['doctorates']],
+            [str(self.jury_doctorate.uuid)],
+        )
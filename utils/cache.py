@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,20 +24,181 @@
 #
 # ##############################################################################
 
+import hashlib
+import json
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Optional
+
 from django.core.cache import cache
-from django.shortcuts import get_object_or_404
+from django.db import transaction
+from django.db.models import Q
+from django.http import Http404
+from django.utils.translation import get_language
 
+from parcours_doctoral.auth.permission_object import ParcoursDoctoralPermissionObject
+from parcours_doctoral.infrastructure.utils import (
+    get_doctorate_visibility_scope,
+    get_person_role_assignments,
+)
 from parcours_doctoral.models.parcours_doctoral import ParcoursDoctoral
 
+DOCTORATE_DATA_VERSION_CACHE_KEY = 'parcours_doctoral_data_version'
+ADMISSION_DATA_VERSION_CACHE_KEY = 'parcours_doctoral_admission_data_version'
+PERMISSION_OBJECT_VERSION_CACHE_KEY = 'parcours_doctoral_permission_version_{}'
+PERMISSION_OBJECT_CACHE_KEY = 'parcours_doctoral_permission_{}_{}'
+PERMISSION_OBJECT_CACHE_TIMEOUT = 24 * 60 * 60  # 1 day
+PERMISSION_OBJECT_LOCK_TIMEOUT = 10  # seconds
+PERMISSION_OBJECT_LOCK_WAIT = 0.05  # seconds
+PERMISSION_OBJECT_LOCK_MAX_WAITS = 20
+
+# Previous doctorate data version whose cached list results are still valid for the searches being refreshed
+_reused_doctorate_data_version: ContextVar[Optional[str]] = ContextVar(
+    'parcours_doctoral_reused_data_version',
+    default=None,
+)
+
+
+def _get_data_version(cache_key) -> str:
+    return cache.get_or_set(cache_key, lambda: uuid.uuid4().hex, timeout=None)
+
+
+def _bump_data_version(*cache_keys):
+    def _set_new_version():
+        cache.set_many({cache_key: uuid.uuid4().hex for cache_key in cache_keys}, timeout=None)
+
+    _set_new_version()
+    transaction.on_commit(_set_new_version)
+
+
+def get_parcours_doctoral_permission_version(parcours_doctoral_uuid) -> str:
+    return _get_data_version(PERMISSION_OBJECT_VERSION_CACHE_KEY.format(parcours_doctoral_uuid))
+
 
-def get_cached_parcours_doctoral_perm_obj(parcours_doctoral_uuid):
-    qs = ParcoursDoctoral.objects.select_related(
-        'student',
-        'admission',
-        'training__academic_year',
-        'thesis_distribution_authorization',
+def bump_parcours_doctoral_permission_versions(parcours_doctoral_uuids: Iterable):
+    """
+    Change the version of the permission objects of the specified doctorates so that the cached ones are not used
+    anymore (see bump_doctorate_data_version).
+    """
+    cache_keys = [PERMISSION_OBJECT_VERSION_CACHE_KEY.format(a_uuid) for a_uuid in parcours_doctoral_uuids]
+    if cache_keys:
+        _bump_data_version(*cache_keys)
+
+
+def invalidate_parcours_doctoral_permission_objects(doctorate_filter: Q):
+    """Change the version of the permission objects of the doctorates matching the filter."""
+    bump_parcours_doctoral_permission_versions(
+        ParcoursDoctoral.objects.filter(doctorate_filter).values_list('uuid', flat=True)
+    )
+
+
+def get_cached_parcours_doctoral_perm_obj(parcours_doctoral_uuid) -> ParcoursDoctoralPermissionObject:
+    """
+    Return the permission object of a doctorate, cached until the version of the doctorate changes. When it must be
+    computed, only one request computes it at a time, the concurrent ones waiting for its result.
+    """
+    cache_key = PERMISSION_OBJECT_CACHE_KEY.format(
+        parcours_doctoral_uuid,
+        get_parcours_doctoral_permission_version(parcours_doctoral_uuid),
     )
-    return cache.get_or_set(
-        'parcours_doctoral_permission_{}'.format(parcours_doctoral_uuid),
-        lambda: get_object_or_404(qs, uuid=parcours_doctoral_uuid),
+    lock_key = f'{cache_key}_lock'
+
+    perm_obj = cache.get(cache_key)
+    if perm_obj is not None:
+        return perm_obj
+
+    has_lock = cache.add(lock_key, True, timeout=PERMISSION_OBJECT_LOCK_TIMEOUT)
+    waits = 0
+    while not has_lock and waits < PERMISSION_OBJECT_LOCK_MAX_WAITS:
+        time.sleep(PERMISSION_OBJECT_LOCK_WAIT)
+        waits += 1
+
+        perm_obj = cache.get(cache_key)
+        if perm_obj is not None:
+            return perm_obj
+
+        has_lock = cache.add(lock_key, True, timeout=PERMISSION_OBJECT_LOCK_TIMEOUT)
+
+    # If the lock is still not released, the object is computed anyway
+    try:
+        perm_objs = ParcoursDoctoralPermissionObject.load(Q(uuid=parcours_doctoral_uuid))
+        perm_obj = perm_objs.get(str(parcours_doctoral_uuid))
+        if perm_obj is None:
+            raise Http404
+        cache.set(cache_key, perm_obj, timeout=PERMISSION_OBJECT_CACHE_TIMEOUT)
+    finally:
+        if has_lock:
+            cache.delete(lock_key)
+
+    return perm_obj
+
+
+def get_doctorate_data_version() -> str:
+    """Return the current version of the doctorate data, used to tag the cached results computed from them."""
+    return _get_data_version(DOCTORATE_DATA_VERSION_CACHE_KEY)
+
+
+def bump_doctorate_data_version():
+    """
+    Change the version of the doctorate data so that the results cached for the previous version are not used anymore.
+    The version is changed again once the current transaction is committed, as results computed in the meantime by
+    other transactions may not include the new data. A random value is used so that an evicted version isn't reused.
+    """
+    _bump_data_version(DOCTORATE_DATA_VERSION_CACHE_KEY)
+
+
+def get_reused_doctorate_data_version() -> Optional[str]:
+    """Return the previous doctorate data version whose cached list results can be reused, if any."""
+    return _reused_doctorate_data_version.get()
+
+
+@contextmanager
+def reuse_doctorate_data_version(data_version: Optional[str]):
+    """
+    Reuse the list results cached for the specified previous doctorate data version until the end of the block, when
+    the caller knows that the searched doctorates have not changed since then.
+    """
+    token = _reused_doctorate_data_version.set(data_version)
+    try:
+        yield
+    finally:
+        _reused_doctorate_data_version.reset(token)
+
+
+def get_admission_data_version() -> str:
+    """Return the current version of the doctorate admission data, used in the same way as the doctorate one."""
+    return _get_data_version(ADMISSION_DATA_VERSION_CACHE_KEY)
+
+
+def bump_admission_data_version():
+    """Change the version of the doctorate admission data (see bump_doctorate_data_version)."""
+    _bump_data_version(ADMISSION_DATA_VERSION_CACHE_KEY)
+
+
+def get_dashboard_etag(request, *args, **kwargs) -> str:
+    """
+    Return the entity tag of a dashboard page, which changes with the doctorate data, the values of the admission
+    indicators, the filters, the roles of the user and the language. As the time-based indicators can change without
+    any data change, the tag also changes when the next warning date is reached. The roles are read from the cached
+    role assignments of the user.
+    """
+    from parcours_doctoral.infrastructure.parcours_doctoral.read_view.repository.tableau_bord import (
+        TableauBordRepository,
+    )
+
+    person = getattr(request.user, 'person', None)
+    key_data = json.dumps(
+        [
+            get_doctorate_data_version(),
+            TableauBordRepository.get_cache_validation_data(),
+            sorted((key, sorted(values)) for key, values in request.GET.lists()),
+            request.user.pk,
+            sorted(get_person_role_assignments(person.uuid)) if person else None,
+            get_doctorate_visibility_scope(person.uuid) if person else None,
+            bool(request.headers.get('HX-Request')),
+            get_language(),
+        ]
     )
+    return '"{}"'.format(hashlib.md5(key_data.encode()).hexdigest())
@@ -30,7 +30,7 @@ from typing import Any, Literal, Optional
 
 from dateutil.relativedelta import relativedelta
 from django.conf import settings
-from django.db.models import F
+from django.db.models import F, Q
 from django.db.models.fields.tuple_lookups import Tuple
 from django.utils.translation import gettext_lazy
 from osis_signature.enums import SignatureState
@@ -62,6 +62,7 @@ from parcours_doctoral.models import (
     ActorType,
     ConfirmationPaper,
     ParcoursDoctoral,
+    ParcoursDoctoralSearchRow,
     ParcoursDoctoralSupervisionActor,
 )
 from parcours_doctoral.models.private_defense import PrivateDefense
@@ -458,6 +459,7 @@ class DoctorateImportFromXLSXView(ImportFromXLSXView):
         PrivateDefense.objects.bulk_create(objs=private_defenses)
         Activity.objects.bulk_create(objs=activities)
         StudentRole.objects.bulk_create(objs=students, ignore_conflicts=True)
+        ParcoursDoctoralSearchRow.objects.refresh(Q(pk__in=[doctorate.pk for doctorate in doctorates]))
 
         promoter_roles: list[Promoter] = []
         committee_member_roles: list[CommitteeMember] = []
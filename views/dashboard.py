@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -24,6 +24,8 @@
 #
 # ##############################################################################
 
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from django.views.generic import FormView
 
 from base.utils.htmx import HtmxPermissionRequiredMixin
@@ -33,12 +35,14 @@ from parcours_doctoral.ddd.read_view.queries import (
     RecupererInformationsTableauBordQuery,
 )
 from parcours_doctoral.forms.dashboard import DashboardForm
+from parcours_doctoral.utils.cache import get_dashboard_etag
 
 __all__ = [
     'DashboardView',
 ]
 
 
+@method_decorator(condition(etag_func=get_dashboard_etag), name='get')
 class DashboardView(HtmxPermissionRequiredMixin, HtmxMixin, FormView):
     permission_required = 'parcours_doctoral.view_parcours_doctoral'
     template_name = 'parcours_doctoral/dashboard.html'
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -77,7 +77,7 @@ class ManuscriptValidationView(
         return (self.permission_required_by_http_method[self.request.method],)
 
     def get_form(self, form_class=None):
-        if self.request.user.has_perm(perm='parcours_doctoral.validate_manuscript', obj=self.parcours_doctoral):
+        if self.request.user.has_perm(perm='parcours_doctoral.validate_manuscript', obj=self.get_permission_object()):
             return super().get_form(form_class=form_class)
         return None
 
@@ -6,7 +6,7 @@
 #    The core business involves the administration of students, teachers,
 #    courses, programs and so on.
 #
-#    Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#    Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #    This program is free software: you can redistribute it and/or modify
 #    it under the terms of the GNU General Public License as published by
@@ -134,7 +134,7 @@ class TrainingActivityFormMixin(ParcoursDoctoralFormMixin, ParcoursDoctoralViewM
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
-        kwargs['parcours_doctoral'] = self.get_permission_object()
+        kwargs['parcours_doctoral'] = self.parcours_doctoral
         return kwargs
 
     def get_success_url(self):
@@ -6,7 +6,7 @@
 #  The core business involves the administration of students, teachers,
 #  courses, programs and so on.
 #
-#  Copyright (C) 2015-2025 Université catholique de Louvain (http://www.uclouvain.be)
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
 #
 #  This program is free software: you can redistribute it and/or modify
 #  it under the terms of the GNU General Public License as published by
@@ -25,6 +25,7 @@
 # ##############################################################################
 
 import ast
+from io import BytesIO
 from typing import Dict
 
 from django.conf import settings
@@ -33,11 +34,13 @@ from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.http import HttpResponse, HttpResponseRedirect
 from django.template.defaultfilters import yesno
 from django.urls import reverse
+from django.utils import translation
 from django.utils.html import format_html
 from django.utils.text import slugify
 from django.utils.translation import gettext as _
 from django.utils.translation import gettext_lazy, pgettext
 from django.views import View
+from openpyxl import Workbook
 from osis_async.models import AsyncTask
 from osis_export.contrib.export_mixins import ExcelFileExportMixin, ExportMixin
 from osis_export.models import Export
@@ -68,6 +71,23 @@ FULL_DATE_FORMAT = '%Y/%m/%d, %H:%M:%S'
 SHORT_DATE_FORMAT = '%Y/%m/%d'
 
 
+class WriteOnlyWorkbook(Workbook):
+    """Write-only workbook whose active worksheet is created when it is first requested."""
+
+    def __init__(self):
+        super().__init__(write_only=True)
+
+    @property
+    def active(self):
+        if not self._sheets:
+            self.create_sheet()
+        return super().active
+
+    @active.setter
+    def active(self, value):
+        Workbook.active.fset(self, value)
+
+
 class ParcoursDoctoralListExcelExportView(
     PermissionRequiredMixin,
     ExportMixin,
@@ -94,12 +114,36 @@ class ParcoursDoctoralListExcelExportView(
         # Get the person language
         if person.language:
             self.language = person.language
-        return super().generate_file(person, filters, **kwargs)
+
+        # The file is built here so that the rows are written in the write-only workbook as soon as they are retrieved
+        with translation.override(self.language):
+            workbook = self.get_workbook()
+
+            worksheet = workbook.active
+            worksheet.title = str(self.description)[:31]
+            worksheet.append(self.get_header())
+            for row in self.get_export_objects(filters=filters, **kwargs):
+                worksheet.append(self.get_row_data(row))
+
+            if self.with_parameters_worksheet:
+                parameters_worksheet = workbook.create_sheet(title=_('Parameters'))
+                for name, value in self.get_formatted_filters_parameters_worksheet(filters).items():
+                    parameters_worksheet.append(
+                        [name, ', '.join(str(v) for v in value) if isinstance(value, list) else str(value)]
+                    )
+
+            file = BytesIO()
+            workbook.save(file)
+            return file.getvalue()
+
+    def get_workbook(self):
+        # The memory used by a write-only workbook doesn't depend on the number of rows
+        return WriteOnlyWorkbook()
 
     def get_export_objects(self, **kwargs):
         # The filters are saved as dict string so we convert it here to a dict
         filters = ast.literal_eval(kwargs.get('filters'))
-        return message_bus_instance.invoke(ListerTousParcoursDoctorauxQuery(**filters))
+        return message_bus_instance.invoke(ListerTousParcoursDoctorauxQuery(**filters, en_flux=True))
 
     def get(self, request):
         # Get filters
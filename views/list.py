@@ -24,10 +24,13 @@
 #
 # ##############################################################################
 import datetime
+import hashlib
+from typing import Optional, Tuple
+from uuid import UUID
 
 from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.core.cache import cache
-from django.core.exceptions import NON_FIELD_ERRORS
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
 from django.utils.functional import cached_property
 from django.utils.translation import gettext as _
 from django.views.generic import ListView
@@ -44,6 +47,7 @@ from parcours_doctoral.forms.list import (
     IntervalDateFormSet,
     ParcoursDoctorauxFilterForm,
 )
+from parcours_doctoral.models.saved_search import SavedSearch
 
 __all__ = [
     "ParcoursDoctoralList",
@@ -62,6 +66,10 @@ class ParcoursDoctoralList(PermissionRequiredMixin, HtmxMixin, FormMixin, ListVi
     raise_exception = True
     parameters_cache_timeout = None
     result_cache_timeout = 60 * 60 * 24  # 1 day
+    # Number of doctorates from which the count of a listing is stopped (the following pages remain reachable)
+    count_limit = 1000
+    # Parameters which are not saved with the searches (their page size and ordering are kept)
+    unsaved_params = ['page', 'recherche_sauvegardee']
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -71,12 +79,117 @@ class ParcoursDoctoralList(PermissionRequiredMixin, HtmxMixin, FormMixin, ListVi
 
     @property
     def cache_key(self):
-        return f"cache_parcours_doctoral_filter_{self.request.user.id}_{self.request.path}"
+        return self.cache_key_for_parameters(user_id=self.request.user.id, path=self.request.path)
+
+    @classmethod
+    def cache_key_for_parameters(cls, user_id, path):
+        return f"cache_parcours_doctoral_filter_{user_id}_{path}"
 
     @classmethod
     def cache_key_for_result(cls, user_id):
         return f"cache_parcours_doctoral_filter_result_{user_id}"
 
+    @classmethod
+    def cache_key_for_navigation_slot(cls, index_id, position):
+        return f"cache_parcours_doctoral_navigation_{index_id}_{position}"
+
+    @classmethod
+    def cache_key_for_navigation_position(cls, index_id, doctorate_uuid):
+        return f"cache_parcours_doctoral_navigation_{index_id}_position_{doctorate_uuid.hex}"
+
+    @classmethod
+    def save_navigation_index(cls, user_id, listing_id, sorted_uuids, start=0):
+        """
+        Save the order of the listed doctorates so that the previous and next ones can be retrieved from the detail
+        pages. The index contains the uuid at each position and the position of each uuid. The index of a listing is
+        identified by its content, so that it is saved once for the users getting the same results, and the uuids of
+        the pages displayed beyond its end are added to it.
+        :param user_id: the id of the user displaying the listing
+        :param listing_id: the identifier of the listing parameters (other than the page)
+        :param sorted_uuids: the sorted uuids of the listed doctorates
+        :param start: the position of the first uuid in the listing
+        """
+        sorted_uuids = [UUID(str(doctorate_uuid)) for doctorate_uuid in sorted_uuids]
+
+        if start:
+            # Add the uuids to the last index of the listing
+            last_listing_id, index_id = cache.get(cls.cache_key_for_result(user_id=user_id)) or (None, None)
+            if last_listing_id != listing_id:
+                return
+        else:
+            index_id = hashlib.md5(
+                listing_id.encode() + b''.join(doctorate_uuid.bytes for doctorate_uuid in sorted_uuids)
+            ).hexdigest()
+            cache.set(
+                cls.cache_key_for_result(user_id=user_id),
+                (listing_id, index_id),
+                timeout=cls.result_cache_timeout,
+            )
+            if cache.get(cls.cache_key_for_navigation_slot(index_id, 0)) is not None:
+                return
+
+        data = {}
+        for position, doctorate_uuid in enumerate(sorted_uuids, start=start):
+            data[cls.cache_key_for_navigation_slot(index_id, position)] = doctorate_uuid.bytes
+            data[cls.cache_key_for_navigation_position(index_id, doctorate_uuid)] = position
+        cache.set_many(data, timeout=cls.result_cache_timeout)
+
+    @classmethod
+    def get_navigation_neighbours(cls, user_id, doctorate_uuid) -> Tuple[Optional[UUID], Optional[UUID]]:
+        """Return the uuids of the previous and next doctorates of the last listing of the user."""
+        _, index_id = cache.get(cls.cache_key_for_result(user_id=user_id)) or (None, None)
+        if not index_id:
+            return None, None
+
+        position = cache.get(cls.cache_key_for_navigation_position(index_id, doctorate_uuid))
+        if position is None:
+            return None, None
+
+        neighbour_keys = [
+            cls.cache_key_for_navigation_slot(index_id, neighbour_position) if neighbour_position >= 0 else None
+            for neighbour_position in [position - 1, position + 1]
+        ]
+        neighbours = cache.get_many([key for key in neighbour_keys if key])
+
+        return tuple(UUID(bytes=neighbours[key]) if key in neighbours else None for key in neighbour_keys)
+
+    @cached_property
+    def listing_id(self):
+        """Return the identifier of the parameters of the current listing, other than the page."""
+        params = self.query_params.copy()
+        params.pop('page', None)
+        return hashlib.md5(params.urlencode().encode()).hexdigest()
+
+    def cache_key_for_cursor(self, page):
+        """Return the cache key of the cursor from which the specified page of the current listing can be sought."""
+        return f"cache_parcours_doctoral_filter_cursor_{self.request.user.id}_{self.listing_id}_{page}"
+
+    @staticmethod
+    def get_filters_from_forms(form, date_formset, ordering_field=None):
+        """
+        Return the filters of the doctorate list query from the valid filter form and date formset, and the ordering
+        field (prefixed by '-' for a descending order).
+        """
+        filters = {**form.cleaned_data}
+        filters.pop('instituts_secteurs', None)
+
+        if ordering_field:
+            filters['tri_inverse'] = ordering_field[0] == '-'
+            filters['champ_tri'] = ordering_field.lstrip('-')
+
+        filters['dates'] = []
+        for date_form in date_formset:
+            cleaned_data = date_form.cleaned_data
+            filters['dates'].append(
+                (
+                    cleaned_data['type_date'],
+                    cleaned_data['date_debut'],
+                    cleaned_data['date_fin'],
+                ),
+            )
+
+        return filters
+
     @staticmethod
     def htmx_render_form_errors(request, form, prefix=''):
         """Display the form errors through the django messages."""
@@ -99,6 +212,12 @@ class ParcoursDoctoralList(PermissionRequiredMixin, HtmxMixin, FormMixin, ListVi
         kwargs['htmx_template_name'] = self.htmx_template_name
         kwargs['default_form_values'] = {field.id_for_label: field.initial for field in self.form if field.initial}
         kwargs['now'] = datetime.datetime.now()
+        kwargs['saved_searches'] = SavedSearch.objects.filter(person=self.request.user.person)
+        kwargs['current_saved_search'] = self.saved_search
+        kwargs['partial_count'] = getattr(self.object_list, 'comptage_incomplet', False)
+        kwargs['facet_counts'] = getattr(self.object_list, 'comptages_facettes', None)
+        if kwargs['facet_counts']:
+            self.form.add_facet_counts(kwargs['facet_counts'])
         return super().get_context_data(**kwargs)
 
     def get_paginate_by(self, queryset):
@@ -106,6 +225,16 @@ class ParcoursDoctoralList(PermissionRequiredMixin, HtmxMixin, FormMixin, ListVi
             return self.form.cleaned_data.get('taille_page')
         return DEFAULT_PAGINATOR_SIZE
 
+    @cached_property
+    def saved_search(self) -> Optional[SavedSearch]:
+        saved_search_uuid = self.query_params.get('recherche_sauvegardee') if self.query_params else None
+        if not saved_search_uuid:
+            return None
+        try:
+            return SavedSearch.objects.filter(person=self.request.user.person, uuid=saved_search_uuid).first()
+        except ValidationError:
+            return None
+
     @cached_property
     def query_params(self):
         return self.request.GET or cache.get(self.cache_key)
@@ -151,46 +280,64 @@ class ParcoursDoctoralList(PermissionRequiredMixin, HtmxMixin, FormMixin, ListVi
         if self.request.GET:
             cache.set(self.cache_key, self.request.GET, timeout=self.parameters_cache_timeout)
 
-        self.filters = self.form.cleaned_data
-        self.filters.pop('instituts_secteurs', None)
-
-        self.filters['dates'] = []
-        for date_form in self.date_formset:
-            cleaned_data = date_form.cleaned_data
-            self.filters['dates'].append(
-                (
-                    cleaned_data['type_date'],
-                    cleaned_data['date_debut'],
-                    cleaned_data['date_fin'],
-                ),
-            )
+        self.filters = self.get_filters_from_forms(
+            self.form,
+            self.date_formset,
+            ordering_field=self.query_params.get('o') if self.query_params else None,
+        )
 
         if self.query_params:
             # Add page number to kwargs to pass it to the paginator
             self.kwargs['page'] = self.query_params.get('page')
 
-            # Order the queryset if specified
-            ordering_field = self.query_params.get('o')
-
-            if ordering_field:
-                self.filters['tri_inverse'] = ordering_field[0] == '-'
-                self.filters['champ_tri'] = ordering_field.lstrip('-')
+            # Seek the page from the last row of the previous one if it has been displayed before
+            page = self.filters.get('page')
+            if page and page > 1:
+                self.filters['curseur'] = cache.get(self.cache_key_for_cursor(page))
 
         response = super().get(request, *args, **kwargs)
 
         if self.query_params:
-            cache.set(
-                self.cache_key_for_result(user_id=self.request.user.id),
-                self.object_list.sorted_elements,
-                timeout=self.result_cache_timeout,
-            )
+            # The sought pages don't contain the beginning of the sorted listing, so they extend the previous index
+            if self.filters.get('curseur'):
+                self.save_navigation_index(
+                    user_id=self.request.user.id,
+                    listing_id=self.listing_id,
+                    sorted_uuids=[doctorate.uuid for doctorate in self.object_list],
+                    start=(self.filters['page'] - 1) * self.filters['taille_page'],
+                )
+            else:
+                self.save_navigation_index(
+                    user_id=self.request.user.id,
+                    listing_id=self.listing_id,
+                    sorted_uuids=getattr(
+                        self.object_list,
+                        'uuids_tries',
+                        [doctorate.uuid for doctorate in self.object_list],
+                    ),
+                )
+
+            next_cursor = getattr(self.object_list, 'curseur_suivant', None)
+            if next_cursor:
+                cache.set(
+                    self.cache_key_for_cursor(self.filters['page'] + 1),
+                    next_cursor,
+                    timeout=self.result_cache_timeout,
+                )
 
         return response
 
+    @classmethod
+    def get_list_query(cls, filters, demandeur):
+        """Return the query of the listed doctorates (also used to compute the results of the saved searches)."""
+        return cls.filtering_query_class(
+            **filters,
+            demandeur=demandeur,
+            avec_comptages_facettes=True,
+            limite_comptage=cls.count_limit,
+        )
+
     def get_queryset(self):
         return message_bus_instance.invoke(
-            self.filtering_query_class(
-                **self.filters,
-                demandeur=self.request.user.person.uuid,
-            )
+            self.get_list_query(filters=self.filters, demandeur=self.request.user.person.uuid)
         )
@@ -27,9 +27,8 @@ import json
 import uuid
 
 from django.contrib import messages
-from django.core.cache import cache
 from django.http import Http404
-from django.shortcuts import resolve_url
+from django.shortcuts import get_object_or_404, resolve_url
 from django.template.loader import render_to_string
 from django.utils.functional import cached_property
 from django.utils.safestring import mark_safe
@@ -41,6 +40,7 @@ from base.utils.utils import add_messages_into_htmx_response, add_close_modal_in
 from infrastructure.messages_bus import message_bus_instance
 from osis_common.ddd.interface import BusinessException
 from osis_role.contrib.views import PermissionRequiredMixin
+from parcours_doctoral.auth.permission_object import ParcoursDoctoralPermissionObject
 from parcours_doctoral.constants import COMMENT_TAB_GLOBAL
 from parcours_doctoral.ddd.commands import (
     GetCotutelleQuery,
@@ -58,6 +58,9 @@ from parcours_doctoral.ddd.epreuve_confirmation.validators.exceptions import (
     EpreuveConfirmationNonTrouveeException,
 )
 from parcours_doctoral.ddd.jury.commands import RecupererJuryQuery
+from parcours_doctoral.infrastructure.query_memoization import (
+    start_read_query_memoization,
+)
 from parcours_doctoral.models.parcours_doctoral import ParcoursDoctoral
 from parcours_doctoral.utils.cache import get_cached_parcours_doctoral_perm_obj
 from parcours_doctoral.views.list import ParcoursDoctoralList
@@ -68,13 +71,27 @@ class ParcoursDoctoralBaseViewMixin(PermissionRequiredMixin):
     def parcours_doctoral_uuid(self) -> str:
         return str(self.kwargs.get('uuid', ''))
 
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in {'GET', 'HEAD'}:
+            # The read queries invoked several times to display the page are only executed once
+            start_read_query_memoization()
+        return super().dispatch(request, *args, **kwargs)
+
     def get_permission_object(self):
-        return self.parcours_doctoral
+        return self.permission_object
 
-    @property
-    def parcours_doctoral(self) -> ParcoursDoctoral:
+    @cached_property
+    def permission_object(self) -> ParcoursDoctoralPermissionObject:
         return get_cached_parcours_doctoral_perm_obj(self.parcours_doctoral_uuid)
 
+    @cached_property
+    def parcours_doctoral(self) -> ParcoursDoctoral:
+        """Doctorate loaded for the views reading its other attributes than the ones of the permission object."""
+        return get_object_or_404(
+            ParcoursDoctoral.objects.select_related('student', 'training'),
+            uuid=self.parcours_doctoral_uuid,
+        )
+
     @cached_property
     def last_confirmation_paper(self) -> EpreuveConfirmationDTO:
         try:
@@ -128,23 +145,19 @@ class ParcoursDoctoralViewMixin(ParcoursDoctoralBaseViewMixin, ContextMixin):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['original_parcours_doctoral'] = self.parcours_doctoral
+        context['original_parcours_doctoral'] = self.permission_object
         context['next_url'] = self.next_url
         context['tab_badges'] = self.get_tab_badges()
 
         # Get the next and previous doctorates from the last computed listing
-        cached_parcours_doctorals_list = cache.get(
-            ParcoursDoctoralList.cache_key_for_result(user_id=self.request.user.id)
-        )
-
-        parcours_doctoral_uuid = uuid.UUID(self.parcours_doctoral_uuid) if self.parcours_doctoral_uuid else None
-        if cached_parcours_doctorals_list and parcours_doctoral_uuid in cached_parcours_doctorals_list:
-            current_parcours_doctoral = cached_parcours_doctorals_list[parcours_doctoral_uuid]
-            for key in ['previous', 'next']:
-                if current_parcours_doctoral[key]:
-                    context[f'{key}_parcours_doctoral_url'] = resolve_url(
-                        'parcours_doctoral:base', uuid=current_parcours_doctoral[key]
-                    )
+        if self.parcours_doctoral_uuid:
+            neighbours = ParcoursDoctoralList.get_navigation_neighbours(
+                user_id=self.request.user.id,
+                doctorate_uuid=uuid.UUID(str(self.parcours_doctoral_uuid)),
+            )
+            for key, neighbour_uuid in zip(['previous', 'next'], neighbours):
+                if neighbour_uuid:
+                    context[f'{key}_parcours_doctoral_url'] = resolve_url('parcours_doctoral:base', uuid=neighbour_uuid)
 
         if self.load_doctorate_dto:
             context['parcours_doctoral'] = self.parcours_doctoral_dto
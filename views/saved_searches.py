@@ -0,0 +1,96 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from django.contrib import messages
+from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.core.cache import cache
+from django.http import QueryDict
+from django.shortcuts import get_object_or_404, redirect, resolve_url
+from django.utils.translation import get_language
+from django.utils.translation import gettext as _
+from django.views import View
+
+from parcours_doctoral.forms.list import (
+    IntervalDateFormSet,
+    ParcoursDoctorauxFilterForm,
+)
+from parcours_doctoral.models.saved_search import SavedSearch
+from parcours_doctoral.views.list import ParcoursDoctoralList
+
+__all__ = [
+    "SavedSearchView",
+]
+
+
+class SavedSearchView(PermissionRequiredMixin, View):
+    """Save the current filters of the doctorate list under a name, or delete a saved search."""
+
+    permission_required = 'parcours_doctoral.view_parcours_doctoral'
+    raise_exception = True
+    http_method_names = ['post']
+
+    def post(self, request, *args, **kwargs):
+        person = self.request.user.person
+
+        if self.request.POST.get('delete'):
+            get_object_or_404(SavedSearch, uuid=self.request.POST['delete'], person=person).delete()
+            messages.info(self.request, _("The search has been deleted."))
+            return redirect('parcours_doctoral:list')
+
+        name = self.request.POST.get('name', '').strip()
+        # The filters are the ones of the last search of the user
+        last_query_params = cache.get(
+            ParcoursDoctoralList.cache_key_for_parameters(
+                user_id=self.request.user.id,
+                path=resolve_url('parcours_doctoral:list'),
+            )
+        )
+        query_params = last_query_params.copy() if last_query_params else QueryDict(mutable=True)
+        for param in ParcoursDoctoralList.unsaved_params:
+            query_params.pop(param, None)
+
+        form = ParcoursDoctorauxFilterForm(data=query_params, user=self.request.user)
+        date_formset = IntervalDateFormSet(data=query_params, prefix='date_form')
+
+        if not name or not form.is_valid() or not date_formset.is_valid():
+            messages.error(self.request, _("The search could not be saved."))
+            return redirect('parcours_doctoral:list')
+
+        filters = ParcoursDoctoralList.get_filters_from_forms(form, date_formset, ordering_field=query_params.get('o'))
+        filters.pop('page', None)
+
+        saved_search, _created = SavedSearch.objects.update_or_create(
+            person=person,
+            name=name,
+            defaults={
+                'query_params': query_params.urlencode(),
+                'filters': filters,
+                'language': get_language(),
+            },
+        )
+        saved_search.refresh()
+
+        messages.info(self.request, _("The search has been saved."))
+        return redirect(saved_search.get_absolute_url())
@@ -0,0 +1,69 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+
+from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.http import Http404
+from django.views.generic import TemplateView
+
+from infrastructure.messages_bus import message_bus_instance
+from osis_common.utils.htmx import HtmxMixin
+from parcours_doctoral.ddd.domain.model.enums import ChoixFileAttenteGestionnaire
+from parcours_doctoral.ddd.read_view.queries import (
+    ListerFileAttenteParcoursDoctorauxQuery,
+)
+
+__all__ = [
+    'WorkQueueView',
+]
+
+
+class WorkQueueView(PermissionRequiredMixin, HtmxMixin, TemplateView):
+    urlpatterns = {'work-queue': 'work-queue/<str:queue>'}
+    permission_required = 'parcours_doctoral.view_parcours_doctoral'
+    template_name = 'parcours_doctoral/work_queue.html'
+    htmx_template_name = 'parcours_doctoral/work_queue_rows.html'
+    page_size = 50
+
+    def get_context_data(self, **kwargs):
+        context_data = super().get_context_data(**kwargs)
+
+        if self.kwargs['queue'] not in [choice.name for choice in ChoixFileAttenteGestionnaire]:
+            raise Http404
+
+        context_data['queues'] = ChoixFileAttenteGestionnaire.choices()
+        context_data['current_queue'] = ChoixFileAttenteGestionnaire[self.kwargs['queue']]
+
+        # The next pages are loaded on demand from the cursor of the last displayed page
+        context_data['doctorates'] = message_bus_instance.invoke(
+            ListerFileAttenteParcoursDoctorauxQuery(
+                file_attente=self.kwargs['queue'],
+                taille_page=self.page_size,
+                curseur=self.request.GET.get('curseur'),
+                demandeur=self.request.user.person.uuid,
+            )
+        )
+
+        return context_data